@@ -0,0 +1,122 @@
+import asyncio
+import logging
+
+import serial
+
+LOGGER = logging.getLogger(__name__)
+
+
+class AsyncSerialConnection:
+    """A serial connection whose reads wait on the event loop instead of blocking it
+
+    The port is opened in non-blocking mode and its file descriptor is watched with
+    ``loop.add_reader``. Ports without a usable file descriptor, or event loops which
+    don't support readers, fall back to checking ``in_waiting`` every
+    ``poll_interval_s``.
+    """
+
+    DEFAULT_POLL_INTERVAL_S = 0.001
+
+    def __init__(
+        self,
+        port: str,
+        baud_rate: int,
+        read_timeout_s: float = 10.0,
+        poll_interval_s: float = DEFAULT_POLL_INTERVAL_S,
+    ):
+        LOGGER.debug(f"Connecting to {port} at {baud_rate} baud")
+        self._attach(
+            serial.Serial(
+                port=port,
+                baudrate=baud_rate,
+                bytesize=serial.EIGHTBITS,
+                stopbits=serial.STOPBITS_ONE,
+                timeout=0,
+            ),
+            read_timeout_s,
+            poll_interval_s,
+        )
+
+    def _attach(self, serial_port, read_timeout_s: float, poll_interval_s: float):
+        self.connection = serial_port
+        self.read_timeout_s = read_timeout_s
+        self.poll_interval_s = poll_interval_s
+
+        self._received = bytearray()
+
+    def reset_buffers(self):
+        self.connection.reset_input_buffer()
+        self.connection.reset_output_buffer()
+        self._received.clear()
+
+    def send(self, data: bytes):
+        self.reset_buffers()
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug(f"Sending data: {data}")
+        self.connection.write(data)
+
+    async def send_command(self, command: str):
+        encoded_command = f"{command}\r".encode("ascii")
+        self.send(encoded_command)
+
+    async def read_response(self) -> str:
+        loop = asyncio.get_event_loop()
+        deadline = loop.time() + self.read_timeout_s
+
+        while b"\n" not in self._received:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+
+            try:
+                await asyncio.wait_for(self._wait_readable(loop), remaining)
+            except asyncio.TimeoutError:
+                break
+
+            self._read_available()
+
+        end = self._received.find(b"\n") + 1 or len(self._received)
+        response_bytes = bytes(self._received[:end])
+        del self._received[:end]
+
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug(f"Received: {response_bytes}")
+
+        return response_bytes.decode("ascii").strip()
+
+    def _read_available(self):
+        waiting = self.connection.in_waiting
+        if waiting:
+            self._received += self.connection.read(waiting)
+
+    async def _wait_readable(self, loop: asyncio.AbstractEventLoop):
+        try:
+            file_descriptor = self.connection.fileno()
+        except (AttributeError, OSError, ValueError):
+            file_descriptor = None
+
+        if file_descriptor is not None:
+            readable = loop.create_future()
+
+            def on_readable():
+                if not readable.done():
+                    readable.set_result(None)
+
+            try:
+                loop.add_reader(file_descriptor, on_readable)
+            except NotImplementedError:
+                pass
+            else:
+                try:
+                    await readable
+                finally:
+                    loop.remove_reader(file_descriptor)
+                return
+
+        while not self.connection.in_waiting:
+            await asyncio.sleep(self.poll_interval_s)
+
+    def disconnect(self):
+        LOGGER.debug("Disconnecting from serial port...")
+        self.connection.close()
+        LOGGER.debug("Disconnected")
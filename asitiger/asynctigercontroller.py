@@ -0,0 +1,173 @@
+import asyncio
+from typing import Dict, List, Union
+
+from asitiger.asyncserialconnection import AsyncSerialConnection
+from asitiger.axis import Axis
+from asitiger.command import Command
+from asitiger.errors import Errors
+from asitiger.secure import SecurePosition
+from asitiger.status import AxisStatus, Status, statuses_for_rdstat
+from asitiger.tigercontroller import TigerController
+
+
+class AsyncTigerController:
+    """An asyncio counterpart to ``TigerController`` whose commands are coroutines
+
+    Commands from concurrent tasks are serialized so that each reply is read by the
+    task which sent the command.
+    """
+
+    DEFAULT_POLL_INTERVAL_S = TigerController.DEFAULT_POLL_INTERVAL_S
+
+    def __init__(
+        self,
+        serial_connection: AsyncSerialConnection,
+        poll_interval_s: float = DEFAULT_POLL_INTERVAL_S,
+    ):
+        self.connection = serial_connection
+        self.poll_interval_s = poll_interval_s
+
+        # Created on first use so it binds to the loop the controller runs in
+        self._lock = None
+
+    @classmethod
+    def from_serial_port(
+        cls, port: str, baud_rate: int = 115200, *tiger_args, **tiger_kwargs
+    ) -> "AsyncTigerController":
+        return cls(AsyncSerialConnection(port, baud_rate), *tiger_args, **tiger_kwargs)
+
+    async def send_command(self, command: str) -> str:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            await self.connection.send_command(command)
+            response = await self.connection.read_response()
+
+        Errors.raise_error_if_present(command, response)
+
+        return response
+
+    # The methods below are higher-level convenience methods that
+    # don't necessarily map directly onto supported serial commands
+
+    async def axes(self, card_address: int = None) -> List[Axis.AxisInfo]:
+        return Axis.get_axes_from_build(await self.build(card_address=card_address))
+
+    async def is_busy(self, axes: List[str] = None) -> bool:
+        if axes is None:
+            return await self.status() is Status.BUSY
+
+        statuses = await self.rdstat([f"{axis}?" for axis in axes])
+        return any(status is Status.BUSY for status in statuses)
+
+    async def wait_until_idle(
+        self,
+        poll_interval_s: float = None,
+        axes: List[str] = None,
+        expected_duration_s: float = None,
+        max_poll_interval_s: float = None,
+    ):
+        poll_interval_s = poll_interval_s if poll_interval_s else self.poll_interval_s
+        max_poll_interval_s = max(max_poll_interval_s or 0.0, poll_interval_s)
+
+        if expected_duration_s:
+            await asyncio.sleep(
+                expected_duration_s * TigerController.WAIT_PREDICTED_FRACTION
+            )
+
+        while await self.is_busy(axes):
+            await asyncio.sleep(poll_interval_s)
+            poll_interval_s = min(
+                poll_interval_s * TigerController.WAIT_BACKOFF_FACTOR,
+                max_poll_interval_s,
+            )
+
+    async def enable_axes(self, axes: List[str]):
+        await self.motor_control({axis: "+" for axis in axes})
+
+    async def disable_axes(self, axes: List[str]):
+        await self.motor_control({axis: "-" for axis in axes})
+
+    async def set_plate_lock(
+        self, position: Union[SecurePosition, float], card_address: int = None
+    ):
+        return await self.secure(
+            {"X": SecurePosition.resolve_value(position)}, card_address=card_address
+        )
+
+    # The methods below map directly onto the Tiger serial API methods
+
+    async def build(self, card_address: int = None) -> List[str]:
+        response = await self.send_command(
+            Command.format(f"{Command.BUILD} X", card_address=card_address)
+        )
+        return response.split("\r")
+
+    async def halt(self):
+        await self.send_command(Command.HALT)
+
+    async def here(self, coordinates: Dict[str, float]) -> str:
+        return await self.send_command(
+            Command.format(Command.HERE, coordinates=coordinates)
+        )
+
+    async def home(self, axes: List[str]) -> str:
+        return await self.send_command(f"{Command.HOME} {' '.join(axes)}")
+
+    async def led(self, led_brightnesses: Dict[str, int], card_address: int = None):
+        await self.send_command(
+            Command.format(
+                Command.LED, coordinates=led_brightnesses, card_address=card_address
+            )
+        )
+
+    async def motor_control(self, axes_states: Dict[str, str]):
+        await self.send_command(
+            Command.format(Command.MOTCTRL, axes_states, flag_overrides=["+", "-"])
+        )
+
+    async def move(self, coordinates: Dict[str, float]):
+        return await self.send_command(
+            Command.format(Command.MOVE, coordinates=coordinates)
+        )
+
+    async def move_relative(self, offsets: Dict[str, float]):
+        return await self.send_command(
+            Command.format(Command.MOVREL, coordinates=offsets)
+        )
+
+    async def rdstat(self, axes: List[str]) -> List[Union[AxisStatus, Status]]:
+        response = await self.send_command(f"{Command.RDSTAT} {' '.join(axes)}")
+        return statuses_for_rdstat(response)
+
+    async def secure(
+        self, settings: Dict[str, Union[int, float, str]], card_address: int = None,
+    ):
+        await self.send_command(
+            Command.format(Command.SECURE, settings, card_address=card_address)
+        )
+
+    async def set_home(self, axes: Dict[str, Union[str, int]]) -> str:
+        return await self.send_command(
+            Command.format(Command.SETHOME, coordinates=axes, flag_overrides=["+"])
+        )
+
+    async def speed(self, axes: Dict[str, Union[str, float]]) -> Dict[str, float]:
+        command = Command.format(Command.SPEED, coordinates=axes, flag_overrides=["?"])
+        return TigerController._dict_from_response(await self.send_command(command))
+
+    async def status(self) -> Status:
+        return Status(await self.send_command(Command.STATUS))
+
+    async def where(self, axes: List[str]) -> dict:
+        response = await self.send_command(f"{Command.WHERE} {' '.join(axes)}")
+        coordinates = response.split(" ")[1:]
+
+        return {
+            axis: TigerController._cast_number(coord)
+            for axis, coord in zip(axes, coordinates)
+        }
+
+    async def who(self) -> List[str]:
+        return (await self.send_command(Command.WHO)).split("\r")
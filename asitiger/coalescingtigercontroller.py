@@ -0,0 +1,151 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Dict, List
+
+from asitiger.command import Command
+from asitiger.serialconnection import SerialConnection
+from asitiger.tigercontroller import TigerController
+
+LOGGER = logging.getLogger(__name__)
+
+
+class _Batch:
+    """Coordinates for one command line, merged from callers on disjoint axes"""
+
+    def __init__(self, verb: str, flag_overrides: List[str], previous: "_Batch"):
+        self.verb = verb
+        self.flag_overrides = flag_overrides
+        self.coordinates = OrderedDict()
+        self.callers = 0
+        self.future = Future()
+        self.sent = threading.Event()
+
+        # A batch with overlapping axes, which must go out before this one
+        self.previous = previous
+
+
+class CoalescingTigerController(TigerController):
+    """A ``TigerController`` which merges concurrent requests from many threads
+
+    Identical status queries (``/``, ``RS``, ``W``) made while the link is busy
+    share a single request: the first caller sends it once the link is free and
+    every caller which asked in the meantime gets its reply. A reply is only shared
+    with callers who asked before the query was written, so nobody sees a status
+    older than their own call.
+
+    Likewise, ``move``, ``move_relative`` and ``motor_control`` calls on disjoint
+    axes made while the link is busy, or within ``combine_window_s`` of each other,
+    are merged into one command line. If the merged command fails, every caller in
+    it gets the error. Calls on axes already in a pending command go out after it.
+    """
+
+    SINGLE_FLIGHT_VERBS = frozenset([Command.RDSTAT, Command.STATUS, Command.WHERE])
+
+    def __init__(
+        self,
+        serial_connection: SerialConnection,
+        poll_interval_s: float = TigerController.DEFAULT_POLL_INTERVAL_S,
+        combine_window_s: float = 0.0,
+    ):
+        super().__init__(serial_connection, poll_interval_s=poll_interval_s)
+        self.combine_window_s = combine_window_s
+
+        self.shared_replies = 0
+        self.combined_commands = 0
+
+        self._coalescing_lock = threading.Lock()
+        self._flights = {}
+        self._open_batches = {}
+
+    def send_command(self, command: str) -> str:
+        if Command.verb(command) not in self.SINGLE_FLIGHT_VERBS:
+            return super().send_command(command)
+
+        with self._coalescing_lock:
+            flight = self._flights.get(command)
+            is_leader = flight is None
+
+            if is_leader:
+                flight = self._flights[command] = Future()
+            else:
+                self.shared_replies += 1
+
+        if not is_leader:
+            return flight.result()
+
+        try:
+            with self._lock:
+                # Callers from now on would get a reply to a query sent before them
+                with self._coalescing_lock:
+                    del self._flights[command]
+
+                response = super().send_command(command)
+        except BaseException as error:
+            flight.set_exception(error)
+            raise
+
+        flight.set_result(response)
+        return response
+
+    def _combine(
+        self,
+        verb: str,
+        coordinates: Dict[str, object],
+        flag_overrides: List[str] = None,
+    ) -> str:
+        with self._coalescing_lock:
+            batch = self._open_batches.get(verb)
+            is_leader = batch is None or not batch.coordinates.keys().isdisjoint(
+                coordinates
+            )
+
+            if is_leader:
+                batch = self._open_batches[verb] = _Batch(verb, flag_overrides, batch)
+
+            batch.coordinates.update(coordinates)
+            batch.callers += 1
+
+        if not is_leader:
+            return batch.future.result()
+
+        if self.combine_window_s:
+            time.sleep(self.combine_window_s)
+
+        if batch.previous is not None:
+            batch.previous.sent.wait()
+            batch.previous = None
+
+        try:
+            with self._lock:
+                with self._coalescing_lock:
+                    if self._open_batches.get(verb) is batch:
+                        del self._open_batches[verb]
+
+                    command = Command.format(
+                        verb, batch.coordinates, flag_overrides=batch.flag_overrides
+                    )
+                    if batch.callers > 1:
+                        self.combined_commands += batch.callers - 1
+                        LOGGER.debug(f"Combined {batch.callers} calls into: {command}")
+
+                response = super().send_command(command)
+        except BaseException as error:
+            batch.future.set_exception(error)
+            raise
+        finally:
+            batch.sent.set()
+
+        batch.future.set_result(response)
+        return response
+
+    def motor_control(self, axes_states: Dict[str, str]):
+        self._combine(Command.MOTCTRL, axes_states, flag_overrides=["+", "-"])
+
+    def move(self, coordinates: Dict[str, float]):
+        return self._combine(Command.MOVE, coordinates)
+
+    def move_relative(self, offsets: Dict[str, float]):
+        return self._combine(Command.MOVREL, offsets)
@@ -5,24 +5,38 @@ LOGGER = logging.getLogger("asitiger.command")
 
 
 class Command:
+    BAUD = "BAUD"
     BUILD = "BU"
     HALT = "\\"
     HERE = "H"
     HOME = "!"
     LED = "LED"
+    LOAD = "LD"
     MOTCTRL = "MC"
     MOVE = "M"
     MOVREL = "R"
+    RBMODE = "RM"
+    RBTRIGGER = "RT"
     RDSTAT = "RS"
+    SCAN = "SN"
+    SCANR = "NR"
+    SCANV = "NV"
     SECURE = "SECURE"
     SETHOME = "HM"
     SPEED = "S"
     STATUS = "/"
+    TTL = "TTL"
     WHERE = "W"
     WHO = "WHO"
 
     _NUMERAL_MAX_LENGTH = 16
 
+    @staticmethod
+    def verb(command: str) -> str:
+        """The command's verb, without any card address prefix"""
+        verb = command.split(" ", 1)[0]
+        return verb.lstrip("0123456789") or verb
+
     @classmethod
     def format(
         cls,
@@ -36,7 +36,24 @@ class Errors:
 
         pass
 
+    class LinkError(Exception):
+        """Base class for errors with the serial link, rather than from the device"""
+
+        pass
+
+    class ReplyTimeoutError(LinkError):
+        pass
+
+    class ReplyDiscardedError(LinkError):
+        """A reply still in flight was discarded while resynchronizing the link"""
+
+        pass
+
+    class ResyncError(LinkError):
+        pass
+
     ERROR_RESPONSE_REGEX = re.compile(r":N-(.*)")
+    ERROR_RESPONSE_PREFIX = b":N"
 
     CODE_TO_ERROR_CLASS = {
         "1": UnknownCommandError,
@@ -51,6 +68,9 @@ class Errors:
 
     @classmethod
     def raise_error_if_present(cls, command: str, response: str):
+        if ":N" not in response:
+            return
+
         error_match = cls.ERROR_RESPONSE_REGEX.search(response)
 
         if error_match:
@@ -58,3 +78,10 @@ class Errors:
             ErrorClass = cls.CODE_TO_ERROR_CLASS.get(error_code, cls.UnknownError)
 
             raise ErrorClass(f'Command "{command}" failed with response: {response}')
+
+    @classmethod
+    def raise_error_if_present_in_bytes(cls, command: str, response: bytes):
+        # Uses the same rule as raise_error_if_present, an error anywhere in the
+        # reply, but successful replies are dismissed without being decoded
+        if cls.ERROR_RESPONSE_PREFIX in response:
+            cls.raise_error_if_present(command, response.decode("ascii", "replace"))
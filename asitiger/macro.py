@@ -0,0 +1,218 @@
+import logging
+import time
+from collections import namedtuple
+from typing import Callable, Dict, List, Optional, Pattern, Sequence, Union
+
+from asitiger.command import Command
+from asitiger.tigercontroller import TigerController
+
+LOGGER = logging.getLogger(__name__)
+
+# Stands in for a parameter while a command is formatted, so the surrounding text
+# can be encoded once and the parameter's value spliced in at run time
+_MARKER = "\x00"
+
+Parameter = namedtuple("Parameter", ["name", "decimals"])
+Parameter.__new__.__defaults__ = (4,)
+
+_CommandStep = namedtuple(
+    "_CommandStep", ["fragments", "parameters", "expect", "validate"]
+)
+_CallStep = namedtuple("_CallStep", ["call"])
+
+
+class MacroExpectationError(ValueError):
+    """Raised when a reply doesn't match what its macro step was added to ``expect``
+
+    The reply itself wasn't an error from the controller. ``step`` is the index of
+    the step in the macro.
+    """
+
+    def __init__(
+        self,
+        step: int,
+        command: bytes,
+        expected: Union[bytes, Pattern],
+        response: bytes,
+    ):
+        super().__init__(
+            f'Step {step} command "{command.decode()}" expected {expected!r}, '
+            f"got {response!r}"
+        )
+        self.step = step
+        self.command = command
+        self.expected = expected
+        self.response = response
+
+
+class Macro:
+    """A sequence of commands encoded once and run many times, e.g. once per well
+
+    Commands are formatted and encoded to bytes when they're added. Numeric fields
+    can be left as ``Parameter`` placeholders, written with ``decimals`` decimal
+    places, whose values are given as sequences (e.g. NumPy arrays) to ``run``,
+    which runs the whole sequence once per value.
+    Every value is formatted before the first command is sent, so the loop itself
+    only joins bytes, sends them and checks the replies.
+
+    Each reply is checked for errors as usual and, if the step was added with
+    ``expect``, against a prefix or regular expression given as bytes, raising
+    ``MacroExpectationError`` if it doesn't match.
+    """
+
+    def __init__(self):
+        self._steps = []
+
+    def __len__(self) -> int:
+        return len(self._steps)
+
+    @staticmethod
+    def _validator(expect: Union[bytes, Pattern, None]) -> Optional[Callable]:
+        if expect is None:
+            return None
+
+        if isinstance(expect, bytes):
+            return lambda response: response.startswith(expect)
+
+        return lambda response: expect.fullmatch(response) is not None
+
+    def command(
+        self,
+        verb: str,
+        coordinates: Dict[str, Union[float, str, Parameter]] = None,
+        card_address: int = None,
+        flag_overrides: List[str] = None,
+        expect: Union[bytes, Pattern] = None,
+    ) -> "Macro":
+        parameters = []
+        marked = {}
+
+        for axis, value in (coordinates or {}).items():
+            if isinstance(value, Parameter):
+                marked[axis] = f"{_MARKER}{len(parameters)}{_MARKER}"
+                parameters.append(value)
+            else:
+                marked[axis] = value
+
+        text = Command.format(
+            verb, marked, flag_overrides=flag_overrides, card_address=card_address
+        )
+        # Even pieces are literal text, odd pieces are parameter indices
+        fragments = [piece.encode("ascii") for piece in text.split(_MARKER)[::2]]
+
+        self._steps.append(
+            _CommandStep(fragments, parameters, expect, self._validator(expect))
+        )
+        return self
+
+    def move(
+        self, coordinates: Dict[str, Union[float, Parameter]], **kwargs
+    ) -> "Macro":
+        return self.command(Command.MOVE, coordinates, **kwargs)
+
+    def move_relative(
+        self, offsets: Dict[str, Union[float, Parameter]], **kwargs
+    ) -> "Macro":
+        return self.command(Command.MOVREL, offsets, **kwargs)
+
+    def led(
+        self,
+        led_brightnesses: Dict[str, Union[int, Parameter]],
+        card_address: int = None,
+        **kwargs,
+    ) -> "Macro":
+        return self.command(
+            Command.LED, led_brightnesses, card_address=card_address, **kwargs
+        )
+
+    def call(self, function: Callable[[TigerController], object]) -> "Macro":
+        """Add a step which calls ``function`` with the controller"""
+        self._steps.append(_CallStep(function))
+        return self
+
+    def wait_until_idle(self, **wait_kwargs) -> "Macro":
+        return self.call(lambda tiger: tiger.wait_until_idle(**wait_kwargs))
+
+    def sleep(self, duration_s: float) -> "Macro":
+        return self.call(lambda tiger: time.sleep(duration_s))
+
+    @staticmethod
+    def _encode_values(parameter: Parameter, values: Sequence[float]) -> List[bytes]:
+        number_format = f"%.{parameter.decimals}f".encode("ascii")
+        encoded = [number_format % float(value) for value in values]
+
+        longest = max(encoded, key=len, default=b"")
+        if len(longest) > Command._NUMERAL_MAX_LENGTH:
+            raise ValueError(
+                f'Value "{longest.decode()}" for "{parameter.name}" is too long for '
+                f"the instrument, it must be at most {Command._NUMERAL_MAX_LENGTH} "
+                "characters"
+            )
+
+        return encoded
+
+    def encode(self, **values: Sequence[float]) -> List[List[bytes]]:
+        """Every command the macro sends, as bytes, one list of steps per run"""
+        missing = {
+            parameter.name
+            for step in self._steps
+            if isinstance(step, _CommandStep)
+            for parameter in step.parameters
+        } - set(values)
+        if missing:
+            raise ValueError(f"No values given for parameters {sorted(missing)}")
+
+        runs = {len(sequence) for sequence in values.values()}
+        if len(runs) > 1:
+            raise ValueError(f"Parameter values must all be the same length: {runs}")
+        num_runs = runs.pop() if runs else 1
+
+        encoded_values = {}
+        encoded_steps = []
+
+        for step in self._steps:
+            if isinstance(step, _CallStep):
+                encoded_steps.append([None] * num_runs)
+                continue
+
+            if not step.parameters:
+                encoded_steps.append([step.fragments[0]] * num_runs)
+                continue
+
+            columns = []
+            for parameter in step.parameters:
+                if parameter not in encoded_values:
+                    encoded_values[parameter] = self._encode_values(
+                        parameter, values[parameter.name]
+                    )
+                columns.append(encoded_values[parameter])
+
+            lines = []
+            for row in zip(*columns):
+                pieces = [step.fragments[0]]
+                for value, fragment in zip(row, step.fragments[1:]):
+                    pieces.append(value)
+                    pieces.append(fragment)
+                lines.append(b"".join(pieces))
+
+            encoded_steps.append(lines)
+
+        return [list(run) for run in zip(*encoded_steps)]
+
+    def run(self, tiger: TigerController, **values: Sequence[float]) -> int:
+        """Run the macro once per parameter value, returning the number of runs"""
+        encoded_runs = self.encode(**values)
+        steps = self._steps
+
+        for encoded_run in encoded_runs:
+            for index, (step, command) in enumerate(zip(steps, encoded_run)):
+                if command is None:
+                    step.call(tiger)
+                    continue
+
+                response = tiger.send_command_raw(command).data
+                if step.validate is not None and not step.validate(response):
+                    raise MacroExpectationError(index, command, step.expect, response)
+
+        LOGGER.debug(f"Ran macro of {len(steps)} steps {len(encoded_runs)} times")
+        return len(encoded_runs)
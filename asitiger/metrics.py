@@ -0,0 +1,214 @@
+import logging
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter, OrderedDict
+from typing import Callable, Dict, List, Union
+
+from asitiger.command import Command
+
+LOGGER = logging.getLogger(__name__)
+
+
+class LatencyHistogram:
+    """Counts of latencies falling under each of a fixed set of bucket bounds"""
+
+    BUCKET_BOUNDS_S = (
+        0.0005,
+        0.001,
+        0.002,
+        0.005,
+        0.01,
+        0.02,
+        0.05,
+        0.1,
+        0.2,
+        0.5,
+        1.0,
+        2.0,
+        5.0,
+    )
+
+    def __init__(self):
+        # The last bucket counts latencies over the largest bound
+        self.bucket_counts = [0] * (len(self.BUCKET_BOUNDS_S) + 1)
+        self.count = 0
+        self.errors = 0
+        self.total_s = 0.0
+        self.max_s = 0.0
+
+    def record(self, duration_s: float, failed: bool = False):
+        self.bucket_counts[bisect_left(self.BUCKET_BOUNDS_S, duration_s)] += 1
+        self.count += 1
+        self.errors += failed
+        self.total_s += duration_s
+        self.max_s = max(self.max_s, duration_s)
+
+    def quantile(self, fraction: float) -> float:
+        """The upper bound of the bucket holding the given fraction of latencies"""
+        target = fraction * self.count
+        cumulative = 0
+
+        for bound, bucket_count in zip(self.BUCKET_BOUNDS_S, self.bucket_counts):
+            cumulative += bucket_count
+            if cumulative >= target:
+                return bound
+
+        return self.max_s
+
+    def as_dict(self) -> Dict:
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "total_s": self.total_s,
+            "mean_s": self.total_s / self.count if self.count else 0.0,
+            "max_s": self.max_s,
+            "p50_s": self.quantile(0.5),
+            "p99_s": self.quantile(0.99),
+            "buckets": OrderedDict(
+                (str(bound), bucket_count)
+                for bound, bucket_count in zip(
+                    self.BUCKET_BOUNDS_S + ("inf",), self.bucket_counts
+                )
+            ),
+        }
+
+
+class Metrics:
+    """Counters and latency histograms for the commands sent to a controller
+
+    Enabled with ``TigerController.enable_metrics``. Latencies are kept per command
+    type (the command verb, without any card address) and measured from just
+    before a command is written until its reply has been read and checked for
+    errors, so they cover the serial link and the controller's processing time.
+    Host-side parsing of replies by the controller's query methods (e.g. ``where``)
+    is recorded in separate histograms, and time spent waiting for moves by
+    ``wait_until_idle``.
+
+    Pre-send hooks are called with each command, and post-receive hooks with the
+    command, its reply (``None`` if none was read), the latency in seconds and the
+    error raised, if any. Hooks run on the thread sending the command. A hook which
+    raises is logged and skipped, so it can't break off an exchange in progress.
+    """
+
+    def __init__(self):
+        self.pre_send_hooks = []
+        self.post_receive_hooks = []
+
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.latencies = OrderedDict()
+            self.parse_latencies = OrderedDict()
+            self.errors = Counter()
+            self.timeouts = 0
+            self.bytes_sent = 0
+            self.bytes_received = 0
+            self.waits = 0
+            self.wait_polls = 0
+            self.wait_s = 0.0
+            self.wait_sleep_s = 0.0
+
+    def add_pre_send_hook(self, hook: Callable[[Union[str, bytes]], None]):
+        self.pre_send_hooks.append(hook)
+
+    def add_post_receive_hook(self, hook: Callable):
+        self.post_receive_hooks.append(hook)
+
+    @staticmethod
+    def _run_hooks(hooks: List[Callable], *args):
+        for hook in hooks:
+            try:
+                hook(*args)
+            except Exception:
+                LOGGER.exception(f"Metrics hook {hook} failed")
+
+    @staticmethod
+    def command_type(command: Union[str, bytes]) -> str:
+        if isinstance(command, bytes):
+            command = command.decode("ascii")
+
+        return Command.verb(command)
+
+    def before_send(self, command: Union[str, bytes]) -> float:
+        """Run the pre-send hooks, returning the time the command is being sent"""
+        self._run_hooks(self.pre_send_hooks, command)
+
+        return time.perf_counter()
+
+    def after_receive(
+        self,
+        command: Union[str, bytes],
+        response: Union[str, bytes, None],
+        sent_at: float,
+        error: BaseException = None,
+    ):
+        duration_s = time.perf_counter() - sent_at
+        command_type = self.command_type(command)
+
+        with self._lock:
+            histogram = self.latencies.get(command_type)
+            if histogram is None:
+                histogram = self.latencies[command_type] = LatencyHistogram()
+
+            histogram.record(duration_s, failed=error is not None)
+
+            if error is not None:
+                self.errors[type(error).__name__] += 1
+
+        self._run_hooks(self.post_receive_hooks, command, response, duration_s, error)
+
+    def record_parse(self, command: Union[str, bytes], duration_s: float):
+        command_type = self.command_type(command)
+
+        with self._lock:
+            histogram = self.parse_latencies.get(command_type)
+            if histogram is None:
+                histogram = self.parse_latencies[command_type] = LatencyHistogram()
+
+            histogram.record(duration_s)
+
+    def record_bytes_sent(self, num_bytes: int):
+        with self._lock:
+            self.bytes_sent += num_bytes
+
+    def record_bytes_received(self, num_bytes: int):
+        with self._lock:
+            self.bytes_received += num_bytes
+
+    def record_timeout(self):
+        with self._lock:
+            self.timeouts += 1
+
+    def record_wait(self, duration_s: float, sleep_s: float, polls: int):
+        with self._lock:
+            self.waits += 1
+            self.wait_polls += polls
+            self.wait_s += duration_s
+            self.wait_sleep_s += sleep_s
+
+    def snapshot(self) -> Dict:
+        """Every metric as plain, JSON-serializable values"""
+        with self._lock:
+            return {
+                "commands": OrderedDict(
+                    (command_type, histogram.as_dict())
+                    for command_type, histogram in self.latencies.items()
+                ),
+                "parsing": OrderedDict(
+                    (command_type, histogram.as_dict())
+                    for command_type, histogram in self.parse_latencies.items()
+                ),
+                "errors": dict(self.errors),
+                "timeouts": self.timeouts,
+                "bytes_sent": self.bytes_sent,
+                "bytes_received": self.bytes_received,
+                "wait_until_idle": {
+                    "calls": self.waits,
+                    "polls": self.wait_polls,
+                    "total_s": self.wait_s,
+                    "sleep_s": self.wait_sleep_s,
+                },
+            }
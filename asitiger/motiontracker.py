@@ -0,0 +1,181 @@
+import logging
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import Future
+from typing import Callable, Dict, Iterable, List
+
+from asitiger.movetime import MoveTimeModel
+from asitiger.status import Status
+from asitiger.tigercontroller import TigerController
+
+LOGGER = logging.getLogger(__name__)
+
+_PendingMove = namedtuple("_PendingMove", ["axes", "future", "poll_after"])
+
+
+class MotionTracker:
+    """Issues moves without waiting for them, returning futures for their completion
+
+    Each future resolves once every axis involved in its move is idle, or fails with
+    the error raised by the move or by polling. One background thread polls the
+    union of all outstanding moves' axes, so any number of moves on disjoint axes
+    can be in flight at once. When given a ``MoveTimeModel``, polling for a move
+    only starts once most of its predicted duration has passed.
+    """
+
+    def __init__(
+        self,
+        tiger: TigerController,
+        poll_interval_s: float = None,
+        move_time_model: MoveTimeModel = None,
+    ):
+        self.tiger = tiger
+        self.poll_interval_s = (
+            poll_interval_s if poll_interval_s else tiger.poll_interval_s
+        )
+        self.move_time_model = move_time_model
+
+        self._pending = []
+        self._condition = threading.Condition()
+        self._closed = False
+        self._poller = None
+
+    def __enter__(self) -> "MotionTracker":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Stop polling, failing any moves which haven't completed yet"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+
+        if self._poller is not None:
+            self._poller.join()
+
+        self._fail(self._pending, RuntimeError("Motion tracker was closed"))
+
+    def move(self, coordinates: Dict[str, float]) -> Future:
+        expected_duration_s = None
+        if self.move_time_model is not None:
+            start = self.tiger.where(list(coordinates))
+            expected_duration_s = self.move_time_model.duration_between_s(
+                start, coordinates
+            )
+
+        return self._track(
+            coordinates, lambda: self.tiger.move(coordinates), expected_duration_s
+        )
+
+    def move_relative(self, offsets: Dict[str, float]) -> Future:
+        expected_duration_s = None
+        if self.move_time_model is not None:
+            expected_duration_s = self.move_time_model.duration_s(offsets)
+
+        return self._track(
+            offsets, lambda: self.tiger.move_relative(offsets), expected_duration_s
+        )
+
+    def home(self, axes: List[str]) -> Future:
+        return self._track(axes, lambda: self.tiger.home(axes))
+
+    def _track(
+        self,
+        axes: Iterable[str],
+        send: Callable[[], object],
+        expected_duration_s: float = None,
+    ) -> Future:
+        future = Future()
+        future.set_running_or_notify_cancel()
+
+        if self._closed:
+            future.set_exception(RuntimeError("Motion tracker was closed"))
+            return future
+
+        try:
+            send()
+        except Exception as error:
+            future.set_exception(error)
+            return future
+
+        poll_after = 0.0
+        if expected_duration_s:
+            poll_after = (
+                time.monotonic()
+                + expected_duration_s * TigerController.WAIT_PREDICTED_FRACTION
+            )
+
+        with self._condition:
+            # close() may have run while the command was being sent, and once it
+            # has nothing would ever poll this move
+            if self._closed:
+                future.set_exception(RuntimeError("Motion tracker was closed"))
+                return future
+
+            self._pending.append(_PendingMove(frozenset(axes), future, poll_after))
+
+            if self._poller is None:
+                self._poller = threading.Thread(
+                    target=self._poll, name="asitiger-motion", daemon=True
+                )
+                self._poller.start()
+
+            self._condition.notify()
+
+        return future
+
+    @staticmethod
+    def _fail(moves: List[_PendingMove], error: BaseException):
+        for move in list(moves):
+            if not move.future.done():
+                move.future.set_exception(error)
+
+    def _due_moves(self) -> List[_PendingMove]:
+        # Blocks until some pending move is due to be polled, or the tracker closes
+        with self._condition:
+            while not self._closed:
+                now = time.monotonic()
+                due = [move for move in self._pending if move.poll_after <= now]
+                if due:
+                    return due
+
+                next_poll = min((move.poll_after for move in self._pending), default=0)
+                self._condition.wait(next_poll - now if self._pending else None)
+
+        return []
+
+    def _poll(self):
+        while True:
+            due = self._due_moves()
+            if not due:
+                return
+
+            axes = sorted(set().union(*(move.axes for move in due)))
+
+            try:
+                statuses = self.tiger.rdstat([f"{axis}?" for axis in axes])
+            except Exception as error:
+                LOGGER.debug(f"Polling axes {axes} failed: {error}")
+                with self._condition:
+                    for move in due:
+                        self._pending.remove(move)
+                self._fail(due, error)
+                continue
+
+            busy_axes = {
+                axis for axis, status in zip(axes, statuses) if status is Status.BUSY
+            }
+
+            with self._condition:
+                finished = [move for move in due if not move.axes & busy_axes]
+                for move in finished:
+                    self._pending.remove(move)
+                    move.future.set_result(None)
+
+                still_busy = bool(busy_axes)
+
+            if still_busy:
+                time.sleep(self.poll_interval_s)
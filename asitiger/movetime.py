@@ -0,0 +1,42 @@
+from typing import Dict, List, Union
+
+
+class MoveTimeModel:
+    """Predicts how long moves take from the speeds the controller reports
+
+    Positions are in tenths of microns and speeds in mm/s, as with the ``W`` and
+    ``S`` commands. Axes in one move travel simultaneously, so the move takes as
+    long as its slowest axis. ``overhead_s`` accounts for time not spent at speed,
+    e.g. acceleration ramps and settling.
+    """
+
+    UNITS_PER_MM = 10000
+
+    def __init__(
+        self, speeds_mm_s: Dict[str, Union[float, str]], overhead_s: float = 0.0
+    ):
+        self.speeds_mm_s = {axis: float(speed) for axis, speed in speeds_mm_s.items()}
+        self.overhead_s = overhead_s
+
+    @classmethod
+    def from_controller(
+        cls, tiger, axes: List[str], overhead_s: float = 0.0
+    ) -> "MoveTimeModel":
+        return cls(tiger.speed({axis: "?" for axis in axes}), overhead_s=overhead_s)
+
+    def axis_duration_s(self, axis: str, distance: float) -> float:
+        return abs(distance) / (self.speeds_mm_s[axis] * self.UNITS_PER_MM)
+
+    def duration_s(self, offsets: Dict[str, float]) -> float:
+        durations = [
+            self.axis_duration_s(axis, distance)
+            for axis, distance in offsets.items()
+            if distance
+        ]
+
+        return max(durations) + self.overhead_s if durations else 0.0
+
+    def duration_between_s(
+        self, start: Dict[str, float], end: Dict[str, float]
+    ) -> float:
+        return self.duration_s({axis: end[axis] - start[axis] for axis in end})
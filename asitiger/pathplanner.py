@@ -0,0 +1,175 @@
+import logging
+from typing import Dict, List, Sequence, Union
+
+import numpy as np
+
+from asitiger.movetime import MoveTimeModel
+
+LOGGER = logging.getLogger(__name__)
+
+
+class PathPlanner:
+    """Orders positions to visit so the stage spends as little time as possible moving
+
+    Travel times come from a ``MoveTimeModel``, so axes moving together (e.g. X and
+    Y) take as long as the slowest of them. A nearest neighbour tour is improved
+    with 2-opt, which reverses stretches of the tour while that shortens it, for at
+    most ``max_passes`` passes. The tour starts at ``start`` if one is given (e.g.
+    the stage's current position), otherwise at the first position, and doesn't
+    return to it.
+
+    Positions are coordinate dicts for ``move``, or rows of coordinates in the
+    order of ``axes`` (e.g. an N x len(axes) NumPy array).
+    """
+
+    DEFAULT_MAX_PASSES = 20
+
+    # Improvements smaller than this are rounding error, and could loop forever
+    _MIN_IMPROVEMENT_S = 1e-9
+
+    def __init__(
+        self,
+        move_time_model: MoveTimeModel,
+        axes: List[str] = None,
+        max_passes: int = DEFAULT_MAX_PASSES,
+    ):
+        self.move_time_model = move_time_model
+        self.axes = list(move_time_model.speeds_mm_s if axes is None else axes)
+        self.max_passes = max_passes
+
+        self._units_per_s = np.array(
+            [
+                move_time_model.speeds_mm_s[axis] * MoveTimeModel.UNITS_PER_MM
+                for axis in self.axes
+            ]
+        )
+
+    @classmethod
+    def from_controller(
+        cls, tiger, axes: List[str], overhead_s: float = 0.0, **kwargs
+    ) -> "PathPlanner":
+        return cls(
+            MoveTimeModel.from_controller(tiger, axes, overhead_s=overhead_s),
+            axes=axes,
+            **kwargs,
+        )
+
+    def _array(
+        self, positions: Union[Sequence[Dict[str, float]], Sequence[Sequence[float]]]
+    ) -> np.ndarray:
+        if len(positions) and isinstance(positions[0], dict):
+            positions = [
+                [position[axis] for axis in self.axes] for position in positions
+            ]
+
+        return np.asarray(positions, dtype=np.float64).reshape(-1, len(self.axes))
+
+    def _durations_s(self, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+        # Rows of coordinates broadcast against each other, as MoveTimeModel.duration_s
+        durations = (np.abs(ends - starts) / self._units_per_s).max(axis=-1)
+
+        if self.move_time_model.overhead_s:
+            durations[durations > 0] += self.move_time_model.overhead_s
+
+        return durations
+
+    def durations_s(self, positions: np.ndarray) -> np.ndarray:
+        """The travel time from every position (row) to every other (column)"""
+        return self._durations_s(positions[:, np.newaxis, :], positions[np.newaxis])
+
+    @staticmethod
+    def _nearest_neighbour(durations: np.ndarray) -> np.ndarray:
+        num_positions = len(durations)
+        tour = np.zeros(num_positions, dtype=np.intp)
+        unvisited = np.ones(num_positions, dtype=bool)
+        unvisited[0] = False
+
+        for step in range(1, num_positions):
+            candidates = np.where(unvisited, durations[tour[step - 1]], np.inf)
+            tour[step] = np.argmin(candidates)
+            unvisited[tour[step]] = False
+
+        return tour
+
+    def _two_opt(self, durations: np.ndarray, tour: np.ndarray) -> np.ndarray:
+        # A free end costs nothing to reach, so reversing the tour's tail is handled
+        # like any other reversal
+        num_positions = len(tour)
+        durations = np.pad(durations, ((0, 1), (0, 1)), mode="constant")
+        tour = np.append(tour, num_positions)
+
+        for _ in range(self.max_passes):
+            improved = False
+
+            for start in range(1, num_positions - 1):
+                # Change in travel time from reversing tour[start:stop], for each stop
+                before, first = tour[start - 1], tour[start]
+                lasts_from, afters_from = start + 1, start + 2
+                lasts, afters = tour[lasts_from:-1], tour[afters_from:]
+
+                changes = (
+                    durations[before, lasts]
+                    + durations[first, afters]
+                    - durations[before, first]
+                    - durations[lasts, afters]
+                )
+                best = np.argmin(changes)
+
+                if changes[best] < -self._MIN_IMPROVEMENT_S:
+                    stop = start + best + 2
+                    tour[start:stop] = tour[start:stop][::-1].copy()
+                    improved = True
+
+            if not improved:
+                break
+
+        return tour[:num_positions]
+
+    def order(
+        self,
+        positions: Union[Sequence[Dict[str, float]], Sequence[Sequence[float]]],
+        start: Dict[str, float] = None,
+    ) -> List[int]:
+        """The indices of ``positions`` in the order to visit them"""
+        array = self._array(positions)
+        if start is not None:
+            array = np.vstack([self._array([start]), array])
+
+        if len(array) < 3:
+            tour = np.arange(len(array))
+        else:
+            durations = self.durations_s(array)
+            tour = self._two_opt(durations, self._nearest_neighbour(durations))
+
+        if start is not None:
+            return [int(index) - 1 for index in tour[1:]]
+
+        return [int(index) for index in tour]
+
+    def plan(
+        self,
+        positions: Union[Sequence[Dict[str, float]], Sequence[Sequence[float]]],
+        start: Dict[str, float] = None,
+    ) -> list:
+        """``positions``, reordered to be visited in the least time"""
+        ordered = [positions[index] for index in self.order(positions, start=start)]
+
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug(
+                f"Planned {len(ordered)} positions, travel takes "
+                f"{self.travel_time_s(positions, start=start):.3f}s in the given order "
+                f"and {self.travel_time_s(ordered, start=start):.3f}s as planned"
+            )
+        return ordered
+
+    def travel_time_s(
+        self,
+        positions: Union[Sequence[Dict[str, float]], Sequence[Sequence[float]]],
+        start: Dict[str, float] = None,
+    ) -> float:
+        """The time spent moving to visit ``positions`` in the order given"""
+        array = self._array(positions)
+        if start is not None:
+            array = np.vstack([self._array([start]), array])
+
+        return float(self._durations_s(array[:-1], array[1:]).sum())
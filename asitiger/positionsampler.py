@@ -0,0 +1,143 @@
+import logging
+import re
+import threading
+import time
+from collections import namedtuple
+from typing import List
+
+import numpy as np
+
+from asitiger.command import Command
+from asitiger.tigercontroller import TigerController
+
+LOGGER = logging.getLogger(__name__)
+
+_STATUS_BYTE_REGEX = re.compile(r"\d+")
+
+Samples = namedtuple("Samples", ["timestamps", "positions", "statuses"])
+
+
+class PositionSampler:
+    """Samples axis positions in the background into a fixed-size ring buffer
+
+    Positions (and optionally RDSTAT status bytes) are queried as fast as the link
+    allows, or every ``interval_s``, and written with a ``time.monotonic`` timestamp
+    into preallocated arrays. Nothing is allocated per sample beyond the response
+    string itself.
+
+    Every sample is written twice, ``capacity`` rows apart, so the latest samples
+    are always contiguous and ``latest`` can return views rather than copies. The
+    views are read-only and will be overwritten as sampling continues, so copy them
+    to keep them.
+    """
+
+    def __init__(
+        self,
+        tiger: TigerController,
+        axes: List[str],
+        capacity: int = 65536,
+        include_status: bool = False,
+        interval_s: float = 0.0,
+    ):
+        self.tiger = tiger
+        self.axes = list(axes)
+        self.capacity = capacity
+        self.include_status = include_status
+        self.interval_s = interval_s
+
+        self.error = None
+
+        self._where_command = f"{Command.WHERE} {' '.join(self.axes)}"
+        self._where_command_bytes = self._where_command.encode("ascii")
+        self._rdstat_command = f"{Command.RDSTAT} {' '.join(self.axes)}"
+
+        self._timestamps = np.zeros(2 * capacity, dtype=np.float64)
+        self._positions = np.zeros((2 * capacity, len(self.axes)), dtype=np.float64)
+        self._statuses = np.zeros((2 * capacity, len(self.axes)), dtype=np.uint8)
+        self._count = 0
+
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def __enter__(self) -> "PositionSampler":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    @property
+    def count(self) -> int:
+        """The total number of samples taken, including those overwritten"""
+        return self._count
+
+    def start(self):
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="asitiger-sampler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def sample(self):
+        """Take one sample on the calling thread"""
+        if self.include_status:
+            where_response, rdstat_response = self.tiger.send_commands(
+                [self._where_command, self._rdstat_command]
+            )
+            positions = where_response.split()[1:]
+        else:
+            positions = self.tiger.send_command_raw(self._where_command_bytes).numbers()
+
+        timestamp = time.monotonic()
+        index = self._count % self.capacity
+
+        if self.include_status:
+            statuses = _STATUS_BYTE_REGEX.findall(rdstat_response[2:])
+
+        for row in (index, index + self.capacity):
+            self._timestamps[row] = timestamp
+            self._positions[row] = positions
+
+            if self.include_status:
+                self._statuses[row] = statuses
+
+        self._count += 1
+
+    def latest(self, num_samples: int = None) -> Samples:
+        """Read-only views of the most recent samples, oldest first"""
+        count = self._count
+        available = min(count, self.capacity)
+        num_samples = available if num_samples is None else min(num_samples, available)
+
+        end = count % self.capacity + self.capacity
+        window = slice(end - num_samples, end)
+
+        views = Samples(
+            self._timestamps[window],
+            self._positions[window],
+            self._statuses[window] if self.include_status else None,
+        )
+
+        for view in views:
+            if view is not None:
+                view.flags.writeable = False
+
+        return views
+
+    def _run(self):
+        while not self._stopped.is_set():
+            try:
+                self.sample()
+            except Exception as error:
+                LOGGER.error(f"Position sampling stopped: {error}")
+                self.error = error
+                return
+
+            if self.interval_s:
+                self._stopped.wait(self.interval_s)
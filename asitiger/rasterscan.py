@@ -0,0 +1,216 @@
+import logging
+import math
+import time
+from collections import namedtuple
+from enum import Enum
+from typing import Callable, Dict
+
+from asitiger.command import Command
+from asitiger.tigercontroller import TigerController
+
+LOGGER = logging.getLogger(__name__)
+
+ScanProgress = namedtuple("ScanProgress", ["state", "line", "fraction"])
+
+
+class RasterScan:
+    """Hardware-timed raster scans, run by the SCAN firmware module of an XY card
+
+    The fast axis sweeps from its start to its stop position once per line, and the
+    slow axis steps evenly from its start to its stop position between lines, with
+    a settle time before each sweep. The controller times the whole scan itself, so
+    no serial round trip is needed per line or tile. Both axes must be on the same
+    card. Positions are in millimetres, as the SCAN module takes them.
+    """
+
+    class Pattern(Enum):
+        RASTER = 0
+        SERPENTINE = 1
+
+    class State(Enum):
+        IDLE = "I"
+        RUNNING = "S"
+        STOPPING = "P"
+
+    UNITS_PER_MM = 10000
+
+    # Slack in deciding whether the slow axis has reached a line, in lines
+    LINE_TOLERANCE = 1e-3
+
+    def __init__(
+        self, tiger: TigerController, fast_axis: str = "X", slow_axis: str = "Y"
+    ):
+        self.tiger = tiger
+        self.fast_axis = fast_axis
+        self.slow_axis = slow_axis
+
+        topology = tiger.topology()
+        self.card_address = topology.card_address([fast_axis, slow_axis])
+
+        card_labels = [axis.label for axis in topology.axes_on_card(self.card_address)]
+        self.fast_index = card_labels.index(fast_axis)
+        self.slow_index = card_labels.index(slow_axis)
+
+        self.fast_range_mm = None
+        self.slow_range_mm = None
+        self.num_lines = 0
+        self.pattern = self.Pattern.RASTER
+
+        self._fraction_done = 0.0
+        self._last_sample = None
+
+    def _command(self, command: str, coordinates: Dict = None, **kwargs) -> str:
+        return Command.format(
+            command, coordinates, card_address=self.card_address, **kwargs
+        )
+
+    def configure(
+        self,
+        fast_start_mm: float,
+        fast_stop_mm: float,
+        slow_start_mm: float,
+        slow_stop_mm: float,
+        num_lines: int,
+        settle_time_s: float = 0.0,
+        pattern: "RasterScan.Pattern" = Pattern.RASTER,
+    ):
+        """Set up the scan, in one pipelined exchange, without starting it
+
+        With the ``SERPENTINE`` pattern every other line is swept backwards, rather
+        than the fast axis retracing to its start position before each line.
+        """
+        if num_lines < 1:
+            raise ValueError(f"A scan needs at least one line, not {num_lines}")
+
+        self.tiger.send_commands(
+            [
+                self._command(
+                    Command.SCAN,
+                    {"Y": self.fast_index, "Z": self.slow_index, "F": pattern.value},
+                ),
+                self._command(Command.SCANR, {"X": fast_start_mm, "Y": fast_stop_mm}),
+                self._command(
+                    Command.SCANV,
+                    {
+                        "X": slow_start_mm,
+                        "Y": slow_stop_mm,
+                        "Z": num_lines,
+                        "F": round(settle_time_s * 1000),
+                    },
+                ),
+            ]
+        )
+
+        self.fast_range_mm = (fast_start_mm, fast_stop_mm)
+        self.slow_range_mm = (slow_start_mm, slow_stop_mm)
+        self.num_lines = num_lines
+        self.pattern = pattern
+
+    def start(self):
+        self._fraction_done = 0.0
+        self._last_sample = None
+        self.tiger.send_command(self._command(Command.SCAN, {"X": "S"}))
+        LOGGER.debug(f"Started {self.num_lines} line scan on card {self.card_address}")
+
+    def stop(self):
+        self.tiger.send_command(self._command(Command.SCAN, {"X": "P"}))
+
+    @classmethod
+    def _state(cls, response: str) -> "RasterScan.State":
+        return cls.State(TigerController._dict_from_response(response)["X"])
+
+    def state(self) -> "RasterScan.State":
+        return self._state(
+            self.tiger.send_command(
+                self._command(Command.SCAN, {"X": "?"}, flag_overrides=["?"])
+            )
+        )
+
+    @staticmethod
+    def _fraction(position_mm: float, start_mm: float, stop_mm: float) -> float:
+        if stop_mm == start_mm:
+            return 1.0
+
+        return min(max((position_mm - start_mm) / (stop_mm - start_mm), 0.0), 1.0)
+
+    def progress(self) -> ScanProgress:
+        """The scan's state and how far through it the axes are
+
+        ``line`` is the index of the last line the slow axis reached and ``fraction``
+        the share of the scan's sweeps which are done, from 0 to 1, both estimated
+        from the axes' positions. A partly done sweep only counts once the fast axis
+        is seen moving in the line's direction since the last call, so retraces
+        aren't mistaken for sweeps, and ``fraction`` never goes back while a scan
+        runs. The state and positions are read in one exchange.
+        """
+        if self.fast_range_mm is None:
+            raise ValueError("The scan must be configured first")
+
+        responses = self.tiger.send_commands(
+            [
+                self._command(Command.SCAN, {"X": "?"}, flag_overrides=["?"]),
+                f"{Command.WHERE} {self.fast_axis} {self.slow_axis}",
+            ]
+        )
+
+        fast_mm, slow_mm = (
+            float(position) / self.UNITS_PER_MM for position in responses[1].split()[1:]
+        )
+
+        line = 0
+        if self.num_lines > 1:
+            slow_fraction = self._fraction(slow_mm, *self.slow_range_mm)
+            line = math.floor(
+                slow_fraction * (self.num_lines - 1) + self.LINE_TOLERANCE
+            )
+
+        fast_start_mm, fast_stop_mm = self.fast_range_mm
+        if self.pattern is self.Pattern.SERPENTINE and line % 2:
+            fast_start_mm, fast_stop_mm = fast_stop_mm, fast_start_mm
+        sweep_fraction = self._fraction(fast_mm, fast_start_mm, fast_stop_mm)
+
+        state = self._state(responses[0])
+        # The fast axis is sweeping if it has moved forward along the same line
+        # since the last call, rather than retracing or starting on a new line
+        last_line, last_fast_mm = self._last_sample or (None, None)
+        sweeping = (
+            line == last_line
+            and (fast_mm - last_fast_mm) * (fast_stop_mm - fast_start_mm) > 0
+        )
+        finished = (
+            state is self.State.IDLE
+            and line == self.num_lines - 1
+            and sweep_fraction == 1.0
+        )
+        self._last_sample = (line, fast_mm)
+
+        if not (sweeping or finished):
+            sweep_fraction = 0.0
+
+        self._fraction_done = max(
+            self._fraction_done, (line + sweep_fraction) / self.num_lines
+        )
+
+        return ScanProgress(state, line, self._fraction_done)
+
+    def wait_until_done(
+        self,
+        poll_interval_s: float = None,
+        on_progress: Callable[[ScanProgress], object] = None,
+    ) -> ScanProgress:
+        """Poll the scan's progress until the controller reports it idle
+
+        ``on_progress`` is called with every poll's ``ScanProgress``, and the last
+        one is returned.
+        """
+        poll_interval_s = poll_interval_s or self.tiger.poll_interval_s
+
+        while True:
+            progress = self.progress()
+            if on_progress is not None:
+                on_progress(progress)
+
+            if progress.state is self.State.IDLE:
+                return progress
+
+            time.sleep(poll_interval_s)
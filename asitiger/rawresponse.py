@@ -0,0 +1,56 @@
+from typing import Any, Callable, Dict, List, MutableSequence, Union
+
+from asitiger.status import AxisStatus, Status, statuses_for_rdstat
+
+
+class RawResponse:
+    """A reply kept as the bytes received, parsed only into what the caller asks for
+
+    Numeric fields are converted straight from bytes (``float`` accepts them), so no
+    text is decoded unless ``text``, ``as_dict`` or ``statuses`` are used.
+    """
+
+    __slots__ = ("command", "data")
+
+    def __init__(self, command: Union[str, bytes], data: Union[bytes, memoryview]):
+        self.command = command
+        self.data = bytes(data) if isinstance(data, memoryview) else data
+
+    def __repr__(self) -> str:
+        return f"RawResponse({self.command!r}, {self.data!r})"
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, RawResponse):
+            return self.data == other.data
+        return self.data == other
+
+    @property
+    def text(self) -> str:
+        return self.data.decode("ascii")
+
+    def numbers(self) -> List[float]:
+        """Every field after the leading ``:A``, as floats"""
+        return [float(field) for field in self.data.split()[1:]]
+
+    def numbers_into(self, out: MutableSequence[float], offset: int = 0) -> int:
+        """Write the numeric fields into ``out`` (e.g. a NumPy row) from ``offset``
+
+        Returns the number of fields written.
+        """
+        fields = self.data.split()
+        for index in range(1, len(fields)):
+            out[offset + index - 1] = float(fields[index])
+
+        return len(fields) - 1
+
+    def as_dict(self, cast_values_to: Callable[[str], Any] = None) -> Dict[str, Any]:
+        """Parse ``:A X=1 Y=2`` style replies, like ``TigerController.speed`` does"""
+        cast = cast_values_to if cast_values_to is not None else lambda value: value
+
+        pairs = (field.split(b"=") for field in self.data.split()[1:])
+        return {
+            key.decode("ascii"): cast(value.decode("ascii")) for key, value in pairs
+        }
+
+    def statuses(self) -> List[Union[AxisStatus, Status]]:
+        return statuses_for_rdstat(self.text)
@@ -0,0 +1,215 @@
+import itertools
+import logging
+import struct
+import time
+from collections import namedtuple
+from typing import BinaryIO, Callable, Iterator, List, Optional
+
+from asitiger.scheduledserial import ScheduledSerial
+from asitiger.serialconnection import SerialConnection
+
+LOGGER = logging.getLogger(__name__)
+
+Record = namedtuple("Record", ["direction", "timestamp_s", "data"])
+
+SENT = b"S"
+RECEIVED = b"R"
+
+# A recording is this magic, then records of a header (direction, seconds since
+# recording started and payload length) followed by the payload bytes
+MAGIC = b"ASITIGER-REC\x02"
+_RECORD_HEADER = struct.Struct("<cdI")
+
+# Version 1 recordings had 16 bit payload lengths, which were too short for bulk
+# reads, and can still be read
+_RECORD_HEADERS = {
+    b"ASITIGER-REC\x01": struct.Struct("<cdH"),
+    MAGIC: _RECORD_HEADER,
+}
+
+
+def write_record(file: BinaryIO, record: Record):
+    file.write(
+        _RECORD_HEADER.pack(record.direction, record.timestamp_s, len(record.data))
+    )
+    file.write(record.data)
+
+
+def iter_records(file: BinaryIO) -> Iterator[Record]:
+    record_header = _RECORD_HEADERS.get(file.read(len(MAGIC)))
+    if record_header is None:
+        raise ValueError("Not a serial session recording")
+
+    while True:
+        header = file.read(record_header.size)
+        if len(header) < record_header.size:
+            return
+
+        direction, timestamp_s, length = record_header.unpack(header)
+        yield Record(direction, timestamp_s, file.read(length))
+
+
+def read_records(path: str) -> List[Record]:
+    with open(path, "rb") as file:
+        return list(iter_records(file))
+
+
+class RecordingSerial:
+    """Wraps a pyserial ``Serial``, recording every write and non-empty read
+
+    Timestamps are ``time.monotonic`` seconds since the recording started. Every
+    other attribute is passed through to the wrapped port.
+    """
+
+    def __init__(
+        self, serial_port, file: BinaryIO, clock: Callable[[], float] = time.monotonic,
+    ):
+        self.serial_port = serial_port
+        self.file = file
+        self.clock = clock
+
+        self.file.write(MAGIC)
+        self._started_at = clock()
+
+    def __getattr__(self, name):
+        return getattr(self.serial_port, name)
+
+    @property
+    def baudrate(self) -> int:
+        return self.serial_port.baudrate
+
+    @baudrate.setter
+    def baudrate(self, baudrate: int):
+        self.serial_port.baudrate = baudrate
+
+    @property
+    def timeout(self) -> float:
+        return self.serial_port.timeout
+
+    @timeout.setter
+    def timeout(self, timeout: float):
+        self.serial_port.timeout = timeout
+
+    def _record(self, direction: bytes, data: bytes):
+        write_record(
+            self.file, Record(direction, self.clock() - self._started_at, data)
+        )
+
+    def write(self, data: bytes) -> int:
+        self._record(SENT, data)
+        return self.serial_port.write(data)
+
+    def read(self, size: int = 1) -> bytes:
+        data = self.serial_port.read(size)
+        if data:
+            self._record(RECEIVED, data)
+        return data
+
+    def readline(self) -> bytes:
+        data = self.serial_port.readline()
+        if data:
+            self._record(RECEIVED, data)
+        return data
+
+    def close(self):
+        self.serial_port.close()
+        self.file.close()
+
+
+class RecordingConnection(SerialConnection):
+    """Records a ``SerialConnection``'s traffic to ``path`` as it's used
+
+    The wrapped connection's port is taken over, so use this connection instead
+    of it from then on. The recording is complete once this is disconnected.
+    """
+
+    def __init__(self, serial_connection: SerialConnection, path: str):
+        LOGGER.debug(f"Recording serial session to {path}")
+        self._attach(RecordingSerial(serial_connection.connection, open(path, "wb")))
+
+
+class ReplaySerial(ScheduledSerial):
+    """A pyserial ``Serial`` stand-in which plays back a recorded session
+
+    Each write is checked against the next recorded write, then the bytes received
+    after it in the recording become readable after the same delay, divided by
+    ``speed``. A ``speed`` of ``None`` replays without any delays. When ``strict``,
+    writes which don't match the recording raise ``ValueError``, otherwise they're
+    logged and replayed as if they matched.
+    """
+
+    def __init__(
+        self,
+        records: List[Record],
+        speed: Optional[float] = 1.0,
+        timeout=10.0,
+        strict: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        super().__init__(baudrate=None, timeout=timeout)
+        self.speed = speed
+        self.strict = strict
+        self.clock = clock
+
+        self._records = list(records)
+        self._next_record = 0
+
+        # Anything received before the first command arrives as the replay starts
+        self._schedule_received(self.clock(), 0.0)
+
+    def _now(self) -> float:
+        return self.clock()
+
+    @property
+    def remaining_commands(self) -> int:
+        upcoming = itertools.islice(self._records, self._next_record, None)
+        return sum(1 for record in upcoming if record.direction == SENT)
+
+    def _schedule_received(self, now: float, sent_at_s: float):
+        while (
+            self._next_record < len(self._records)
+            and self._records[self._next_record].direction == RECEIVED
+        ):
+            record = self._records[self._next_record]
+            delay_s = (record.timestamp_s - sent_at_s) / self.speed if self.speed else 0
+            self._schedule(now + max(delay_s, 0.0), record.data)
+            self._next_record += 1
+
+    def write(self, data: bytes) -> int:
+        now = self.clock()
+
+        if self._next_record >= len(self._records):
+            if self.strict:
+                raise ValueError(f"Recording has ended, nothing to reply to {data}")
+            LOGGER.warning(f"Recording has ended, nothing to reply to {data}")
+            return len(data)
+
+        record = self._records[self._next_record]
+        if record.data != data:
+            message = f"Recording expected {record.data} to be sent, not {data}"
+            if self.strict:
+                raise ValueError(message)
+            LOGGER.warning(message)
+
+        self._next_record += 1
+        self._schedule_received(now, record.timestamp_s)
+
+        return len(data)
+
+
+class ReplayConnection(SerialConnection):
+    """A ``SerialConnection`` which plays back a session recorded to ``path``"""
+
+    def __init__(
+        self,
+        path: str,
+        speed: Optional[float] = 1.0,
+        read_timeout_s: float = 10.0,
+        strict: bool = True,
+    ):
+        LOGGER.debug(f"Replaying serial session from {path}")
+        self._attach(
+            ReplaySerial(
+                read_records(path), speed=speed, timeout=read_timeout_s, strict=strict
+            )
+        )
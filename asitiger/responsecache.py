@@ -0,0 +1,150 @@
+import threading
+import time
+from collections import Counter, OrderedDict
+from typing import Callable, Dict, Optional, Union
+
+from asitiger.command import Command
+
+
+class ResponseCache:
+    """Replies to read-only queries, kept for a time-to-live per command type
+
+    Enabled with ``TigerController.enable_cache``. A command is a query if it's
+    always read-only (``WHO``, ``BU X``) or if every one of its arguments is a
+    ``?`` query (e.g. ``S X? Y?``). Only queries whose verb has an entry in
+    ``ttls_s`` are cached, for that many seconds, or until cleared if the TTL is
+    ``None``. Any other command with the same verb, e.g. ``S X=5``, is a write
+    which drops the cached replies for that verb.
+
+    The least recently used replies are evicted beyond ``max_entries``. Each
+    invalidation bumps its verb's generation, and a reply fetched across one, e.g.
+    while another thread wrote to the same setting, isn't cached.
+    """
+
+    DEFAULT_TTLS_S = {
+        Command.BUILD: None,
+        Command.LED: 60.0,
+        Command.SECURE: 60.0,
+        Command.SETHOME: 60.0,
+        Command.SPEED: 60.0,
+        Command.WHO: None,
+    }
+
+    READ_ONLY_VERBS = frozenset([Command.BUILD, Command.WHO])
+
+    def __init__(
+        self,
+        ttls_s: Dict[str, Optional[float]] = None,
+        max_entries: int = 256,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttls_s = dict(self.DEFAULT_TTLS_S if ttls_s is None else ttls_s)
+        self.max_entries = max_entries
+        self.clock = clock
+
+        self.hits = 0
+        self.misses = 0
+
+        # Command -> (verb, expiry time or None, response), least recently used first
+        self._entries = OrderedDict()
+        # Cached verb -> number of times its replies have been invalidated
+        self._generations = Counter()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @classmethod
+    def is_query(cls, command: str) -> bool:
+        verb = Command.verb(command)
+        if verb in cls.READ_ONLY_VERBS:
+            return True
+
+        arguments = command.split()[1:]
+        return bool(arguments) and all(argument.endswith("?") for argument in arguments)
+
+    def get(self, command: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(command)
+
+            if entry is not None:
+                _, expires_at, response = entry
+                if expires_at is None or self.clock() < expires_at:
+                    self._entries.move_to_end(command)
+                    self.hits += 1
+                    return response
+
+                del self._entries[command]
+
+            self.misses += 1
+            return None
+
+    def generation(self, verb: str) -> int:
+        with self._lock:
+            return self._generations[verb]
+
+    def put(self, command: str, response: str, generation: int = None):
+        """Cache a reply, unless its verb was invalidated since ``generation``"""
+        verb = Command.verb(command)
+        if verb not in self.ttls_s:
+            return
+
+        ttl_s = self.ttls_s[verb]
+        expires_at = None if ttl_s is None else self.clock() + ttl_s
+
+        with self._lock:
+            if generation is not None and generation != self._generations[verb]:
+                return
+
+            self._entries[command] = (verb, expires_at, response)
+            self._entries.move_to_end(command)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, verb: str):
+        """Drop every cached reply for the given verb"""
+        # Most writes (e.g. moves) are to verbs which are never cached
+        if verb not in self.ttls_s:
+            return
+
+        with self._lock:
+            self._generations[verb] += 1
+            for command in [
+                command
+                for command, (cached_verb, _, _) in self._entries.items()
+                if cached_verb == verb
+            ]:
+                del self._entries[command]
+
+    def invalidate_for(self, command: Union[str, bytes]):
+        """Drop the replies a command might change, if it isn't a query"""
+        if isinstance(command, bytes):
+            command = command.decode("ascii")
+
+        if not self.is_query(command):
+            self.invalidate(Command.verb(command))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            for verb in self.ttls_s:
+                self._generations[verb] += 1
+
+    def fetch(self, command: str, send: Callable[[str], str]) -> str:
+        """The cached reply to ``command``, or the reply from sending it with ``send``"""
+        if not self.is_query(command):
+            self.invalidate(Command.verb(command))
+            return send(command)
+
+        verb = Command.verb(command)
+        if verb not in self.ttls_s:
+            return send(command)
+
+        generation = self.generation(verb)
+        response = self.get(command)
+        if response is None:
+            response = send(command)
+            self.put(command, response, generation)
+
+        return response
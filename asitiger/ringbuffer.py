@@ -0,0 +1,132 @@
+import logging
+from enum import Enum
+from typing import Dict, Iterable, List, Sequence, Union
+
+from asitiger.command import Command
+from asitiger.tigercontroller import TigerController
+
+LOGGER = logging.getLogger(__name__)
+
+
+class RingBuffer:
+    """Pre-planned position sequences, stepped through by the controller itself
+
+    Positions are uploaded to a card's ring buffer with ``LD`` and played back on
+    TTL input pulses, or on the controller's own timer, so no serial round trip is
+    needed per point. All axes must be on the same card. Positions are in tenths of
+    microns, as with ``move``.
+    """
+
+    class Mode(Enum):
+        TTL = 0
+        ONE_SHOT = 1
+        REPEAT = 2
+
+    # TTL X=1 advances the ring buffer to its next position on each input pulse, as
+    # Micro-Manager's ASITiger sequencing uses (X=2 would repeat the last relative move)
+    TTL_INPUT_MODE = 1
+
+    DEFAULT_CAPACITY = 50
+
+    def __init__(
+        self, tiger: TigerController, axes: List[str], capacity: int = DEFAULT_CAPACITY,
+    ):
+        self.tiger = tiger
+        self.axes = list(axes)
+        self.capacity = capacity
+
+        topology = tiger.topology()
+        self.card_address = topology.card_address(self.axes)
+
+        card_labels = [axis.label for axis in topology.axes_on_card(self.card_address)]
+        self.axis_byte = sum(1 << card_labels.index(axis) for axis in self.axes)
+
+        self.num_points = 0
+
+    def _command(self, command: str, coordinates: Dict = None, **kwargs) -> str:
+        return Command.format(
+            command, coordinates, card_address=self.card_address, **kwargs
+        )
+
+    def _points(
+        self, positions: Union[Iterable[Dict[str, float]], Sequence[Sequence[float]]]
+    ) -> List[Dict[str, float]]:
+        points = []
+
+        for position in positions:
+            if isinstance(position, dict):
+                point = {axis: float(position[axis]) for axis in self.axes}
+            else:
+                values = [float(value) for value in position]
+                if len(values) != len(self.axes):
+                    raise ValueError(
+                        f"Expected {len(self.axes)} coordinates per position for "
+                        f"axes {self.axes}, got {len(values)}"
+                    )
+                point = dict(zip(self.axes, values))
+
+            points.append(point)
+
+        return points
+
+    def upload(
+        self, positions: Union[Iterable[Dict[str, float]], Sequence[Sequence[float]]]
+    ):
+        """Replace the buffer's contents with the given positions
+
+        Takes a sequence of coordinate dicts, or rows of coordinates in the order of
+        ``axes`` (e.g. an N x len(axes) NumPy array). The ``LD`` commands are
+        pipelined, so uploading takes about one round trip per pipeline window.
+        """
+        points = self._points(positions)
+
+        if len(points) > self.capacity:
+            raise ValueError(
+                f"{len(points)} positions don't fit in a ring buffer of {self.capacity}"
+            )
+
+        commands = [
+            self._command(Command.RBMODE, {"X": 0}),
+            self._command(Command.RBMODE, {"Y": self.axis_byte}),
+        ]
+        commands.extend(self._command(Command.LOAD, point) for point in points)
+
+        self.tiger.send_commands(commands)
+        self.num_points = len(points)
+
+        LOGGER.debug(
+            f"Uploaded {self.num_points} positions to card {self.card_address}"
+        )
+
+    def arm(self, mode: "RingBuffer.Mode" = Mode.TTL, interval_s: float = None):
+        """Get ready to step through the positions
+
+        In ``TTL`` mode each TTL input pulse (or ``trigger``) moves to the next
+        position. In ``ONE_SHOT`` and ``REPEAT`` modes, ``trigger`` starts the
+        controller stepping every ``interval_s`` by itself, once through the buffer
+        or over and over.
+        """
+        commands = [self._command(Command.RBMODE, {"F": mode.value})]
+
+        if mode is self.Mode.TTL:
+            commands.append(self._command(Command.TTL, {"X": self.TTL_INPUT_MODE}))
+        elif interval_s is None:
+            raise ValueError(f"An interval is needed to arm in {mode} mode")
+
+        if interval_s is not None:
+            commands.append(
+                self._command(Command.RBTRIGGER, {"F": round(interval_s * 1000)})
+            )
+
+        self.tiger.send_commands(commands)
+
+    def trigger(self):
+        """Step to the next position, or start a timed sequence, as a TTL pulse would"""
+        self.tiger.send_command(self._command(Command.RBTRIGGER))
+
+    def pointer(self) -> int:
+        """The index of the position the next step will move to"""
+        response = self.tiger.send_command(
+            self._command(Command.RBMODE, {"Z": "?"}, flag_overrides=["?"])
+        )
+        return int(TigerController._dict_from_response(response)["Z"])
@@ -0,0 +1,87 @@
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Callable, Optional
+
+
+class ScheduledSerial(ABC):
+    """A pyserial ``Serial`` stand-in whose received bytes arrive at set times
+
+    Subclasses decide what arrives when, by calling ``_schedule`` from ``write``,
+    and which clock the arrival times are on, by implementing ``_now``.
+    """
+
+    def __init__(self, baudrate: Optional[int] = 115200, timeout=10.0):
+        self.baudrate = baudrate
+        self.timeout = timeout
+        self.is_open = True
+
+        self._pending_replies = deque()
+        self._received = bytearray()
+
+    @abstractmethod
+    def _now(self) -> float:
+        pass
+
+    def _schedule(self, ready_at: float, data: bytes):
+        self._pending_replies.append((ready_at, data))
+
+    def _pump(self, now: float):
+        while self._pending_replies and self._pending_replies[0][0] <= now:
+            self._received += self._pending_replies.popleft()[1]
+
+    def _wait_for(self, is_satisfied: Callable[[], bool]):
+        deadline = None if self.timeout is None else self._now() + self.timeout
+
+        while True:
+            now = self._now()
+            self._pump(now)
+
+            if is_satisfied():
+                return
+
+            ready_at = self._pending_replies[0][0] if self._pending_replies else None
+            if deadline is not None and (ready_at is None or ready_at > deadline):
+                time.sleep(max(deadline - now, 0.0))
+                self._pump(self._now())
+                return
+
+            if ready_at is None:
+                # No timeout and nothing will ever arrive
+                return
+
+            time.sleep(max(ready_at - now, 0.0))
+
+    @abstractmethod
+    def write(self, data: bytes) -> int:
+        pass
+
+    @property
+    def in_waiting(self) -> int:
+        self._pump(self._now())
+        return len(self._received)
+
+    def read(self, size: int = 1) -> bytes:
+        self._wait_for(lambda: len(self._received) >= size)
+
+        data = bytes(self._received[:size])
+        del self._received[:size]
+        return data
+
+    def readline(self) -> bytes:
+        self._wait_for(lambda: b"\n" in self._received)
+
+        end = self._received.find(b"\n") + 1 or len(self._received)
+        line = bytes(self._received[:end])
+        del self._received[:end]
+        return line
+
+    def reset_input_buffer(self):
+        self._pump(self._now())
+        self._received.clear()
+
+    def reset_output_buffer(self):
+        pass
+
+    def close(self):
+        self.is_open = False
@@ -1,12 +1,42 @@
 import logging
+from collections import deque
 from contextlib import contextmanager
+from typing import Optional, Union
 
 import serial
 
+from asitiger.command import Command
+from asitiger.errors import Errors
+from asitiger.timeoutpolicy import TimeoutPolicy
+from asitiger.wiretrace import WireTrace
+
 LOGGER = logging.getLogger(__name__)
 
 
 class SerialConnection:
+    """A connection to a Tiger controller, framing replies on its terminator
+
+    Received bytes are read in bulk into a local buffer and split into replies on
+    ``TERMINATOR``. Buffers are only flushed when bytes arrive that no command is
+    waiting for (e.g. the late reply to a command which timed out), which is
+    logged and counted in ``stray_bytes_discarded``.
+
+    With a ``timeout_policy``, each reply is waited for as long as the policy gives
+    its command. A reply which times out raises ``Errors.ReplyTimeoutError`` after
+    the link is resynchronized, and replies to other commands in flight then raise
+    ``Errors.ReplyDiscardedError``.
+    """
+
+    TERMINATOR = b"\r\n"
+
+    # A status query, answered with a bare status, then a WHO query, answered with
+    # "At ..." lines. Either reply alone could be a late reply to an earlier command,
+    # but the pair in a row is as good as unique
+    RESYNC_SENTINELS = (Command.STATUS, Command.WHO)
+    RESYNC_STATUS_REPLIES = (b"N", b"B")
+    RESYNC_WHO_PREFIX = b"At "
+    DEFAULT_RESYNC_ATTEMPTS = 3
+
     def __init__(
         self,
         port: str,
@@ -16,14 +46,32 @@ class SerialConnection:
         read_timeout_s: float = 10.0,
     ):
         LOGGER.debug(f"Connecting to {port} at {baud_rate} baud")
-        self.connection = serial.Serial(
-            port=port,
-            baudrate=baud_rate,
-            bytesize=serial.EIGHTBITS,
-            stopbits=serial.STOPBITS_ONE,
-            timeout=read_timeout_s,
+        self._attach(
+            serial.Serial(
+                port=port,
+                baudrate=baud_rate,
+                bytesize=serial.EIGHTBITS,
+                stopbits=serial.STOPBITS_ONE,
+                timeout=read_timeout_s,
+            )
         )
 
+    def _attach(self, serial_port):
+        # Anything exposing the pyserial ``Serial`` interface can back a connection,
+        # which is how simulated and replayed links plug in
+        self.connection = serial_port
+
+        self.stray_bytes_discarded = 0
+        self.metrics = None
+        self.trace = None
+        self.timeout_policy = None
+
+        self._read_timeout_s = serial_port.timeout
+        self._received = bytearray()
+        self._replies_pending = 0
+        self._reply_timeouts = deque()
+        self._replies_discarded = 0
+
     @classmethod
     @contextmanager
     def connection(cls, *args, **kwargs):
@@ -31,26 +79,202 @@ class SerialConnection:
         yield serial_connection
         serial_connection.disconnect()
 
+    @property
+    def baud_rate(self) -> int:
+        return self.connection.baudrate
+
+    @baud_rate.setter
+    def baud_rate(self, baud_rate: int):
+        LOGGER.debug(f"Switching to {baud_rate} baud")
+        self.connection.baudrate = baud_rate
+        self.reset_buffers()
+
+    @property
+    def read_timeout_s(self) -> float:
+        return self._read_timeout_s
+
+    @read_timeout_s.setter
+    def read_timeout_s(self, read_timeout_s: float):
+        self._read_timeout_s = read_timeout_s
+        self.connection.timeout = read_timeout_s
+
+    def _set_port_timeout(self, timeout_s: float):
+        # Reconfiguring a real port costs system calls, so only changes are applied
+        if self.connection.timeout != timeout_s:
+            self.connection.timeout = timeout_s
+
+    def enable_trace(self, capacity: int = 256, max_frame_bytes: int = 64) -> WireTrace:
+        """Keep the most recent frames in a ``WireTrace``, for post-mortems"""
+        self.trace = WireTrace(capacity=capacity, max_frame_bytes=max_frame_bytes)
+        return self.trace
+
+    def disable_trace(self):
+        self.trace = None
+
     def reset_buffers(self):
         self.connection.reset_input_buffer()
         self.connection.reset_output_buffer()
+        self._received.clear()
+        self._replies_pending = 0
+        self._reply_timeouts.clear()
+
+    def _discard_stray_bytes(self):
+        stray_bytes = len(self._received) + self.connection.in_waiting
+        if not stray_bytes:
+            return
 
-    def send(self, data: bytes):
+        LOGGER.warning(
+            f"Discarding {stray_bytes} received bytes no command is waiting for, "
+            f"the link was out of sync: {bytes(self._received)}"
+        )
+        self.stray_bytes_discarded += stray_bytes
         self.reset_buffers()
-        LOGGER.debug(f"Sending data: {data}")
+
+    def send(self, data: bytes, reset_buffers: bool = False):
+        if reset_buffers:
+            self.reset_buffers()
+        elif not self._replies_pending:
+            self._discard_stray_bytes()
+
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug(f"Sending data: {data}")
+        if self.trace is not None:
+            self.trace.record(WireTrace.SENT, data)
+
         self.connection.write(data)
 
-    def send_command(self, command: str):
-        encoded_command = f"{command}\r".encode("ascii")
-        self.send(encoded_command)
+        if self.metrics is not None:
+            self.metrics.record_bytes_sent(len(data))
+
+    def send_command(self, command: Union[str, bytes], reset_buffers: bool = False):
+        if isinstance(command, bytes):
+            encoded_command = command + b"\r"
+        else:
+            encoded_command = f"{command}\r".encode("ascii")
+        self.send(encoded_command, reset_buffers=reset_buffers)
+        self._replies_pending += 1
+        self._replies_discarded = 0
+
+        if self.timeout_policy is not None:
+            self._reply_timeouts.append(self.timeout_policy.timeout_for(command))
+
+    def _read_available(self) -> bool:
+        # Blocks for up to the port's timeout for the first byte, then takes
+        # everything else which has already arrived
+        data = self.connection.read(max(self.connection.in_waiting, 1))
+        self._received += data
+        return bool(data)
+
+    def read_response_bytes(self) -> bytes:
+        if self._replies_discarded:
+            self._replies_discarded -= 1
+            raise Errors.ReplyDiscardedError(
+                "Reply discarded while resynchronizing the link after a timeout"
+            )
+
+        timeout_s = self._reply_timeouts.popleft() if self._reply_timeouts else None
+        self._set_port_timeout(self._read_timeout_s if timeout_s is None else timeout_s)
+
+        end = self._received.find(self.TERMINATOR)
+
+        while end < 0:
+            if not self._read_available():
+                LOGGER.warning(
+                    f"Timed out waiting for a reply: {bytes(self._received)}"
+                )
+                if self.metrics is not None:
+                    self.metrics.record_timeout()
+                if self.trace is not None:
+                    self.trace.dump("Timed out waiting for a reply", logging.WARNING)
+                if timeout_s is not None:
+                    self._resync_after_timeout()
+                    raise Errors.ReplyTimeoutError(
+                        f"No reply within {timeout_s}s, the link was resynchronized"
+                    )
+                end = len(self._received)
+                break
+
+            end = self._received.find(self.TERMINATOR)
+
+        response_bytes = bytes(self._received[:end])
+        consumed = min(end + len(self.TERMINATOR), len(self._received))
+        del self._received[:consumed]
+        self._replies_pending = max(self._replies_pending - 1, 0)
+
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug(f"Received: {response_bytes}")
+        if self.trace is not None:
+            self.trace.record(WireTrace.RECEIVED, response_bytes)
+
+        if self.metrics is not None:
+            self.metrics.record_bytes_received(consumed)
+
+        return response_bytes.strip()
 
     def read_response(self) -> str:
-        response_bytes = self.connection.readline()
-        LOGGER.debug(f"Received: {response_bytes}")
+        return self.read_response_bytes().decode("ascii")
 
-        response = response_bytes.decode("ascii")
+    def _resync_after_timeout(self):
+        # The timed out reply is no longer awaited, but any others in flight are
+        replies_in_flight = max(self._replies_pending - 1, 0)
+        self.resync()
+        self._replies_discarded = replies_in_flight
 
-        return response.strip()
+    def _read_line(self) -> Optional[bytes]:
+        # The next reply, or None once the port's timeout passes without one
+        end = self._received.find(self.TERMINATOR)
+        while end < 0:
+            if not self._read_available():
+                return None
+            end = self._received.find(self.TERMINATOR)
+
+        response = bytes(self._received[:end]).strip()
+        del self._received[: end + len(self.TERMINATOR)]
+        return response
+
+    def resync(self, timeout_s: float = None, attempts: int = DEFAULT_RESYNC_ATTEMPTS):
+        """Restore framing by discarding everything up to the sentinel queries' replies
+
+        Each attempt flushes the buffers, sends the ``RESYNC_SENTINELS`` and reads
+        replies until theirs arrive as a pair, waiting up to ``timeout_s`` for each,
+        by default the status query's timeout in the ``timeout_policy``. After a
+        retry, replies to earlier attempts' sentinels are also waited out. Replies to
+        any commands in flight are lost.
+        """
+        if timeout_s is None:
+            policy = self.timeout_policy or TimeoutPolicy()
+            timeout_s = policy.timeout_for(Command.STATUS)
+
+        self._set_port_timeout(timeout_s)
+        sentinels = "".join(f"{sentinel}\r" for sentinel in self.RESYNC_SENTINELS)
+
+        for attempt in range(1, attempts + 1):
+            self.send(sentinels.encode("ascii"), reset_buffers=True)
+            previous = None
+
+            while True:
+                response = self._read_line()
+                if response is None:
+                    break
+
+                if previous in self.RESYNC_STATUS_REPLIES and response.startswith(
+                    self.RESYNC_WHO_PREFIX
+                ):
+                    if attempt > 1:
+                        # The pair may be from an earlier attempt, with this
+                        # attempt's still to come
+                        while self._read_line() is not None:
+                            pass
+
+                    LOGGER.info(f"Link resynchronized after {attempt} attempt(s)")
+                    return
+
+                LOGGER.debug(f"Read while resynchronizing: {response}")
+                previous = response
+
+        raise Errors.ResyncError(
+            f"No reply to {self.RESYNC_SENTINELS} after {attempts} attempts"
+        )
 
     def disconnect(self):
         LOGGER.debug("Disconnecting from serial port...")
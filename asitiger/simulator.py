@@ -0,0 +1,836 @@
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Callable, Iterable, List, Optional, Tuple
+
+from asitiger.asyncserialconnection import AsyncSerialConnection
+from asitiger.axis import Axis
+from asitiger.command import Command
+from asitiger.scheduledserial import ScheduledSerial
+from asitiger.serialconnection import SerialConnection
+from asitiger.tigercontroller import TigerController
+
+LOGGER = logging.getLogger(__name__)
+
+# 8 data bits, 1 stop bit and 1 start bit on the wire for every character
+BITS_PER_CHARACTER = 10
+
+TERMINATOR = b"\r\n"
+
+
+class SimulatedAxis:
+
+    # Positions are reported in tenths of microns, speeds are set in mm/s
+    UNITS_PER_MM = 10000
+
+    def __init__(
+        self,
+        label: str,
+        axis_type: Axis.Type = Axis.Type.XY_MOTOR,
+        address: str = "1",
+        speed_mm_s: float = 1.0,
+        position: float = 0.0,
+        home_position: float = 0.0,
+        travel_limits: Tuple[float, float] = (-1e7, 1e7),
+    ):
+        self.label = label
+        self.type = axis_type
+        self.address = address
+        self.speed_mm_s = speed_mm_s
+        self.home_position = home_position
+        self.lower_limit, self.upper_limit = travel_limits
+        self.enabled = True
+
+        self._start_position = position
+        self._target = position
+        self._start_time = 0.0
+
+    def _travel_time(self) -> float:
+        distance = abs(self._target - self._start_position)
+        return distance / (self.speed_mm_s * self.UNITS_PER_MM)
+
+    def position(self, now: float) -> float:
+        elapsed = now - self._start_time
+        travel_time = self._travel_time()
+
+        if elapsed >= travel_time or travel_time == 0:
+            return self._target
+
+        fraction = max(elapsed, 0.0) / travel_time
+        return self._start_position + (self._target - self._start_position) * fraction
+
+    def is_busy(self, now: float) -> bool:
+        return now - self._start_time < self._travel_time()
+
+    def move_to(self, target: float, now: float):
+        target = min(max(target, self.lower_limit), self.upper_limit)
+
+        self._start_position = self.position(now)
+        self._target = target
+        self._start_time = now
+
+    def halt(self, now: float):
+        self.set_position(self.position(now), now)
+
+    def set_position(self, position: float, now: float):
+        self._start_position = position
+        self._target = position
+        self._start_time = now
+
+    def status_byte(self, now: float) -> int:
+        busy = self.is_busy(now)
+        position = self.position(now)
+
+        return (
+            busy
+            | self.enabled << 1
+            | busy << 2
+            | busy << 4
+            | (busy and self._target > self._start_position) << 5
+            | (position >= self.upper_limit) << 6
+            | (position <= self.lower_limit) << 7
+        )
+
+
+class SimulatedRingBuffer:
+    """The ring buffer on one card, see ``asitiger.ringbuffer.RingBuffer``"""
+
+    TTL_MODE = 0
+    ONE_SHOT_MODE = 1
+
+    # The TTL X mode in which an input pulse steps the ring buffer
+    TTL_INPUT_ADVANCE = 1
+
+    def __init__(self):
+        self.points = []
+        self.axis_byte = 0
+        self.mode = self.TTL_MODE
+        self.ttl_input_mode = 0
+        self.delay_s = 0.0
+        self.steps_taken = 0
+
+        self._running_since = None
+        self._steps_at_start = 0
+
+    @property
+    def pointer(self) -> int:
+        return self.steps_taken % len(self.points) if self.points else 0
+
+    def clear(self):
+        self.points = []
+        self.steps_taken = 0
+        self._running_since = None
+
+    def trigger(self, axes: List[SimulatedAxis], now: float):
+        if not self.points:
+            return
+
+        if self.mode == self.TTL_MODE or not self.delay_s:
+            self._step(axes, now)
+        else:
+            self._running_since = now
+            self._steps_at_start = self.steps_taken
+
+    def advance(self, axes: List[SimulatedAxis], now: float):
+        """Take any timed steps which have come due by ``now``"""
+        if self._running_since is None:
+            return
+
+        steps_due = int((now - self._running_since) / self.delay_s) + 1
+        if self.mode == self.ONE_SHOT_MODE:
+            steps_due = min(steps_due, len(self.points))
+
+        while self.steps_taken - self._steps_at_start < steps_due:
+            step = self.steps_taken - self._steps_at_start
+            self._step(axes, self._running_since + step * self.delay_s)
+
+        if self.mode == self.ONE_SHOT_MODE and steps_due == len(self.points):
+            self._running_since = None
+
+    def _step(self, axes: List[SimulatedAxis], now: float):
+        point = self.points[self.pointer]
+        enabled_axes = [
+            axis for bit, axis in enumerate(axes) if self.axis_byte & (1 << bit)
+        ]
+
+        for axis in enabled_axes:
+            if axis.label in point:
+                axis.move_to(point[axis.label], now)
+
+        self.steps_taken += 1
+
+
+class SimulatedScan:
+    """The SCAN module on one card, see ``asitiger.rasterscan.RasterScan``"""
+
+    IDLE = "I"
+    RUNNING = "S"
+    SERPENTINE = 1
+
+    def __init__(self):
+        self.fast_index = 0
+        self.slow_index = 1
+        self.pattern = 0
+        self.fast_range_mm = [0.0, 0.0]
+        self.slow_range_mm = [0.0, 0.0]
+        self.num_lines = 1
+        self.settle_s = 0.0
+
+        self._moves = deque()
+        self._finishes_at = None
+
+    def state(self, now: float) -> str:
+        running = self._finishes_at is not None and now < self._finishes_at
+        return self.RUNNING if running else self.IDLE
+
+    def start(self, axes: List[SimulatedAxis], now: float):
+        """Plan every move of the scan, to be made as ``advance`` reaches them"""
+        fast, slow = axes[self.fast_index], axes[self.slow_index]
+        fast_position, slow_position = fast.position(now), slow.position(now)
+        fast_start, fast_stop = (
+            value * SimulatedAxis.UNITS_PER_MM for value in self.fast_range_mm
+        )
+        slow_start, slow_stop = (
+            value * SimulatedAxis.UNITS_PER_MM for value in self.slow_range_mm
+        )
+
+        def travel_time(axis, start, stop):
+            return abs(stop - start) / (axis.speed_mm_s * SimulatedAxis.UNITS_PER_MM)
+
+        at = now
+        for line in range(self.num_lines):
+            slow_target = slow_start
+            if self.num_lines > 1:
+                slow_target += (slow_stop - slow_start) * line / (self.num_lines - 1)
+
+            begin, end = fast_start, fast_stop
+            if self.pattern == self.SERPENTINE and line % 2:
+                begin, end = end, begin
+
+            self._moves.append((at, {fast: begin, slow: slow_target}))
+            at += self.settle_s + max(
+                travel_time(fast, fast_position, begin),
+                travel_time(slow, slow_position, slow_target),
+            )
+
+            self._moves.append((at, {fast: end}))
+            at += travel_time(fast, begin, end)
+
+            fast_position, slow_position = end, slow_target
+
+        self._finishes_at = at
+
+    def stop(self, axes: List[SimulatedAxis], now: float):
+        self.advance(now)
+        self._moves.clear()
+        self._finishes_at = None
+        for axis in axes:
+            axis.halt(now)
+
+    def advance(self, now: float):
+        """Make any moves which have come due by ``now``"""
+        while self._moves and self._moves[0][0] <= now:
+            at, targets = self._moves.popleft()
+            for axis, target in targets.items():
+                axis.move_to(target, at)
+
+
+class SimulatedTiger:
+    """A model of a TG-1000 that answers serial commands the way the hardware does"""
+
+    CARD_NAMES = {
+        Axis.Type.XY_MOTOR: "XYMotor",
+        Axis.Type.Z_MOTOR: "ZMotor",
+        Axis.Type.PIEZO: "Piezo",
+        Axis.Type.MULTI_LED: "LED",
+        Axis.Type.SLIDER: "Slider",
+        Axis.Type.TURRET: "Turret",
+    }
+
+    def __init__(
+        self,
+        axes: List[SimulatedAxis] = None,
+        processing_time_s: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+        baud_rate: Optional[int] = None,
+        supported_baud_rates: Iterable[int] = None,
+    ):
+        if axes is None:
+            axes = self.default_axes()
+
+        self.axes = OrderedDict((axis.label, axis) for axis in axes)
+        self.processing_time_s = processing_time_s
+        self.clock = clock
+
+        # Links at any other rate only carry garbage, None accepts every rate
+        self.baud_rate = baud_rate
+        # BAUD commands for any other rate are rejected, None accepts every rate
+        self.supported_baud_rates = (
+            None if supported_baud_rates is None else set(supported_baud_rates)
+        )
+
+        self.card_settings = {}
+        self.ring_buffers = {
+            address: SimulatedRingBuffer() for address in self._card_addresses()
+        }
+        self.scans = {address: SimulatedScan() for address in self._card_addresses()}
+        self.commands_received = 0
+
+        self._lock = threading.Lock()
+        self._handlers = {
+            Command.BAUD: self._baud,
+            Command.BUILD: self._build,
+            Command.HALT: self._halt,
+            Command.HERE: self._here,
+            Command.HOME: self._home,
+            Command.LED: self._card_setting,
+            Command.LOAD: self._load,
+            Command.MOTCTRL: self._motor_control,
+            Command.MOVE: self._move,
+            Command.MOVREL: self._move_relative,
+            Command.RBMODE: self._rbmode,
+            Command.RBTRIGGER: self._rbtrigger,
+            Command.RDSTAT: self._rdstat,
+            Command.SCAN: self._scan,
+            Command.SCANR: self._scan_range,
+            Command.SCANV: self._scan_range,
+            Command.SECURE: self._card_setting,
+            Command.SETHOME: self._set_home,
+            Command.SPEED: self._speed,
+            Command.STATUS: self._status,
+            Command.TTL: self._ttl,
+            Command.WHERE: self._where,
+            Command.WHO: self._who,
+        }
+
+    @staticmethod
+    def default_axes() -> List[SimulatedAxis]:
+        return [
+            SimulatedAxis("X", Axis.Type.XY_MOTOR, "1", speed_mm_s=7.5),
+            SimulatedAxis("Y", Axis.Type.XY_MOTOR, "1", speed_mm_s=7.5),
+            SimulatedAxis("Z", Axis.Type.Z_MOTOR, "2", speed_mm_s=1.2),
+        ]
+
+    def handle(self, command: str, now: float = None) -> str:
+        """Process one command (without its terminator) and return the reply line"""
+        now = self.clock() if now is None else now
+
+        with self._lock:
+            self.commands_received += 1
+
+            for address, ring_buffer in self.ring_buffers.items():
+                ring_buffer.advance(self._axes_on_card(address), now)
+            for scan in self.scans.values():
+                scan.advance(now)
+
+            return self._dispatch(command.strip(), now)
+
+    def is_busy(self, now: float = None) -> bool:
+        now = self.clock() if now is None else now
+        return any(axis.is_busy(now) for axis in self.axes.values())
+
+    def ttl_pulse(self, card_address: str, now: float = None):
+        """A pulse on a card's TTL input, which only steps its ring buffer in TTL X=1"""
+        now = self.clock() if now is None else now
+
+        with self._lock:
+            ring_buffer = self.ring_buffers[card_address]
+            if ring_buffer.ttl_input_mode == ring_buffer.TTL_INPUT_ADVANCE:
+                ring_buffer.trigger(self._axes_on_card(card_address), now)
+
+    def _dispatch(self, command: str, now: float) -> str:
+        if not command:
+            return ":N-1"
+
+        try:
+            card_address, verb, args = self._parse(command)
+
+            handler = self._handlers.get(verb)
+            if handler is None:
+                return ":N-1"
+
+            if card_address and card_address not in self._card_addresses():
+                return ":N-7"
+
+            return handler(verb, args, card_address, now)
+        except KeyError:
+            return ":N-2"
+        except ValueError:
+            return ":N-4"
+
+    @staticmethod
+    def _parse(command: str) -> Tuple[str, str, List[Tuple[str, str, str]]]:
+        head, *tokens = command.split()
+        head = head.upper()
+
+        card_address = ""
+        while head[:1].isdigit():
+            card_address += head[0]
+            head = head[1:]
+
+        args = []
+        for token in tokens:
+            axis, flag, value = token[0].upper(), token[1:2], token[2:]
+            if flag not in ("=", "?", "+", "-", ""):
+                raise KeyError(token)
+            args.append((axis, flag, value))
+
+        return card_address, head, args
+
+    def _card_addresses(self) -> List[str]:
+        return list(OrderedDict.fromkeys(axis.address for axis in self.axes.values()))
+
+    def _axes_on_card(self, card_address: str) -> List[SimulatedAxis]:
+        return [
+            axis
+            for axis in self.axes.values()
+            if not card_address or axis.address == card_address
+        ]
+
+    @staticmethod
+    def _format_position(position: float) -> str:
+        return f"{position:.1f}"
+
+    # Command handlers
+
+    def _baud(self, verb, args, card_address, now) -> str:
+        codes = {code: rate for rate, code in TigerController.BAUD_RATE_CODES.items()}
+
+        for parameter, flag, value in args:
+            if parameter != "X" or flag != "=":
+                return ":N-2"
+            baud_rate = codes.get(int(value))
+            if baud_rate is None or (
+                self.supported_baud_rates is not None
+                and baud_rate not in self.supported_baud_rates
+            ):
+                return ":N-4"
+            # The reply still goes out at the old rate
+            self.baud_rate = baud_rate
+
+        return ":A"
+
+    def _build(self, verb, args, card_address, now) -> str:
+        axes = self._axes_on_card(card_address)
+
+        if card_address:
+            header = self.CARD_NAMES.get(axes[0].type, "Card")
+        else:
+            header = "TIGER_COMM"
+
+        lines = [
+            header,
+            "Motor Axes: " + " ".join(axis.label for axis in axes),
+            "Axis Types: " + " ".join(axis.type.value for axis in axes),
+            "Axis Addr: " + " ".join(axis.address for axis in axes),
+            "Hex Addr: " + " ".join(f"{ord(axis.address):x}" for axis in axes),
+        ]
+
+        return "\r".join(lines)
+
+    def _halt(self, verb, args, card_address, now) -> str:
+        for axis in self.axes.values():
+            axis.halt(now)
+
+        return ":A"
+
+    def _here(self, verb, args, card_address, now) -> str:
+        for label, _, value in args:
+            self.axes[label].set_position(float(value) if value else 0.0, now)
+
+        return ":A"
+
+    def _home(self, verb, args, card_address, now) -> str:
+        for label, _, _ in args:
+            axis = self.axes[label]
+            axis.move_to(axis.home_position, now)
+
+        return ":A"
+
+    def _card_setting(self, verb, args, card_address, now) -> str:
+        settings = self.card_settings.setdefault((card_address, verb), {})
+        queried = []
+
+        for channel, flag, value in args:
+            if flag == "?":
+                queried.append(f"{channel}={settings.get(channel, 0)}")
+            elif flag == "=":
+                float(value)
+                settings[channel] = value
+            else:
+                return ":N-3"
+
+        return " ".join([":A"] + queried)
+
+    def _ring_buffer_card(self, card_address: str, args) -> str:
+        if card_address:
+            return card_address
+
+        # Unaddressed commands go to the card of the first axis they mention
+        labels = [label for label, _, _ in args if label in self.axes]
+        return self.axes[labels[0]].address if labels else self._card_addresses()[0]
+
+    def _load(self, verb, args, card_address, now) -> str:
+        address = self._ring_buffer_card(card_address, args)
+        card_labels = [axis.label for axis in self._axes_on_card(address)]
+
+        point = {}
+        for label, flag, value in args:
+            if flag != "=":
+                return ":N-3"
+            if label not in card_labels:
+                return ":N-2"
+            point[label] = float(value)
+
+        self.ring_buffers[address].points.append(point)
+        return ":A"
+
+    def _rbmode(self, verb, args, card_address, now) -> str:
+        ring_buffer = self.ring_buffers[self._ring_buffer_card(card_address, [])]
+        queried = []
+
+        for parameter, flag, value in args:
+            if flag == "?":
+                current = {
+                    "Y": ring_buffer.axis_byte,
+                    "Z": ring_buffer.pointer,
+                    "F": ring_buffer.mode,
+                }[parameter]
+                queried.append(f"{parameter}={current}")
+            elif parameter == "X" and value == "0":
+                ring_buffer.clear()
+            elif parameter == "Y":
+                ring_buffer.axis_byte = int(value)
+            elif parameter == "F":
+                ring_buffer.mode = int(value)
+            else:
+                return ":N-2"
+
+        return " ".join([":A"] + queried)
+
+    def _ttl(self, verb, args, card_address, now) -> str:
+        address = self._ring_buffer_card(card_address, [])
+        reply = self._card_setting(verb, args, address, now)
+
+        for parameter, flag, value in args:
+            if parameter == "X" and flag == "=":
+                self.ring_buffers[address].ttl_input_mode = int(float(value))
+
+        return reply
+
+    def _rbtrigger(self, verb, args, card_address, now) -> str:
+        address = self._ring_buffer_card(card_address, [])
+        ring_buffer = self.ring_buffers[address]
+
+        if not args:
+            ring_buffer.trigger(self._axes_on_card(address), now)
+            return ":A"
+
+        for parameter, flag, value in args:
+            if parameter != "F" or flag != "=":
+                return ":N-2"
+            ring_buffer.delay_s = float(value) / 1000
+
+        return ":A"
+
+    def _scan(self, verb, args, card_address, now) -> str:
+        address = self._ring_buffer_card(card_address, [])
+        scan = self.scans[address]
+        queried = []
+
+        for parameter, flag, value in args:
+            if flag == "?":
+                current = {
+                    "X": scan.state(now),
+                    "Y": scan.fast_index,
+                    "Z": scan.slow_index,
+                    "F": scan.pattern,
+                }[parameter]
+                queried.append(f"{parameter}={current}")
+            elif parameter == "X" and value.upper() == "S":
+                scan.start(self._axes_on_card(address), now)
+            elif parameter == "X" and value.upper() == "P":
+                scan.stop(self._axes_on_card(address), now)
+            elif parameter == "Y":
+                scan.fast_index = int(value)
+            elif parameter == "Z":
+                scan.slow_index = int(value)
+            elif parameter == "F":
+                scan.pattern = int(value)
+            else:
+                return ":N-2"
+
+        return " ".join([":A"] + queried)
+
+    def _scan_range(self, verb, args, card_address, now) -> str:
+        # NR sets the fast axis' range, NV the slow axis' range, lines and settle time
+        scan = self.scans[self._ring_buffer_card(card_address, [])]
+        scan_range = scan.fast_range_mm if verb == Command.SCANR else scan.slow_range_mm
+
+        for parameter, flag, value in args:
+            if flag != "=":
+                return ":N-3"
+            if parameter in ("X", "Y"):
+                scan_range["XY".index(parameter)] = float(value)
+            elif verb == Command.SCANV and parameter == "Z":
+                scan.num_lines = int(value)
+            elif verb == Command.SCANV and parameter == "F":
+                scan.settle_s = float(value) / 1000
+            else:
+                return ":N-2"
+
+        return ":A"
+
+    def _motor_control(self, verb, args, card_address, now) -> str:
+        for label, flag, _ in args:
+            axis = self.axes[label]
+            if flag == "+":
+                axis.enabled = True
+            elif flag == "-":
+                axis.halt(now)
+                axis.enabled = False
+            else:
+                return ":N-3"
+
+        return ":A"
+
+    def _move_axes(self, args, now, relative: bool) -> str:
+        targets = []
+        for label, flag, value in args:
+            axis = self.axes[label]
+            if flag != "=":
+                return ":N-3"
+            if not axis.enabled:
+                return ":N-5"
+
+            offset = axis.position(now) if relative else 0.0
+            targets.append((axis, offset + float(value)))
+
+        for axis, target in targets:
+            axis.move_to(target, now)
+
+        return ":A"
+
+    def _move(self, verb, args, card_address, now) -> str:
+        return self._move_axes(args, now, relative=False)
+
+    def _move_relative(self, verb, args, card_address, now) -> str:
+        return self._move_axes(args, now, relative=True)
+
+    def _rdstat(self, verb, args, card_address, now) -> str:
+        statuses = []
+        for label, flag, _ in args:
+            axis = self.axes[label]
+            if flag == "?":
+                statuses.append("B" if axis.is_busy(now) else "N")
+            else:
+                statuses.append(str(axis.status_byte(now)))
+
+        return " ".join([":A"] + statuses)
+
+    def _set_home(self, verb, args, card_address, now) -> str:
+        for label, flag, value in args:
+            axis = self.axes[label]
+            axis.home_position = float(value) if flag == "=" else axis.position(now)
+
+        return ":A"
+
+    def _speed(self, verb, args, card_address, now) -> str:
+        queried = []
+
+        for label, flag, value in args:
+            axis = self.axes[label]
+            if flag == "?":
+                queried.append(f"{label}={axis.speed_mm_s:.6f}")
+            elif flag == "=":
+                speed = float(value)
+                if speed <= 0:
+                    return ":N-4"
+                axis.speed_mm_s = speed
+            else:
+                return ":N-3"
+
+        return " ".join([":A"] + queried)
+
+    def _status(self, verb, args, card_address, now) -> str:
+        return "B" if self.is_busy(now) else "N"
+
+    def _where(self, verb, args, card_address, now) -> str:
+        positions = [
+            self._format_position(self.axes[label].position(now))
+            for label, _, _ in args
+        ]
+
+        return " ".join([":A"] + positions)
+
+    def _who(self, verb, args, card_address, now) -> str:
+        lines = ["At 30: Comm"]
+
+        for address in self._card_addresses():
+            axes = self._axes_on_card(address)
+            card = ",".join(
+                f"{axis.label}:{self.CARD_NAMES.get(axis.type, 'Axis')}"
+                for axis in axes
+            )
+            lines.append(f"At {ord(address):x}: {card}")
+
+        return "\r".join(lines)
+
+
+class SimulatedSerial(ScheduledSerial):
+    """A pyserial ``Serial`` stand-in wired to a ``SimulatedTiger``
+
+    Replies only become readable once the command and reply would have crossed
+    the wire at ``baudrate`` and the controller has spent ``processing_time_s``
+    on the command. A ``baudrate`` of ``None`` disables wire delays.
+    """
+
+    def __init__(
+        self, tiger: SimulatedTiger, baudrate: Optional[int] = 115200, timeout=10.0,
+    ):
+        super().__init__(baudrate=baudrate, timeout=timeout)
+        self.tiger = tiger
+
+        self._partial_command = bytearray()
+        self._wire_free_at = 0.0
+
+    def _now(self) -> float:
+        return self.tiger.clock()
+
+    def _character_time(self) -> float:
+        if not self.baudrate:
+            return 0.0
+        return BITS_PER_CHARACTER / self.baudrate
+
+    def write(self, data: bytes) -> int:
+        now = self._now()
+        character_time = self._character_time()
+
+        for index, byte in enumerate(data):
+            if byte != ord("\r"):
+                self._partial_command.append(byte)
+                continue
+
+            command = self._partial_command.decode("ascii")
+            self._partial_command.clear()
+
+            if self.tiger.baud_rate and self.baudrate != self.tiger.baud_rate:
+                continue
+
+            arrived_at = now + (index + 1) * character_time
+            reply = self.tiger.handle(command, now=arrived_at).encode("ascii")
+            reply += TERMINATOR
+
+            start = max(arrived_at + self.tiger.processing_time_s, self._wire_free_at)
+            self._wire_free_at = start + len(reply) * character_time
+            self._schedule(self._wire_free_at, reply)
+
+        return len(data)
+
+
+class SimulatedConnection(SerialConnection):
+    """A ``SerialConnection`` talking to an in-process ``SimulatedTiger``"""
+
+    def __init__(
+        self,
+        tiger: SimulatedTiger = None,
+        baud_rate: Optional[int] = 115200,
+        read_timeout_s: float = 10.0,
+    ):
+        self.tiger = tiger if tiger is not None else SimulatedTiger()
+        self._attach(
+            SimulatedSerial(self.tiger, baudrate=baud_rate, timeout=read_timeout_s)
+        )
+
+
+class SimulatedTigerPty:
+    """Serves a ``SimulatedTiger`` on a pseudo-terminal so it can be opened by path
+
+    The ``port`` attribute can be passed anywhere a serial device path is expected,
+    e.g. ``TigerController.from_serial_port(pty.port)``. POSIX only.
+    """
+
+    def __init__(self, tiger: SimulatedTiger = None, baud_rate: Optional[int] = 115200):
+        self.tiger = tiger if tiger is not None else SimulatedTiger()
+        self.baud_rate = baud_rate
+
+        # tty is POSIX only, so it's only imported once a pty is actually wanted
+        import tty
+
+        self._master, self._slave = os.openpty()
+        tty.setraw(self._master)
+        tty.setraw(self._slave)
+        self.port = os.ttyname(self._slave)
+
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> "SimulatedTigerPty":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _character_time(self) -> float:
+        if not self.baud_rate:
+            return 0.0
+        return BITS_PER_CHARACTER / self.baud_rate
+
+    def _serve(self):
+        import select
+
+        partial_command = bytearray()
+
+        while not self._stopped.is_set():
+            readable, _, _ = select.select([self._master], [], [], 0.05)
+            if not readable:
+                continue
+
+            try:
+                data = os.read(self._master, 1024)
+            except OSError:
+                return
+
+            for byte in data:
+                if byte != ord("\r"):
+                    partial_command.append(byte)
+                    continue
+
+                command = partial_command.decode("ascii")
+                partial_command.clear()
+
+                time.sleep((len(command) + 1) * self._character_time())
+                reply = self.tiger.handle(command).encode("ascii") + TERMINATOR
+                time.sleep(
+                    self.tiger.processing_time_s + len(reply) * self._character_time()
+                )
+
+                LOGGER.debug(f"Simulator replying to {command!r} with {reply!r}")
+                os.write(self._master, reply)
+
+    def close(self):
+        self._stopped.set()
+        self._thread.join()
+        os.close(self._master)
+        os.close(self._slave)
+
+
+class AsyncSimulatedConnection(AsyncSerialConnection):
+    """An ``AsyncSerialConnection`` talking to an in-process ``SimulatedTiger``"""
+
+    def __init__(
+        self,
+        tiger: SimulatedTiger = None,
+        baud_rate: Optional[int] = 115200,
+        read_timeout_s: float = 10.0,
+        poll_interval_s: float = AsyncSerialConnection.DEFAULT_POLL_INTERVAL_S,
+    ):
+        self.tiger = tiger if tiger is not None else SimulatedTiger()
+        self._attach(
+            SimulatedSerial(self.tiger, baudrate=baud_rate, timeout=0),
+            read_timeout_s,
+            poll_interval_s,
+        )
@@ -0,0 +1,64 @@
+from collections import OrderedDict, namedtuple
+from typing import Dict, Optional, Tuple
+
+from asitiger.axis import Axis
+from asitiger.status import Status
+
+AxisState = namedtuple("AxisState", ["position", "status", "speed"])
+
+
+class Snapshot(
+    namedtuple("Snapshot", ["timestamp", "axes", "positions", "statuses", "speeds"])
+):
+    """The state of a set of axes at one moment, from ``TigerController.snapshot``
+
+    ``positions``, ``statuses`` and ``speeds`` are tuples in the order of ``axes``,
+    and ``timestamp`` is the ``time.monotonic`` time the replies were read.
+    ``speeds`` is ``None`` if they weren't queried.
+    """
+
+    __slots__ = ()
+
+    # Axes without a position to report, left out of snapshots by default
+    NON_POSITIONING_TYPES = frozenset(
+        [Axis.Type.DAC, Axis.Type.LOGIC, Axis.Type.MULTI_LED, Axis.Type.SHUTTER]
+    )
+
+    @property
+    def busy(self) -> bool:
+        return any(status.status is Status.BUSY for status in self.statuses)
+
+    def axis(self, label: str) -> AxisState:
+        index = self.axes.index(label)
+        speed = self.speeds[index] if self.speeds is not None else None
+
+        return AxisState(self.positions[index], self.statuses[index], speed)
+
+    def as_dict(self) -> Dict[str, AxisState]:
+        return OrderedDict((label, self.axis(label)) for label in self.axes)
+
+    def diff(
+        self, previous: Optional["Snapshot"]
+    ) -> Dict[str, Dict[str, Tuple[object, object]]]:
+        """What changed since ``previous``, as ``(old, new)`` pairs per axis and field
+
+        Axes missing from either snapshot have ``None`` for their old or new values.
+        """
+        before = previous.as_dict() if previous is not None else {}
+        after = self.as_dict()
+        empty = AxisState(None, None, None)
+
+        changes = OrderedDict()
+        for label in list(after) + [label for label in before if label not in after]:
+            old = before.get(label, empty)
+            new = after.get(label, empty)
+
+            fields = OrderedDict(
+                (field, (old_value, new_value))
+                for field, old_value, new_value in zip(AxisState._fields, old, new)
+                if old_value != new_value
+            )
+            if fields:
+                changes[label] = fields
+
+        return changes
@@ -1,7 +1,7 @@
 import re
 from collections import namedtuple
 from enum import Enum
-from typing import List, Union
+from typing import Iterable, List, Union
 
 
 class Status(Enum):
@@ -71,8 +71,8 @@ AxisStatus = namedtuple(
 )
 
 
-def status_from_decimal(status_byte_dec: Union[str, int]) -> AxisStatus:
-    status_bits = list(map(int, f"{int(status_byte_dec):08b}"))
+def _decode_status_byte(status_byte: int) -> AxisStatus:
+    status_bits = list(map(int, f"{status_byte:08b}"))
 
     statuses = [
         EnumClass(bit)
@@ -82,11 +82,38 @@ def status_from_decimal(status_byte_dec: Union[str, int]) -> AxisStatus:
     return AxisStatus(*statuses)
 
 
+# Every possible status byte, decoded once up front
+_STATUS_TABLE = tuple(_decode_status_byte(status_byte) for status_byte in range(256))
+
+_FLAG_STATUSES = {status.value: status for status in Status}
+
+# See statuses_for_rdstat for why the tokens aren't simply split on whitespace.
+# Neither character of the ":A" acknowledgement matches, so it needn't be skipped
+_RDSTAT_TOKEN_REGEX = re.compile(r"\d+|[BN]")
+
+# One uint8 field per status bit, in the same order as AxisStatus, so that an array
+# of unpacked status bits can be viewed as a structured array without copying
+STATUS_BITS_DTYPE = [(field, "u1") for field in AxisStatus._fields]
+
+
+def status_from_decimal(status_byte_dec: Union[str, int]) -> AxisStatus:
+    status_byte = int(status_byte_dec)
+    if not 0 <= status_byte <= 0xFF:
+        raise ValueError(f"Status byte {status_byte_dec!r} is out of range")
+
+    return _STATUS_TABLE[status_byte]
+
+
+def statuses_from_decimals(status_bytes: Iterable[Union[str, int]]) -> List[AxisStatus]:
+    return list(map(status_from_decimal, status_bytes))
+
+
 def status_for_rdstat(axis_response: str) -> Union[Status, AxisStatus]:
-    try:
-        return Status(axis_response)
-    except ValueError:
-        return status_from_decimal(axis_response)
+    status = _FLAG_STATUSES.get(axis_response)
+    if status is not None:
+        return status
+
+    return status_from_decimal(axis_response)
 
 
 def statuses_for_rdstat(response: str) -> List[AxisStatus]:
@@ -94,8 +121,33 @@ def statuses_for_rdstat(response: str) -> List[AxisStatus]:
     # is inconsistent with its use of spaces in its responses, e.g.:
     # $ RS X Y? Z
     # :A  10N 138
-    # Note there is NO space between the X and Y responses for some reason
-    axis_responses = re.split(r"(\d+|[BN]|\s+)", response)
-    axis_responses = " ".join(axis_responses).split()[1:]
+    # Note there is NO space between the X and Y responses for some reason,
+    # so tokens are matched directly
+    axis_responses = _RDSTAT_TOKEN_REGEX.findall(response)
 
     return list(map(status_for_rdstat, axis_responses))
+
+
+def status_bytes_for_rdstat(response: str):
+    """Parse the status bytes of an ``RS`` response (without ``?`` flags) into an array
+
+    Requires numpy.
+    """
+    import numpy as np
+
+    return np.array(_RDSTAT_TOKEN_REGEX.findall(response), dtype=np.uint8)
+
+
+def decode_status_bytes(status_bytes):
+    """Decode many status bytes at once into a structured array of status bits
+
+    The fields are named like those of ``AxisStatus`` and hold each bit as 0 or 1,
+    e.g. ``decode_status_bytes(values)["status"]`` is 1 for every busy axis.
+    Requires numpy.
+    """
+    import numpy as np
+
+    status_bytes = np.asarray(status_bytes, dtype=np.uint8).reshape(-1, 1)
+    status_bits = (status_bytes >> np.arange(8, dtype=np.uint8)) & 1
+
+    return np.ascontiguousarray(status_bits).view(STATUS_BITS_DTYPE).reshape(-1)
@@ -0,0 +1,202 @@
+import logging
+import queue
+import threading
+from collections import deque
+from concurrent.futures import Future
+from typing import Iterable, List, Union
+
+from asitiger.errors import Errors
+from asitiger.rawresponse import RawResponse
+from asitiger.serialconnection import SerialConnection
+from asitiger.tigercontroller import TigerController
+
+LOGGER = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class ThreadedTigerController(TigerController):
+    """A ``TigerController`` which many threads can share
+
+    A single I/O thread owns the serial connection. Callers submit commands through
+    a queue and get futures back, and every blocking method waits on its own future,
+    so no lock is held while callers sleep (e.g. in ``wait_until_idle``). Commands
+    queued by different threads at the same time are pipelined together.
+    """
+
+    def __init__(
+        self,
+        serial_connection: SerialConnection,
+        poll_interval_s: float = TigerController.DEFAULT_POLL_INTERVAL_S,
+        pipeline_window: int = TigerController.DEFAULT_PIPELINE_WINDOW,
+        pipeline_max_bytes: int = TigerController.DEFAULT_PIPELINE_MAX_BYTES,
+    ):
+        super().__init__(serial_connection, poll_interval_s=poll_interval_s)
+        self.pipeline_window = pipeline_window
+        self.pipeline_max_bytes = pipeline_max_bytes
+
+        self._requests = queue.Queue()
+        self._closed = False
+        # Held while checking _closed and queueing, so nothing is queued after _STOP
+        self._submit_lock = threading.Lock()
+        self._io_thread = threading.Thread(
+            target=self._run_io, name="asitiger-io", daemon=True
+        )
+        self._io_thread.start()
+
+    def __enter__(self) -> "ThreadedTigerController":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Finish the commands already submitted and stop the I/O thread"""
+        with self._submit_lock:
+            if self._closed:
+                return
+
+            self._closed = True
+            self._requests.put((_STOP, None))
+
+        self._io_thread.join()
+
+    def _submit(self, request) -> Future:
+        future = Future()
+
+        with self._submit_lock:
+            if self._closed:
+                raise RuntimeError("Cannot submit commands to a closed controller")
+
+            self._requests.put((request, future))
+
+        return future
+
+    def submit_command(self, command: str) -> Future:
+        """Queue a command, returning a future which resolves to its response"""
+        if self.cache is not None:
+            self.cache.invalidate_for(command)
+
+        return self._submit(command)
+
+    def send_command(self, command: str) -> str:
+        if self.cache is not None:
+            return self.cache.fetch(command, lambda query: self._submit(query).result())
+
+        return self.submit_command(command).result()
+
+    def send_command_raw(self, command: Union[str, bytes]) -> RawResponse:
+        return self._submit(
+            lambda: TigerController.send_command_raw(self, command)
+        ).result()
+
+    def send_commands(
+        self,
+        commands: Iterable[str],
+        window: int = TigerController.DEFAULT_PIPELINE_WINDOW,
+        max_bytes_in_flight: int = TigerController.DEFAULT_PIPELINE_MAX_BYTES,
+    ) -> List[str]:
+        # Runs as one request on the I/O thread so the batch isn't interleaved
+        commands = list(commands)
+        return self._submit(
+            lambda: TigerController.send_commands(
+                self, commands, window=window, max_bytes_in_flight=max_bytes_in_flight
+            )
+        ).result()
+
+    def _run_io(self):
+        pending = deque()
+
+        while True:
+            request, future = pending.popleft() if pending else self._requests.get()
+
+            if request is _STOP:
+                self._fail_unfinished(pending)
+                return
+
+            if not isinstance(request, str):
+                self._run_request(request, future)
+                continue
+
+            batch = [(request, future)]
+            batch_bytes = len(request) + 1
+
+            while len(batch) < self.pipeline_window:
+                try:
+                    queued = self._requests.get_nowait()
+                except queue.Empty:
+                    break
+
+                queued_bytes = len(queued[0]) + 1 if isinstance(queued[0], str) else 0
+                if (
+                    not queued_bytes
+                    or batch_bytes + queued_bytes > self.pipeline_max_bytes
+                ):
+                    pending.append(queued)
+                    break
+
+                batch.append(queued)
+                batch_bytes += queued_bytes
+
+            self._run_batch(batch)
+
+    def _fail_unfinished(self, pending: deque):
+        while True:
+            try:
+                pending.append(self._requests.get_nowait())
+            except queue.Empty:
+                break
+
+        error = RuntimeError("The controller was closed before the command was sent")
+        for request, future in pending:
+            if request is not _STOP and future.set_running_or_notify_cancel():
+                future.set_exception(error)
+
+    @staticmethod
+    def _run_request(request, future: Future):
+        if not future.set_running_or_notify_cancel():
+            return
+
+        try:
+            future.set_result(request())
+        except BaseException as error:
+            future.set_exception(error)
+
+    def _run_batch(self, batch):
+        batch = [
+            (command, future)
+            for command, future in batch
+            if future.set_running_or_notify_cancel()
+        ]
+        metrics = self.metrics
+        sent_at = []
+
+        # Held like TigerController's own exchanges, so nothing else using the
+        # connection can write or read between a batch's commands and its replies
+        with self._lock:
+            try:
+                for command, _ in batch:
+                    if metrics is not None:
+                        sent_at.append(metrics.before_send(command))
+                    self.connection.send_command(command)
+            except BaseException as error:
+                for _, future in batch:
+                    future.set_exception(error)
+                return
+
+            for index, (command, future) in enumerate(batch):
+                response = None
+
+                try:
+                    response = self.connection.read_response()
+                    Errors.raise_error_if_present(command, response)
+                except BaseException as error:
+                    if isinstance(error, Errors.AsiError):
+                        self._dump_trace(error)
+                    future.set_exception(error)
+                    if metrics is not None:
+                        metrics.after_receive(command, response, sent_at[index], error)
+                else:
+                    future.set_result(response)
+                    if metrics is not None:
+                        metrics.after_receive(command, response, sent_at[index])
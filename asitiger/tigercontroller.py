@@ -1,19 +1,61 @@
+import logging
 import re
+import threading
 import time
-from typing import Any, Dict, List, Union
+from collections import OrderedDict, deque
+from typing import Any, Callable, Dict, Iterable, List, Union
 
 from asitiger.axis import Axis
 from asitiger.command import Command
 from asitiger.errors import Errors
+from asitiger.metrics import Metrics
+from asitiger.rawresponse import RawResponse
+from asitiger.responsecache import ResponseCache
 from asitiger.secure import SecurePosition
 from asitiger.serialconnection import SerialConnection
+from asitiger.snapshot import Snapshot
 from asitiger.status import AxisStatus, Status, statuses_for_rdstat
+from asitiger.timeoutpolicy import TimeoutPolicy
+from asitiger.topology import Topology
+from asitiger.wiretrace import WireTrace
+
+LOGGER = logging.getLogger(__name__)
 
 
 class TigerController:
 
     DEFAULT_POLL_INTERVAL_S = 0.01
 
+    # Waits with an expected move duration sleep through this much of it before
+    # polling, then back off by this factor each time the controller is still busy
+    WAIT_PREDICTED_FRACTION = 0.9
+    WAIT_BACKOFF_FACTOR = 1.5
+
+    # Bounds on pipelined commands awaiting a reply, kept well under the size of
+    # the controller's serial input buffer so it can't overrun
+    DEFAULT_PIPELINE_WINDOW = 8
+    DEFAULT_PIPELINE_MAX_BYTES = 128
+
+    # Values of X for the BAUD command, per the Tiger serial command reference.
+    # Rates above 115200 need a USB serial link and recent firmware
+    BAUD_RATE_CODES = OrderedDict(
+        [
+            (9600, 0),
+            (19200, 1),
+            (28800, 2),
+            (115200, 3),
+            (57600, 4),
+            (230400, 5),
+            (460800, 6),
+            (921600, 7),
+        ]
+    )
+
+    # Long enough for "/" and its reply to cross the wire at 9600 baud
+    DEFAULT_PROBE_TIMEOUT_S = 0.1
+
+    _PROBE_ERROR_REGEX = re.compile(rb":N-\d+")
+
     def __init__(
         self,
         serial_connection: SerialConnection,
@@ -22,20 +64,240 @@ class TigerController:
         self.connection = serial_connection
         self.poll_interval_s = poll_interval_s
 
+        # Keeps each command paired with its reply when threads share the controller
+        self._lock = threading.RLock()
+
+        self._topology = None
+        self.metrics = None
+        self.cache = None
+
     @classmethod
     def from_serial_port(
-        cls, port: str, baud_rate: int = 115200, *tiger_args, **tiger_kwargs
+        cls,
+        port: str,
+        baud_rate: int = 115200,
+        *tiger_args,
+        detect_baud_rate: bool = False,
+        upgrade_baud_rate: bool = False,
+        **tiger_kwargs,
     ) -> "TigerController":
-        return cls(SerialConnection(port, baud_rate), *tiger_args, **tiger_kwargs)
+        """Connect at ``baud_rate``, or at whatever rate the controller is using
+
+        With ``detect_baud_rate`` the controller's rate is probed, starting with
+        ``baud_rate``. With ``upgrade_baud_rate`` it's also switched to the fastest
+        rate in ``BAUD_RATE_CODES`` before returning.
+        """
+        tiger = cls(SerialConnection(port, baud_rate), *tiger_args, **tiger_kwargs)
+
+        try:
+            if detect_baud_rate or upgrade_baud_rate:
+                tiger.detect_baud_rate()
+
+            if upgrade_baud_rate:
+                tiger.upgrade_baud_rate()
+        except Exception:
+            # Don't leave the port held by a controller the caller never gets
+            tiger.connection.disconnect()
+            raise
+
+        return tiger
+
+    def enable_metrics(self, metrics: Metrics = None) -> Metrics:
+        """Start collecting metrics, into ``metrics`` or a new ``Metrics``"""
+        self.metrics = metrics if metrics is not None else Metrics()
+        self.connection.metrics = self.metrics
+        return self.metrics
+
+    def disable_metrics(self):
+        self.metrics = None
+        self.connection.metrics = None
+
+    def enable_cache(self, cache: ResponseCache = None) -> ResponseCache:
+        """Start caching replies to read-only queries, in ``cache`` or a new one"""
+        self.cache = cache if cache is not None else ResponseCache()
+        return self.cache
+
+    def disable_cache(self):
+        self.cache = None
+
+    def enable_timeouts(self, policy: TimeoutPolicy = None) -> TimeoutPolicy:
+        """Wait for each reply as long as ``policy``, or a new ``TimeoutPolicy``, says
+
+        Replies which time out raise ``Errors.ReplyTimeoutError`` rather than being
+        returned incomplete, once the link has been resynchronized.
+        """
+        self.connection.timeout_policy = (
+            policy if policy is not None else TimeoutPolicy()
+        )
+        return self.connection.timeout_policy
+
+    def disable_timeouts(self):
+        self.connection.timeout_policy = None
+
+    def resync(self, **resync_kwargs):
+        """Discard any replies in flight and check the link, see ``SerialConnection``"""
+        with self._lock:
+            self.connection.resync(**resync_kwargs)
+
+    def _send_measured(self, command, read_response, check_response):
+        sent_at = None
+        response = None
+
+        try:
+            with self._lock:
+                # Taken once the lock is held, so waiting for it isn't counted
+                sent_at = self.metrics.before_send(command)
+                self.connection.send_command(command)
+                response = read_response()
+
+            check_response(command, response)
+        except Exception as error:
+            if sent_at is not None:
+                self.metrics.after_receive(command, response, sent_at, error)
+            if isinstance(error, Errors.AsiError):
+                self._dump_trace(error)
+            raise
+
+        self.metrics.after_receive(command, response, sent_at)
+        return response
+
+    def _parse(self, command: str, response: str, parse: Callable[[str], Any]):
+        # Times host-side parsing apart from the exchange itself, when measuring
+        if self.metrics is None:
+            return parse(response)
+
+        started_at = time.perf_counter()
+        parsed = parse(response)
+        self.metrics.record_parse(command, time.perf_counter() - started_at)
+
+        return parsed
+
+    def _dump_trace(self, error: Errors.AsiError):
+        # Logs the frames leading up to a failure and keeps them on the error
+        trace = getattr(self.connection, "trace", None)
+        if isinstance(trace, WireTrace):
+            error.wire_trace = trace.frames()
+            trace.dump(str(error))
 
     def send_command(self, command: str) -> str:
-        self.connection.send_command(command)
-        response = self.connection.read_response()
+        if self.cache is not None:
+            return self.cache.fetch(command, self._send_uncached)
+
+        return self._send_uncached(command)
+
+    def _send_uncached(self, command: str) -> str:
+        if self.metrics is not None:
+            return self._send_measured(
+                command, self.connection.read_response, Errors.raise_error_if_present
+            )
+
+        with self._lock:
+            self.connection.send_command(command)
+            response = self.connection.read_response()
 
-        Errors.raise_error_if_present(command, response)
+        try:
+            Errors.raise_error_if_present(command, response)
+        except Errors.AsiError as error:
+            self._dump_trace(error)
+            raise
 
         return response
 
+    def send_command_raw(self, command: Union[str, bytes]) -> RawResponse:
+        """Like ``send_command``, but the reply is returned without being decoded"""
+        if self.cache is not None:
+            self.cache.invalidate_for(command)
+
+        if self.metrics is not None:
+            return RawResponse(
+                command,
+                self._send_measured(
+                    command,
+                    self.connection.read_response_bytes,
+                    Errors.raise_error_if_present_in_bytes,
+                ),
+            )
+
+        with self._lock:
+            self.connection.send_command(command)
+            response = self.connection.read_response_bytes()
+
+        try:
+            Errors.raise_error_if_present_in_bytes(command, response)
+        except Errors.AsiError as error:
+            self._dump_trace(error)
+            raise
+
+        return RawResponse(command, response)
+
+    def send_commands(
+        self,
+        commands: Iterable[str],
+        window: int = DEFAULT_PIPELINE_WINDOW,
+        max_bytes_in_flight: int = DEFAULT_PIPELINE_MAX_BYTES,
+    ) -> List[str]:
+        """Pipeline commands, returning their responses in the same order
+
+        Up to ``window`` commands (and ``max_bytes_in_flight`` bytes) are written
+        ahead of their replies, which the controller answers in order. If a command
+        fails, no further commands are written, the replies already in flight are
+        read, and the error for the first failed command is raised.
+        """
+        responses = []
+        in_flight = deque()
+        bytes_in_flight = 0
+        error = None
+        metrics = self.metrics
+
+        def read_oldest():
+            nonlocal bytes_in_flight, error
+
+            command, sent_at = in_flight.popleft()
+            bytes_in_flight -= len(command) + 1
+            response = self.connection.read_response()
+            command_error = None
+
+            try:
+                Errors.raise_error_if_present(command, response)
+            except Errors.AsiError as asi_error:
+                command_error = asi_error
+                error = error or asi_error
+                self._dump_trace(asi_error)
+
+            if metrics is not None:
+                metrics.after_receive(command, response, sent_at, command_error)
+
+            responses.append(response)
+
+        with self._lock:
+            for command in commands:
+                command_bytes = len(command) + 1
+
+                while in_flight and (
+                    len(in_flight) >= window
+                    or bytes_in_flight + command_bytes > max_bytes_in_flight
+                ):
+                    read_oldest()
+
+                if error:
+                    break
+
+                if self.cache is not None:
+                    self.cache.invalidate_for(command)
+
+                sent_at = metrics.before_send(command) if metrics is not None else 0.0
+                self.connection.send_command(command)
+                in_flight.append((command, sent_at))
+                bytes_in_flight += command_bytes
+
+            while in_flight:
+                read_oldest()
+
+        if error:
+            raise error
+
+        return responses
+
     @staticmethod
     def _cast_number(number_str: str):
         try:
@@ -53,20 +315,238 @@ class TigerController:
 
         return {key: cast(value) for key, value in key_value_pairs}
 
+    def _probe(self, timeout_s: float) -> bool:
+        """Whether the controller answers a status query at the current baud rate"""
+        read_timeout_s = self.connection.read_timeout_s
+        timeout_policy = self.connection.timeout_policy
+        self.connection.read_timeout_s = timeout_s
+        # A missing reply is an answer here, not an error
+        self.connection.timeout_policy = None
+
+        try:
+            with self._lock:
+                # Garbage left over from probing at other rates can turn the first
+                # query into an error, which is still a reply at this rate
+                for _ in range(2):
+                    self.connection.send_command(Command.STATUS, reset_buffers=True)
+                    response = self.connection.read_response_bytes()
+
+                    if response in (b"N", b"B"):
+                        return True
+                    if not self._PROBE_ERROR_REGEX.fullmatch(response):
+                        return False
+
+                return False
+        finally:
+            self.connection.read_timeout_s = read_timeout_s
+            self.connection.timeout_policy = timeout_policy
+
+    def detect_baud_rate(
+        self,
+        baud_rates: Iterable[int] = None,
+        probe_timeout_s: float = DEFAULT_PROBE_TIMEOUT_S,
+    ) -> int:
+        """Find the baud rate the controller is using and switch the port to it
+
+        The port's current rate is tried first, then ``baud_rates`` (by default
+        every rate in ``BAUD_RATE_CODES``), fastest first.
+        """
+        current = self.connection.baud_rate
+        baud_rates = sorted(
+            self.BAUD_RATE_CODES if baud_rates is None else baud_rates, reverse=True
+        )
+
+        for baud_rate in [current] + [rate for rate in baud_rates if rate != current]:
+            self.connection.baud_rate = baud_rate
+
+            if self._probe(probe_timeout_s):
+                LOGGER.debug(f"Controller is at {baud_rate} baud")
+                return baud_rate
+
+        self.connection.baud_rate = current
+        raise ConnectionError(f"No reply from the controller at any of {baud_rates}")
+
+    def set_baud_rate(
+        self, baud_rate: int, probe_timeout_s: float = DEFAULT_PROBE_TIMEOUT_S
+    ):
+        """Switch the controller and the port to ``baud_rate``, then check the link
+
+        If the controller doesn't answer at the new rate, the port goes back to the
+        previous rate, or whichever rate ``detect_baud_rate`` finds the controller at,
+        before ``ConnectionError`` is raised.
+        """
+        if baud_rate not in self.BAUD_RATE_CODES:
+            raise ValueError(
+                f"Unsupported baud rate {baud_rate}, "
+                f"supported rates are {list(self.BAUD_RATE_CODES)}"
+            )
+
+        previous = self.connection.baud_rate
+        self.send_command(
+            Command.format(Command.BAUD, {"X": self.BAUD_RATE_CODES[baud_rate]})
+        )
+        self.connection.baud_rate = baud_rate
+
+        if self._probe(probe_timeout_s):
+            return
+
+        self.connection.baud_rate = previous
+        recovered = self.detect_baud_rate(probe_timeout_s=probe_timeout_s)
+        raise ConnectionError(
+            f"No reply from the controller after switching to {baud_rate} baud, "
+            f"the link is back at {recovered} baud"
+        )
+
+    def upgrade_baud_rate(
+        self,
+        max_baud_rate: int = None,
+        probe_timeout_s: float = DEFAULT_PROBE_TIMEOUT_S,
+    ) -> int:
+        """Switch to the fastest rate that works, up to ``max_baud_rate``
+
+        Rates faster than the current one are tried fastest first, moving on to the
+        next whenever the controller rejects a rate or stops answering at it. The
+        rate the link ends up at is returned.
+        """
+        current = self.connection.baud_rate or 0
+        candidates = sorted(
+            (
+                rate
+                for rate in self.BAUD_RATE_CODES
+                if rate > current and (max_baud_rate is None or rate <= max_baud_rate)
+            ),
+            reverse=True,
+        )
+
+        for baud_rate in candidates:
+            try:
+                self.set_baud_rate(baud_rate, probe_timeout_s=probe_timeout_s)
+                return baud_rate
+            except (ConnectionError, Errors.AsiError) as error:
+                LOGGER.warning(f"Couldn't switch to {baud_rate} baud: {error}")
+
+        return self.connection.baud_rate
+
     # The methods below are higher-level convenience methods that
     # don't necessarily map directly onto supported serial commands
 
-    def axes(self, card_address: int = None) -> List[Axis.AxisInfo]:
+    def axes(
+        self, card_address: int = None, refresh: bool = False
+    ) -> List[Axis.AxisInfo]:
+        if card_address is None:
+            return list(self.topology(refresh=refresh).axes)
+
         return Axis.get_axes_from_build(self.build(card_address=card_address))
 
-    def is_busy(self) -> bool:
-        return self.status() is Status.BUSY
+    def topology(self, refresh: bool = False) -> Topology:
+        """The installed axes and their cards, queried once and then cached"""
+        if self._topology is None or refresh:
+            self._topology = Topology.from_build(self.build())
+
+        return self._topology
+
+    def card_address_for(self, axis: str) -> str:
+        return self.topology().card_address([axis])
+
+    def _resolve_card_address(self, card_address: int = None, axis: str = None):
+        if card_address is None and axis is not None:
+            return self.card_address_for(axis)
+
+        return card_address
+
+    def is_busy(self, axes: List[str] = None) -> bool:
+        if axes is None:
+            return self.status() is Status.BUSY
+
+        statuses = self.rdstat([f"{axis}?" for axis in axes])
+        return any(status is Status.BUSY for status in statuses)
 
-    def wait_until_idle(self, poll_interval_s: float = None):
+    def wait_until_idle(
+        self,
+        poll_interval_s: float = None,
+        axes: List[str] = None,
+        expected_duration_s: float = None,
+        max_poll_interval_s: float = None,
+    ):
+        """Block until the controller, or just ``axes``, are idle
+
+        When ``expected_duration_s`` is given (e.g. from a ``MoveTimeModel``) most
+        of it is slept through before polling starts. Polls begin every
+        ``poll_interval_s`` and back off towards ``max_poll_interval_s`` while
+        the controller stays busy.
+        """
         poll_interval_s = poll_interval_s if poll_interval_s else self.poll_interval_s
+        max_poll_interval_s = max(max_poll_interval_s or 0.0, poll_interval_s)
+
+        started_at = time.perf_counter()
+        sleep_s = 0.0
+        polls = 1
+
+        if expected_duration_s:
+            sleep_s = expected_duration_s * self.WAIT_PREDICTED_FRACTION
+            time.sleep(sleep_s)
 
-        while self.is_busy():
+        while self.is_busy(axes):
             time.sleep(poll_interval_s)
+            sleep_s += poll_interval_s
+            polls += 1
+            poll_interval_s = min(
+                poll_interval_s * self.WAIT_BACKOFF_FACTOR, max_poll_interval_s
+            )
+
+        if self.metrics is not None:
+            self.metrics.record_wait(time.perf_counter() - started_at, sleep_s, polls)
+
+    def snapshot(self, axes: List[str] = None, include_speeds: bool = True) -> Snapshot:
+        """The positions, statuses and speeds of ``axes``, from one pipelined exchange
+
+        By default every installed axis which has a position is included, as listed
+        by ``axes()``.
+        """
+        if axes is None:
+            axes = [
+                axis.label
+                for axis in self.axes()
+                if axis.type not in Snapshot.NON_POSITIONING_TYPES
+            ]
+
+        labels = " ".join(axes)
+        commands = [f"{Command.WHERE} {labels}", f"{Command.RDSTAT} {labels}"]
+        if include_speeds:
+            commands.append(
+                Command.format(
+                    Command.SPEED, {axis: "?" for axis in axes}, flag_overrides=["?"]
+                )
+            )
+
+        responses = self.send_commands(commands)
+        timestamp = time.monotonic()
+
+        speeds = None
+        if include_speeds:
+            speeds = self._parse(
+                commands[2],
+                responses[2],
+                lambda response: tuple(
+                    self._dict_from_response(response, cast_values_to=float).values()
+                ),
+            )
+
+        return Snapshot(
+            timestamp,
+            tuple(axes),
+            self._parse(
+                commands[0],
+                responses[0],
+                lambda response: tuple(map(self._cast_number, response.split()[1:])),
+            ),
+            self._parse(
+                commands[1],
+                responses[1],
+                lambda response: tuple(statuses_for_rdstat(response)),
+            ),
+            speeds,
+        )
 
     def enable_axes(self, axes: List[str]):
         self.motor_control({axis: "+" for axis in axes})
@@ -75,15 +555,21 @@ class TigerController:
         self.motor_control({axis: "-" for axis in axes})
 
     def set_plate_lock(
-        self, position: Union[SecurePosition, float], card_address: int = None
+        self,
+        position: Union[SecurePosition, float],
+        card_address: int = None,
+        axis: str = None,
     ):
         return self.secure(
-            {"X": SecurePosition.resolve_value(position)}, card_address=card_address
+            {"X": SecurePosition.resolve_value(position)},
+            card_address=card_address,
+            axis=axis,
         )
 
     # The methods below map directly onto the Tiger serial API methods
 
-    def build(self, card_address: int = None) -> List[str]:
+    def build(self, card_address: int = None, axis: str = None) -> List[str]:
+        card_address = self._resolve_card_address(card_address, axis)
         response = self.send_command(
             Command.format(f"{Command.BUILD} X", card_address=card_address)
         )
@@ -98,7 +584,13 @@ class TigerController:
     def home(self, axes: List[str]) -> str:
         return self.send_command(f"{Command.HOME} {' '.join(axes)}")
 
-    def led(self, led_brightnesses: Dict[str, int], card_address: int = None):
+    def led(
+        self,
+        led_brightnesses: Dict[str, int],
+        card_address: int = None,
+        axis: str = None,
+    ):
+        card_address = self._resolve_card_address(card_address, axis)
         self.send_command(
             Command.format(
                 Command.LED, coordinates=led_brightnesses, card_address=card_address
@@ -117,12 +609,16 @@ class TigerController:
         return self.send_command(Command.format(Command.MOVREL, coordinates=offsets))
 
     def rdstat(self, axes: List[str]) -> List[Union[AxisStatus, Status]]:
-        response = self.send_command(f"{Command.RDSTAT} {' '.join(axes)}")
-        return statuses_for_rdstat(response)
+        command = f"{Command.RDSTAT} {' '.join(axes)}"
+        return self._parse(command, self.send_command(command), statuses_for_rdstat)
 
     def secure(
-        self, settings: Dict[str, Union[int, float, str]], card_address: int = None,
+        self,
+        settings: Dict[str, Union[int, float, str]],
+        card_address: int = None,
+        axis: str = None,
     ):
+        card_address = self._resolve_card_address(card_address, axis)
         self.send_command(
             Command.format(Command.SECURE, settings, card_address=card_address)
         )
@@ -134,18 +630,24 @@ class TigerController:
 
     def speed(self, axes: Dict[str, Union[str, float]]) -> Dict[str, float]:
         command = Command.format(Command.SPEED, coordinates=axes, flag_overrides=["?"])
-        return self._dict_from_response(self.send_command(command))
+        return self._parse(
+            command, self.send_command(command), self._dict_from_response
+        )
 
     def status(self) -> Status:
         return Status(self.send_command(Command.STATUS))
 
     def where(self, axes: List[str]) -> dict:
-        response = self.send_command(f"{Command.WHERE} {' '.join(axes)}")
-        coordinates = response.split(" ")[1:]
-
-        return {
-            axis: self._cast_number(coord) for axis, coord in zip(axes, coordinates)
-        }
+        command = f"{Command.WHERE} {' '.join(axes)}"
+
+        return self._parse(
+            command,
+            self.send_command(command),
+            lambda response: {
+                axis: self._cast_number(coord)
+                for axis, coord in zip(axes, response.split(" ")[1:])
+            },
+        )
 
     def who(self) -> List[str]:
         return self.send_command(Command.WHO).split("\r")
@@ -0,0 +1,141 @@
+import logging
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, List, Union
+
+from asitiger.status import Status
+from asitiger.tigercontroller import TigerController
+
+LOGGER = logging.getLogger(__name__)
+
+
+class FleetError(Exception):
+    """Raised when a command fails on some of the controllers in a fleet
+
+    ``errors`` holds the exception raised for each failed controller, and
+    ``results`` the results from the controllers which succeeded.
+    """
+
+    def __init__(self, errors: Dict[str, BaseException], results: Dict[str, Any]):
+        super().__init__(
+            "Failed on "
+            + ", ".join(f"{name} ({error!r})" for name, error in errors.items())
+        )
+        self.errors = errors
+        self.results = results
+
+
+class TigerFleet:
+    """Several named controllers, each sent the same request in parallel
+
+    Each controller's requests run on a thread pool with one worker per controller,
+    so a fleet-wide query takes about as long as the slowest controller's round trip
+    rather than the sum of them. Results are returned as dicts keyed by controller
+    name, in the order the controllers were given.
+    """
+
+    def __init__(self, controllers: Dict[str, TigerController]):
+        self.controllers = OrderedDict(controllers)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(len(self.controllers), 1),
+            thread_name_prefix="asitiger-fleet",
+        )
+
+    @classmethod
+    def from_serial_ports(
+        cls, ports: Dict[str, str], baud_rate: int = 115200, **tiger_kwargs
+    ) -> "TigerFleet":
+        controllers = OrderedDict()
+
+        try:
+            for name, port in ports.items():
+                controllers[name] = TigerController.from_serial_port(
+                    port, baud_rate, **tiger_kwargs
+                )
+        except Exception:
+            # Don't leave the ports opened so far held
+            for controller in controllers.values():
+                controller.connection.disconnect()
+            raise
+
+        return cls(controllers)
+
+    def __enter__(self) -> "TigerFleet":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Stop the worker threads and disconnect every controller"""
+        self._executor.shutdown()
+
+        for controller in self.controllers.values():
+            controller.connection.disconnect()
+
+    def map(self, function: Callable[[TigerController], Any]) -> Dict[str, Any]:
+        """Call ``function`` with every controller in parallel, returning the results
+
+        Waits for every controller to finish. If any of them raised, a ``FleetError``
+        is raised holding both the errors and the other controllers' results.
+        """
+        return self._run(
+            OrderedDict(
+                (name, partial(function, controller))
+                for name, controller in self.controllers.items()
+            )
+        )
+
+    def _run(self, calls: Dict[str, Callable[[], Any]]) -> Dict[str, Any]:
+        futures = OrderedDict(
+            (name, self._executor.submit(call)) for name, call in calls.items()
+        )
+
+        results = OrderedDict()
+        errors = OrderedDict()
+
+        for name, future in futures.items():
+            try:
+                results[name] = future.result()
+            except Exception as error:
+                LOGGER.debug(f"Controller {name} failed: {error}")
+                errors[name] = error
+
+        if errors:
+            raise FleetError(errors, results)
+
+        return results
+
+    def send_command(self, command: str) -> Dict[str, str]:
+        return self.map(lambda tiger: tiger.send_command(command))
+
+    def status(self) -> Dict[str, Status]:
+        return self.map(lambda tiger: tiger.status())
+
+    def where(
+        self, axes: Union[List[str], Dict[str, List[str]]]
+    ) -> Dict[str, Dict[str, float]]:
+        """Positions from every controller, of the same axes or of axes per controller"""
+        if isinstance(axes, dict):
+            return self._run(
+                OrderedDict(
+                    (name, partial(self.controllers[name].where, labels))
+                    for name, labels in axes.items()
+                )
+            )
+
+        return self.map(lambda tiger: tiger.where(axes))
+
+    def is_busy(self) -> bool:
+        return any(self.map(lambda tiger: tiger.is_busy()).values())
+
+    def halt(self):
+        self.map(lambda tiger: tiger.halt())
+
+    def wait_until_idle(self, **wait_kwargs):
+        """Block until every controller is idle, polling them all concurrently
+
+        Keyword arguments are passed on to each controller's ``wait_until_idle``.
+        """
+        self.map(lambda tiger: tiger.wait_until_idle(**wait_kwargs))
@@ -0,0 +1,38 @@
+from typing import Dict, Union
+
+from asitiger.command import Command
+
+
+class TimeoutPolicy:
+    """How long to wait for the reply to each type of command
+
+    Enabled with ``TigerController.enable_timeouts``. Commands whose verb has an
+    entry in ``timeouts_s`` wait that many seconds for their reply, and any others
+    wait ``default_s``. A reply which doesn't arrive in time raises
+    ``Errors.ReplyTimeoutError`` once the link has been resynchronized.
+    """
+
+    # Status queries are answered at once, so a missing reply is given up on
+    # within a few round trips, even at 9600 baud
+    DEFAULT_TIMEOUTS_S = {
+        Command.HOME: 30.0,
+        Command.RDSTAT: 0.1,
+        Command.STATUS: 0.1,
+        Command.WHERE: 0.1,
+    }
+
+    DEFAULT_TIMEOUT_S = 1.0
+
+    def __init__(
+        self, timeouts_s: Dict[str, float] = None, default_s: float = DEFAULT_TIMEOUT_S,
+    ):
+        self.timeouts_s = dict(
+            self.DEFAULT_TIMEOUTS_S if timeouts_s is None else timeouts_s
+        )
+        self.default_s = default_s
+
+    def timeout_for(self, command: Union[str, bytes]) -> float:
+        if isinstance(command, bytes):
+            command = command.decode("ascii", "replace")
+
+        return self.timeouts_s.get(Command.verb(command), self.default_s)
@@ -0,0 +1,49 @@
+from collections import OrderedDict
+from typing import Iterable, List
+
+from asitiger.axis import Axis
+
+
+class Topology:
+    """Which axes are installed, and which card each one is on
+
+    Built once from a ``BU X`` response so that card addresses can be looked up by
+    axis label instead of being queried or configured by hand.
+    """
+
+    def __init__(self, axes: Iterable[Axis.AxisInfo]):
+        self.axes = list(axes)
+        self._axes_by_label = OrderedDict((axis.label, axis) for axis in self.axes)
+
+    @classmethod
+    def from_build(cls, build_response: List[str]) -> "Topology":
+        return cls(Axis.get_axes_from_build(build_response))
+
+    @property
+    def labels(self) -> List[str]:
+        return list(self._axes_by_label)
+
+    def axis(self, label: str) -> Axis.AxisInfo:
+        try:
+            return self._axes_by_label[label]
+        except KeyError:
+            raise ValueError(
+                f'Axis "{label}" is not installed, axes are: {self.labels}'
+            ) from None
+
+    def card_address(self, labels: Iterable[str]) -> str:
+        """The address of the card which every one of the given axes is on"""
+        addresses = {self.axis(label).address for label in labels}
+
+        if len(addresses) != 1:
+            raise ValueError(
+                f"Axes {list(labels)} must all be on one card, they are on {addresses}"
+            )
+
+        return addresses.pop()
+
+    def axes_on_card(self, card_address: str) -> List[Axis.AxisInfo]:
+        return [axis for axis in self.axes if axis.address == str(card_address)]
+
+    def axes_of_type(self, axis_type: Axis.Type) -> List[Axis.AxisInfo]:
+        return [axis for axis in self.axes if axis.type is axis_type]
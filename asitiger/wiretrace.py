@@ -0,0 +1,99 @@
+import logging
+import time
+from collections import namedtuple
+from typing import Callable, List
+
+LOGGER = logging.getLogger(__name__)
+
+TraceFrame = namedtuple("TraceFrame", ["timestamp", "direction", "data", "length"])
+
+
+class WireTrace:
+    """The most recent raw frames sent and received, kept for post-mortems
+
+    Storage for ``capacity`` frames of up to ``max_frame_bytes`` each is allocated
+    up front and overwritten in a ring, so recording a frame only copies its bytes.
+    Longer frames are truncated, but their full ``length`` is kept. Timestamps are
+    from ``clock``, ``time.monotonic`` by default.
+
+    Enabled with ``SerialConnection.enable_trace``, after which the trace is dumped
+    to the log when a reply times out or a command fails with an ``AsiError``.
+    """
+
+    SENT = ">"
+    RECEIVED = "<"
+
+    def __init__(
+        self,
+        capacity: int = 256,
+        max_frame_bytes: int = 64,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.capacity = capacity
+        self.max_frame_bytes = max_frame_bytes
+        self.clock = clock
+
+        self.count = 0
+
+        self._timestamps = [0.0] * capacity
+        self._directions = [self.SENT] * capacity
+        self._lengths = [0] * capacity
+        self._frames = bytearray(capacity * max_frame_bytes)
+
+    def record(self, direction: str, data: bytes):
+        index = self.count % self.capacity
+        stored = min(len(data), self.max_frame_bytes)
+        start = index * self.max_frame_bytes
+        end = start + stored
+
+        self._frames[start:end] = data[:stored]
+        self._timestamps[index] = self.clock()
+        self._directions[index] = direction
+        self._lengths[index] = len(data)
+
+        self.count += 1
+
+    def clear(self):
+        self.count = 0
+
+    def frames(self) -> List[TraceFrame]:
+        """The recorded frames, oldest first"""
+        num_frames = min(self.count, self.capacity)
+        frames = []
+
+        for offset in range(self.count - num_frames, self.count):
+            index = offset % self.capacity
+            start = index * self.max_frame_bytes
+            end = start + min(self._lengths[index], self.max_frame_bytes)
+
+            frames.append(
+                TraceFrame(
+                    self._timestamps[index],
+                    self._directions[index],
+                    bytes(self._frames[start:end]),
+                    self._lengths[index],
+                )
+            )
+
+        return frames
+
+    def format(self) -> str:
+        """One line per frame, timed relative to the most recent frame"""
+        frames = self.frames()
+        if not frames:
+            return "(no frames recorded)"
+
+        latest = frames[-1].timestamp
+        lines = []
+
+        for frame in frames:
+            truncated = "..." if frame.length > len(frame.data) else ""
+            lines.append(
+                f"{frame.timestamp - latest:+.6f}s {frame.direction} "
+                f"{frame.data}{truncated}"
+            )
+
+        return "\n".join(lines)
+
+    def dump(self, reason: str, level: int = logging.ERROR):
+        LOGGER.log(level, f"{reason}, recent serial traffic:\n{self.format()}")
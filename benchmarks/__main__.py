@@ -0,0 +1,81 @@
+import argparse
+import fnmatch
+import json
+import platform
+import sys
+import time
+
+from benchmarks.suite import BENCHMARKS, DEFAULT_OPTIONS, run
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmark asitiger hot paths and write the results as JSON",
+    )
+    parser.add_argument(
+        "patterns",
+        nargs="*",
+        default=["*"],
+        help="Glob patterns selecting benchmarks by name (default: all)",
+    )
+    parser.add_argument("--iterations", type=int, default=DEFAULT_OPTIONS["iterations"])
+    parser.add_argument(
+        "--baud-rate",
+        type=int,
+        default=DEFAULT_OPTIONS["baud_rate"],
+        help="Simulated link baud rate, 0 disables wire delays",
+    )
+    parser.add_argument(
+        "--processing-time-s",
+        type=float,
+        default=DEFAULT_OPTIONS["processing_time_s"],
+        help="Simulated controller time spent on each command",
+    )
+    parser.add_argument("--output", help="Write results to this file, not stdout")
+    parser.add_argument("--list", action="store_true", help="List benchmark names")
+
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    if args.list:
+        print("\n".join(BENCHMARKS))
+        return
+
+    names = [
+        name
+        for name in BENCHMARKS
+        if any(fnmatch.fnmatch(name, pattern) for pattern in args.patterns)
+    ]
+
+    results = {
+        "timestamp": time.time(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "options": {
+            "iterations": args.iterations,
+            "baud_rate": args.baud_rate,
+            "processing_time_s": args.processing_time_s,
+        },
+        "benchmarks": run(
+            names,
+            iterations=args.iterations,
+            baud_rate=args.baud_rate or None,
+            processing_time_s=args.processing_time_s,
+        ),
+    }
+
+    output = json.dumps(results, indent=2)
+
+    if args.output:
+        with open(args.output, "w") as output_file:
+            output_file.write(output + "\n")
+    else:
+        sys.stdout.write(output + "\n")
+
+
+if __name__ == "__main__":
+    main()
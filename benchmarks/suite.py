@@ -0,0 +1,328 @@
+import statistics
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List
+
+from asitiger.command import Command
+from asitiger.movetime import MoveTimeModel
+from asitiger.simulator import SimulatedConnection, SimulatedTiger
+from asitiger.status import (
+    decode_status_bytes,
+    status_from_decimal,
+    statuses_for_rdstat,
+)
+from asitiger.tigercontroller import TigerController
+
+BENCHMARKS = OrderedDict()
+
+DEFAULT_OPTIONS = {
+    "iterations": 1000,
+    "baud_rate": 115200,
+    "processing_time_s": 0.0,
+    "move_distance": 1000,
+    "move_speed_mm_s": 1.0,
+}
+
+RDSTAT_RESPONSE = ":A  10N 138"
+SPEED_RESPONSE = ":A X=29.998830 Y=29.998830 Z=1.200000"
+WHERE_RESPONSE = ":A -989110.5 -1042395.0 1532.0"
+
+
+def benchmark(name: str):
+    def register(function: Callable[[Dict], Dict]):
+        BENCHMARKS[name] = function
+        return function
+
+    return register
+
+
+class CannedConnection:
+    """A connection which answers every command with the same reply, free of I/O"""
+
+    def __init__(self, response: str):
+        self.response = response
+
+    def send_command(self, command: str):
+        pass
+
+    def read_response(self) -> str:
+        return self.response
+
+    def read_response_bytes(self) -> bytes:
+        return self.response.encode("ascii")
+
+
+def summarize(durations_s: List[float]) -> Dict:
+    ordered = sorted(durations_s)
+
+    return {
+        "iterations": len(ordered),
+        "min_s": ordered[0],
+        "max_s": ordered[-1],
+        "mean_s": statistics.mean(ordered),
+        "median_s": statistics.median(ordered),
+        "p95_s": ordered[min(int(len(ordered) * 0.95), len(ordered) - 1)],
+        "stdev_s": statistics.stdev(ordered) if len(ordered) > 1 else 0.0,
+    }
+
+
+def time_calls(function: Callable[[], object], iterations: int) -> Dict:
+    durations_s = []
+    clock = time.perf_counter
+
+    for _ in range(iterations):
+        start = clock()
+        function()
+        durations_s.append(clock() - start)
+
+    return summarize(durations_s)
+
+
+def simulated_tiger(options: Dict) -> TigerController:
+    return TigerController(
+        SimulatedConnection(
+            SimulatedTiger(processing_time_s=options["processing_time_s"]),
+            baud_rate=options["baud_rate"],
+        )
+    )
+
+
+# Encoding
+
+
+@benchmark("command.format")
+def bench_command_format(options: Dict) -> Dict:
+    coordinates = {"X": 12345.6, "Y": -6543.2, "Z": 100}
+    return time_calls(
+        lambda: Command.format(Command.MOVE, coordinates=coordinates),
+        options["iterations"],
+    )
+
+
+@benchmark("command.format_coordinates")
+def bench_format_coordinates(options: Dict) -> Dict:
+    coordinates = {"X": "+", "Y": "?", "Z": 3.0}
+    return time_calls(
+        lambda: Command.format_coordinates(coordinates, flag_overrides=["+", "?"]),
+        options["iterations"],
+    )
+
+
+# Parsing
+
+
+@benchmark("status.status_from_decimal")
+def bench_status_from_decimal(options: Dict) -> Dict:
+    return time_calls(lambda: status_from_decimal(210), options["iterations"])
+
+
+@benchmark("status.statuses_for_rdstat")
+def bench_statuses_for_rdstat(options: Dict) -> Dict:
+    return time_calls(
+        lambda: statuses_for_rdstat(RDSTAT_RESPONSE), options["iterations"]
+    )
+
+
+@benchmark("status.decode_status_bytes_x1000")
+def bench_decode_status_bytes(options: Dict) -> Dict:
+    import numpy as np
+
+    status_bytes = np.arange(1000, dtype=np.uint32).astype(np.uint8)
+    return time_calls(lambda: decode_status_bytes(status_bytes), options["iterations"])
+
+
+@benchmark("tigercontroller.dict_from_response")
+def bench_dict_from_response(options: Dict) -> Dict:
+    return time_calls(
+        lambda: TigerController._dict_from_response(SPEED_RESPONSE),
+        options["iterations"],
+    )
+
+
+@benchmark("tigercontroller.where_parse")
+def bench_where_parse(options: Dict) -> Dict:
+    tiger = TigerController(CannedConnection(WHERE_RESPONSE))
+    return time_calls(lambda: tiger.where(["X", "Y", "Z"]), options["iterations"])
+
+
+@benchmark("tigercontroller.where_parse_with_metrics")
+def bench_where_parse_with_metrics(options: Dict) -> Dict:
+    tiger = TigerController(CannedConnection(WHERE_RESPONSE))
+    tiger.enable_metrics()
+    return time_calls(lambda: tiger.where(["X", "Y", "Z"]), options["iterations"])
+
+
+@benchmark("tigercontroller.where_raw_parse")
+def bench_where_raw_parse(options: Dict) -> Dict:
+    tiger = TigerController(CannedConnection(WHERE_RESPONSE))
+    return time_calls(
+        lambda: tiger.send_command_raw(b"W X Y Z").numbers(), options["iterations"]
+    )
+
+
+@benchmark("positionsampler.sample_parse")
+def bench_sampler_parse(options: Dict) -> Dict:
+    from asitiger.positionsampler import PositionSampler
+
+    tiger = TigerController(CannedConnection(WHERE_RESPONSE))
+    sampler = PositionSampler(tiger, ["X", "Y", "Z"], capacity=1024)
+    return time_calls(sampler.sample, options["iterations"])
+
+
+@benchmark("tigercontroller.move_x100")
+def bench_move_loop(options: Dict) -> Dict:
+    tiger = TigerController(CannedConnection(":A"))
+    positions = [index * 0.5 for index in range(100)]
+
+    def move_each():
+        for z in positions:
+            tiger.move({"Z": z})
+
+    return time_calls(move_each, options["iterations"])
+
+
+@benchmark("macro.move_x100")
+def bench_macro_move(options: Dict) -> Dict:
+    from asitiger.macro import Macro, Parameter
+
+    tiger = TigerController(CannedConnection(":A"))
+    positions = [index * 0.5 for index in range(100)]
+    macro = Macro().move({"Z": Parameter("z")})
+
+    return time_calls(lambda: macro.run(tiger, z=positions), options["iterations"])
+
+
+@benchmark("pathplanner.order_384_wells")
+def bench_path_planner(options: Dict) -> Dict:
+    import numpy as np
+
+    from asitiger.pathplanner import PathPlanner
+
+    # A 384 well plate's wells, 4.5 mm apart, in a shuffled order
+    wells = np.array([[x * 45000.0, y * 45000.0] for x in range(24) for y in range(16)])
+    shuffled = wells[np.random.RandomState(0).permutation(len(wells))]
+    planner = PathPlanner(MoveTimeModel({"X": 7.5, "Y": 7.5}))
+
+    results = time_calls(
+        lambda: planner.order(shuffled), max(options["iterations"] // 100, 1)
+    )
+    results.update(
+        {
+            "given_travel_s": planner.travel_time_s(shuffled),
+            "planned_travel_s": planner.travel_time_s(
+                shuffled[planner.order(shuffled)]
+            ),
+        }
+    )
+
+    return results
+
+
+# Round trips over a simulated link
+
+
+@benchmark("round_trip.status")
+def bench_round_trip_status(options: Dict) -> Dict:
+    tiger = simulated_tiger(options)
+    return time_calls(lambda: tiger.send_command(Command.STATUS), options["iterations"])
+
+
+@benchmark("round_trip.where")
+def bench_round_trip_where(options: Dict) -> Dict:
+    tiger = simulated_tiger(options)
+    return time_calls(lambda: tiger.where(["X", "Y", "Z"]), options["iterations"])
+
+
+@benchmark("round_trip.rdstat")
+def bench_round_trip_rdstat(options: Dict) -> Dict:
+    tiger = simulated_tiger(options)
+    return time_calls(lambda: tiger.rdstat(["X", "Y", "Z"]), options["iterations"])
+
+
+@benchmark("round_trip.move")
+def bench_round_trip_move(options: Dict) -> Dict:
+    tiger = simulated_tiger(options)
+    return time_calls(lambda: tiger.move({"X": 0, "Y": 0}), options["iterations"])
+
+
+@benchmark("round_trip.pipelined_where_x8")
+def bench_round_trip_pipelined(options: Dict) -> Dict:
+    tiger = simulated_tiger(options)
+    commands = ["W X Y Z"] * 8
+    return time_calls(lambda: tiger.send_commands(commands), options["iterations"])
+
+
+@benchmark("round_trip.snapshot")
+def bench_round_trip_snapshot(options: Dict) -> Dict:
+    tiger = simulated_tiger(options)
+    return time_calls(lambda: tiger.snapshot(["X", "Y", "Z"]), options["iterations"])
+
+
+# Move completion
+
+
+def measure_waits(options: Dict, predict: bool) -> Dict:
+    distance = options["move_distance"]
+    speed_mm_s = options["move_speed_mm_s"]
+
+    tiger = simulated_tiger(options)
+    tiger.speed({"X": speed_mm_s})
+    model = MoveTimeModel({"X": speed_mm_s})
+
+    polls = []
+    overshoots_s = []
+    durations_s = []
+    is_busy = tiger.is_busy
+
+    def counting_is_busy(axes=None):
+        polls[-1] += 1
+        return is_busy(axes)
+
+    tiger.is_busy = counting_is_busy
+    expected_move_s = model.duration_s({"X": distance})
+
+    for iteration in range(max(options["iterations"] // 100, 1)):
+        target = distance if iteration % 2 == 0 else 0
+        polls.append(0)
+
+        start = time.perf_counter()
+        tiger.move({"X": target})
+        if predict:
+            tiger.wait_until_idle(axes=["X"], expected_duration_s=expected_move_s)
+        else:
+            tiger.wait_until_idle()
+        elapsed = time.perf_counter() - start
+
+        durations_s.append(elapsed)
+        overshoots_s.append(elapsed - expected_move_s)
+
+    results = summarize(durations_s)
+    results.update(
+        {
+            "expected_move_s": expected_move_s,
+            "mean_polls": statistics.mean(polls),
+            "max_polls": max(polls),
+            "mean_overshoot_s": statistics.mean(overshoots_s),
+        }
+    )
+
+    return results
+
+
+@benchmark("wait_until_idle.polls_per_move")
+def bench_wait_until_idle(options: Dict) -> Dict:
+    return measure_waits(options, predict=False)
+
+
+@benchmark("wait_until_idle.predicted_polls_per_move")
+def bench_wait_until_idle_predicted(options: Dict) -> Dict:
+    return measure_waits(options, predict=True)
+
+
+def run(names: List[str] = None, **options) -> Dict:
+    options = dict(DEFAULT_OPTIONS, **options)
+    names = names if names is not None else list(BENCHMARKS)
+
+    return OrderedDict(
+        (name, BENCHMARKS[name](options)) for name in names if name in BENCHMARKS
+    )
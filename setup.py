@@ -13,7 +13,7 @@ setuptools.setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/System1Bio/asitiger",
-    packages=setuptools.find_packages(),
+    packages=setuptools.find_packages(exclude=["benchmarks", "benchmarks.*"]),
     python_requires=">=3.6",
     install_requires=["pyserial>=3.0"],
     extras_require={
@@ -23,7 +23,8 @@ setuptools.setup(
             "flake8==3.7.9",
             "pre-commit>=2.7.1",
         ],
-        "test": ["pytest==6.1.2"],
+        "numpy": ["numpy>=1.13"],
+        "test": ["numpy>=1.13", "pytest==6.1.2"],
     },
     classifiers=[
         "Programming Language :: Python :: 3",
@@ -0,0 +1,96 @@
+import asyncio
+
+import pytest
+
+from asitiger.asynctigercontroller import AsyncTigerController
+from asitiger.errors import Errors
+from asitiger.simulator import (
+    AsyncSimulatedConnection,
+    SimulatedTiger,
+    SimulatedTigerPty,
+)
+from asitiger.status import Status
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+@pytest.fixture(scope="function")
+def tiger():
+    return AsyncTigerController(AsyncSimulatedConnection(baud_rate=None))
+
+
+def test_move_and_wait(tiger):
+    async def scenario():
+        await tiger.speed({"X": 100})
+        await tiger.move({"X": 1000})
+        assert await tiger.is_busy()
+
+        await tiger.wait_until_idle(poll_interval_s=0.001)
+        return await tiger.where(["X"])
+
+    assert run(scenario()) == {"X": 1000.0}
+
+
+def test_error(tiger):
+    with pytest.raises(Errors.UnrecognizedAxisParameterError):
+        run(tiger.move({"Q": 1}))
+
+
+def test_concurrent_commands_get_their_own_replies(tiger):
+    async def scenario():
+        await tiger.here({"X": 5, "Y": 7})
+        return await asyncio.gather(
+            tiger.where(["X"]),
+            tiger.status(),
+            tiger.where(["Y"]),
+            tiger.speed({"Z": "?"}),
+        )
+
+    assert run(scenario()) == [
+        {"X": 5.0},
+        Status.IDLE,
+        {"Y": 7.0},
+        {"Z": "1.200000"},
+    ]
+
+
+def test_wait_until_idle_does_not_block_loop(tiger):
+    ticks = []
+
+    async def ticker():
+        while True:
+            ticks.append(None)
+            await asyncio.sleep(0.001)
+
+    async def scenario():
+        await tiger.speed({"X": 1})
+        await tiger.move({"X": 500})
+        task = asyncio.ensure_future(ticker())
+        await tiger.wait_until_idle()
+        task.cancel()
+
+    run(scenario())
+
+    assert len(ticks) > 5
+
+
+def test_read_timeout():
+    connection = AsyncSimulatedConnection(baud_rate=None, read_timeout_s=0.01)
+
+    assert run(connection.read_response()) == ""
+
+
+def test_pty():
+    with SimulatedTigerPty(SimulatedTiger(), baud_rate=None) as pty:
+        tiger = AsyncTigerController.from_serial_port(pty.port)
+        try:
+            assert run(tiger.status()) == Status.IDLE
+            assert run(tiger.axes())[0].label == "X"
+        finally:
+            tiger.connection.disconnect()
@@ -0,0 +1,29 @@
+import json
+
+from benchmarks.__main__ import main
+from benchmarks.suite import BENCHMARKS, run
+
+
+def test_run_all():
+    results = run(iterations=2, baud_rate=None)
+
+    assert list(results) == list(BENCHMARKS)
+    assert all(result["iterations"] >= 1 for result in results.values())
+
+
+def test_polls_counted():
+    results = run(["wait_until_idle.polls_per_move"], iterations=100, baud_rate=None)
+
+    assert results["wait_until_idle.polls_per_move"]["mean_polls"] >= 1
+
+
+def test_json_output(tmp_path):
+    output_path = tmp_path / "results.json"
+
+    main(["command.*", "--iterations", "3", "--output", str(output_path)])
+
+    results = json.loads(output_path.read_text())
+    assert set(results["benchmarks"]) == {
+        "command.format",
+        "command.format_coordinates",
+    }
@@ -0,0 +1,121 @@
+import threading
+import time
+
+import pytest
+
+from asitiger.coalescingtigercontroller import CoalescingTigerController
+from asitiger.errors import Errors
+from asitiger.simulator import SimulatedConnection
+from asitiger.status import Status
+
+
+@pytest.fixture(scope="function")
+def tiger():
+    return CoalescingTigerController(SimulatedConnection(baud_rate=None))
+
+
+def commands_received(tiger) -> int:
+    return tiger.connection.tiger.commands_received
+
+
+def run_while_link_is_busy(tiger, calls):
+    """Start every call while holding the link, then let them all go at once"""
+    results = [None] * len(calls)
+
+    def run(index, call):
+        try:
+            results[index] = call()
+        except Exception as error:
+            results[index] = error
+
+    threads = [
+        threading.Thread(target=run, args=(index, call))
+        for index, call in enumerate(calls)
+    ]
+
+    with tiger._lock:
+        for thread in threads:
+            thread.start()
+        time.sleep(0.05)
+
+    for thread in threads:
+        thread.join()
+
+    return results
+
+
+def test_concurrent_status_queries_share_one_request(tiger):
+    sent = commands_received(tiger)
+    results = run_while_link_is_busy(tiger, [tiger.status] * 4)
+
+    assert results == [Status.IDLE] * 4
+    assert commands_received(tiger) == sent + 1
+    assert tiger.shared_replies == 3
+
+
+def test_different_queries_are_not_shared(tiger):
+    results = run_while_link_is_busy(
+        tiger, [lambda: tiger.where(["X"]), lambda: tiger.where(["Y"])]
+    )
+
+    assert results == [{"X": 0.0}, {"Y": 0.0}]
+    assert tiger.shared_replies == 0
+
+
+def test_sequential_queries_are_not_shared(tiger):
+    tiger.status()
+    tiger.status()
+
+    assert commands_received(tiger) == 2
+
+
+def test_disjoint_moves_are_combined(tiger):
+    sent = commands_received(tiger)
+    run_while_link_is_busy(
+        tiger,
+        [
+            lambda: tiger.move({"X": 100}),
+            lambda: tiger.move({"Y": 200}),
+            lambda: tiger.move({"Z": 300}),
+        ],
+    )
+
+    assert commands_received(tiger) == sent + 1
+    assert tiger.combined_commands == 2
+
+    tiger.wait_until_idle()
+    assert tiger.where(["X", "Y", "Z"]) == {"X": 100.0, "Y": 200.0, "Z": 300.0}
+
+
+def test_overlapping_moves_keep_their_order(tiger):
+    tiger.combine_window_s = 0.01
+
+    first = threading.Thread(target=lambda: tiger.move({"X": 100}))
+    first.start()
+    time.sleep(0.002)
+    tiger.move({"X": 200})
+    first.join()
+    tiger.wait_until_idle()
+
+    assert tiger.combined_commands == 0
+    assert tiger.where(["X"]) == {"X": 200.0}
+
+
+def test_combined_motor_control(tiger):
+    run_while_link_is_busy(
+        tiger, [lambda: tiger.disable_axes(["X"]), lambda: tiger.disable_axes(["Z"])],
+    )
+
+    assert tiger.combined_commands == 1
+    assert not tiger.connection.tiger.axes["X"].enabled
+    assert not tiger.connection.tiger.axes["Z"].enabled
+
+
+def test_errors_reach_every_caller(tiger):
+    results = run_while_link_is_busy(
+        tiger, [lambda: tiger.move({"X": 100}), lambda: tiger.move({"Q": 100})]
+    )
+
+    assert all(
+        isinstance(result, Errors.UnrecognizedAxisParameterError) for result in results
+    )
@@ -15,3 +15,21 @@ def test_error():
 def test_unknown_error_code():
     with pytest.raises(Errors.UnknownError):
         Errors.raise_error_if_present("CMD", ":N-123")
+
+
+def test_bytes_success():
+    Errors.raise_error_if_present_in_bytes("CMD", b":A 1 2")
+
+
+def test_bytes_error():
+    with pytest.raises(Errors.MissingParametersError):
+        Errors.raise_error_if_present_in_bytes("CMD", b":N-3")
+
+
+@pytest.mark.parametrize("response", [":N-3", " :N-3", "\r\n:N-3", ":A\r:N-3"])
+def test_str_and_bytes_agree(response):
+    with pytest.raises(Errors.MissingParametersError):
+        Errors.raise_error_if_present("CMD", response)
+
+    with pytest.raises(Errors.MissingParametersError):
+        Errors.raise_error_if_present_in_bytes("CMD", response.encode("ascii"))
@@ -0,0 +1,98 @@
+import re
+
+import pytest
+
+from asitiger.command import Command
+from asitiger.errors import Errors
+from asitiger.macro import Macro, MacroExpectationError, Parameter
+from asitiger.simulator import SimulatedConnection
+from asitiger.tigercontroller import TigerController
+
+
+@pytest.fixture(scope="function")
+def tiger():
+    return TigerController(SimulatedConnection(baud_rate=None), poll_interval_s=0.001)
+
+
+def test_encode_fills_parameters():
+    macro = (
+        Macro()
+        .move({"X": Parameter("x", decimals=1), "Y": 5})
+        .led({"X": Parameter("led", decimals=0)}, card_address=7)
+        .command("W", {"X": "", "Y": ""}, flag_overrides=[""])
+    )
+
+    assert macro.encode(x=[1, 2.5], led=[10, 20]) == [
+        [b"M X=1.0 Y=5", b"7LED X=10", b"W X Y"],
+        [b"M X=2.5 Y=5", b"7LED X=20", b"W X Y"],
+    ]
+
+
+def test_encode_matches_command_format():
+    macro = Macro().move_relative({"X": Parameter("x"), "Z": -3})
+    expected = Command.format(Command.MOVREL, {"X": "12.2500", "Z": -3})
+
+    assert macro.encode(x=[12.25]) == [[expected.encode("ascii")]]
+
+
+def test_encode_from_numpy_array():
+    np = pytest.importorskip("numpy")
+    macro = Macro().move({"Z": Parameter("z", decimals=1)})
+
+    assert macro.encode(z=np.arange(3) * 0.5) == [
+        [b"M Z=0.0"],
+        [b"M Z=0.5"],
+        [b"M Z=1.0"],
+    ]
+
+
+def test_encode_checks_values():
+    macro = Macro().move({"X": Parameter("x"), "Y": Parameter("y")})
+
+    with pytest.raises(ValueError, match="same length"):
+        macro.encode(x=[1, 2], y=[1])
+
+    with pytest.raises(ValueError, match="No values"):
+        macro.encode(x=[1])
+
+    with pytest.raises(ValueError, match="too long"):
+        macro.encode(x=[1e15], y=[0])
+
+
+def test_run_steps_through_values(tiger):
+    positions = []
+    macro = (
+        Macro()
+        .move({"Z": Parameter("z")})
+        .wait_until_idle(axes=["Z"])
+        .call(lambda tiger: positions.append(tiger.where(["Z"])["Z"]))
+    )
+
+    assert macro.run(tiger, z=[10, 20, 30]) == 3
+    assert positions == [10.0, 20.0, 30.0]
+
+
+def test_run_without_parameters_runs_once(tiger):
+    assert Macro().move({"X": 5}).run(tiger) == 1
+
+
+def test_errors_stop_the_run(tiger):
+    macro = Macro().move({"Q": Parameter("q")})
+
+    with pytest.raises(Errors.UnrecognizedAxisParameterError):
+        macro.run(tiger, q=[1, 2])
+
+
+def test_expected_responses(tiger):
+    Macro().command("W", {"X": ""}, flag_overrides=[""], expect=b":A").run(tiger)
+    Macro().command("/", expect=re.compile(rb"[NB]")).run(tiger)
+
+    with pytest.raises(MacroExpectationError) as raised:
+        Macro().command("W", {"X": ""}, flag_overrides=[""]).command(
+            "/", expect=b":A"
+        ).run(tiger)
+
+    assert not isinstance(raised.value, Errors.AsiError)
+    assert raised.value.step == 1
+    assert raised.value.expected == b":A"
+    assert raised.value.response == b"N"
@@ -0,0 +1,179 @@
+import threading
+import time
+
+import pytest
+
+from asitiger.errors import Errors
+from asitiger.metrics import LatencyHistogram, Metrics
+from asitiger.simulator import SimulatedConnection
+from asitiger.threadedtigercontroller import ThreadedTigerController
+from asitiger.tigercontroller import TigerController
+
+
+@pytest.fixture(scope="function")
+def tiger():
+    return TigerController(SimulatedConnection(baud_rate=None), poll_interval_s=0.001)
+
+
+def test_disabled_by_default(tiger):
+    tiger.where(["X"])
+
+    assert tiger.metrics is None
+    assert tiger.connection.metrics is None
+
+
+@pytest.mark.parametrize(
+    "command, command_type",
+    [("W X Y", "W"), ("/", "/"), ("7LED X=50", "LED"), (b"RS X?", "RS")],
+)
+def test_command_type(command, command_type):
+    assert Metrics.command_type(command) == command_type
+
+
+def test_histogram_buckets():
+    histogram = LatencyHistogram()
+    for duration_s in [0.0004, 0.003, 0.003, 10.0]:
+        histogram.record(duration_s)
+
+    assert histogram.bucket_counts[0] == 1
+    assert histogram.bucket_counts[-1] == 1
+    assert histogram.quantile(0.5) == 0.005
+    assert histogram.quantile(1.0) == 10.0
+
+
+def test_commands_and_bytes_are_counted(tiger):
+    metrics = tiger.enable_metrics()
+
+    tiger.where(["X", "Y"])
+    tiger.send_command_raw(b"W X")
+    tiger.send_commands(["/", "/"])
+
+    snapshot = metrics.snapshot()
+    assert snapshot["commands"]["W"]["count"] == 2
+    assert snapshot["commands"]["/"]["count"] == 2
+    assert snapshot["bytes_sent"] == len(b"W X Y\rW X\r/\r/\r")
+    assert snapshot["bytes_received"] == len(b":A 0.0 0.0\r\n:A 0.0\r\nN\r\nN\r\n")
+
+
+def test_parsing_is_measured_separately(tiger):
+    metrics = tiger.enable_metrics()
+
+    tiger.where(["X", "Y"])
+    tiger.send_command("W X")
+    tiger.snapshot(["X"])
+
+    snapshot = metrics.snapshot()
+    assert snapshot["commands"]["W"]["count"] == 3
+    assert snapshot["parsing"]["W"]["count"] == 2
+    assert snapshot["parsing"]["RS"]["count"] == 1
+
+
+def test_waiting_for_the_lock_isnt_counted(tiger):
+    metrics = tiger.enable_metrics()
+
+    with tiger._lock:
+        waiting = threading.Thread(target=tiger.status)
+        waiting.start()
+        time.sleep(0.2)
+
+    waiting.join()
+    assert metrics.snapshot()["commands"]["/"]["max_s"] < 0.2
+
+
+def test_errors_are_counted_by_class(tiger):
+    metrics = tiger.enable_metrics()
+
+    with pytest.raises(Errors.UnknownCommandError):
+        tiger.send_command("NOPE")
+
+    with pytest.raises(Errors.UnrecognizedAxisParameterError):
+        tiger.send_commands(["W Q", "W X"])
+
+    assert metrics.errors == {
+        "UnknownCommandError": 1,
+        "UnrecognizedAxisParameterError": 1,
+    }
+    assert metrics.latencies["NOPE"].errors == 1
+
+
+def test_hooks(tiger):
+    metrics = tiger.enable_metrics()
+    sent = []
+    received = []
+    metrics.add_pre_send_hook(sent.append)
+    metrics.add_post_receive_hook(
+        lambda command, response, duration_s, error: received.append(
+            (command, response, error)
+        )
+    )
+
+    tiger.where(["X"])
+
+    assert sent == ["W X"]
+    assert received == [("W X", ":A 0.0", None)]
+
+
+def test_waits_are_recorded(tiger):
+    metrics = tiger.enable_metrics()
+    tiger.speed({"X": 1})
+    tiger.move({"X": 200})
+    tiger.wait_until_idle()
+
+    assert metrics.waits == 1
+    assert metrics.wait_polls > 1
+    assert metrics.wait_s >= metrics.wait_sleep_s > 0
+
+
+def test_timeouts_are_counted():
+    connection = SimulatedConnection(baud_rate=None, read_timeout_s=0.01)
+    tiger = TigerController(connection)
+    metrics = tiger.enable_metrics()
+
+    connection.read_response()
+
+    assert metrics.timeouts == 1
+    assert metrics.bytes_received == 0
+
+
+def test_threaded_batches_are_measured():
+    with ThreadedTigerController(SimulatedConnection(baud_rate=None)) as tiger:
+        metrics = tiger.enable_metrics()
+        futures = [tiger.submit_command("W X") for _ in range(4)]
+        [future.result() for future in futures]
+
+    assert metrics.latencies["W"].count == 4
+
+
+def test_disable(tiger):
+    metrics = tiger.enable_metrics()
+    tiger.disable_metrics()
+    tiger.where(["X"])
+
+    assert metrics.snapshot()["commands"] == {}
+
+
+def test_failing_hooks_are_skipped(tiger, caplog):
+    def fail(*args):
+        raise RuntimeError("hook failed")
+
+    metrics = tiger.enable_metrics()
+    metrics.add_pre_send_hook(fail)
+    metrics.add_post_receive_hook(fail)
+
+    assert tiger.where(["X"]) == {"X": 0.0}
+    assert metrics.latencies["W"].count == 1
+    assert "hook failed" in caplog.text
+
+
+def test_failing_hooks_dont_stop_threaded_batches():
+    def fail(*args):
+        raise RuntimeError("hook failed")
+
+    with ThreadedTigerController(SimulatedConnection(baud_rate=None)) as tiger:
+        metrics = tiger.enable_metrics()
+        metrics.add_pre_send_hook(fail)
+        metrics.add_post_receive_hook(fail)
+
+        futures = [tiger.submit_command(f"W {axis}") for axis in "XYZ"]
+        assert [future.result(timeout=1) for future in futures] == [":A 0.0"] * 3
+        assert tiger.where(["Y"]) == {"Y": 0.0}
@@ -0,0 +1,94 @@
+from concurrent.futures import wait
+
+import pytest
+
+from asitiger.errors import Errors
+from asitiger.motiontracker import MotionTracker
+from asitiger.movetime import MoveTimeModel
+from asitiger.simulator import SimulatedConnection, SimulatedTiger
+from asitiger.tigercontroller import TigerController
+
+
+@pytest.fixture(scope="function")
+def tiger():
+    return TigerController(SimulatedConnection(baud_rate=None), poll_interval_s=0.001)
+
+
+def test_move_resolves_when_idle(tiger):
+    tiger.speed({"X": 10})
+
+    with MotionTracker(tiger) as tracker:
+        future = tracker.move({"X": 1000})
+
+        assert future.result(timeout=1) is None
+        assert not tiger.is_busy(["X"])
+        assert tiger.where(["X"]) == {"X": 1000.0}
+
+
+def test_disjoint_moves_resolve_independently(tiger):
+    tiger.speed({"X": 100, "Z": 0.5})
+
+    with MotionTracker(tiger) as tracker:
+        fast = tracker.move_relative({"X": 1000})
+        slow = tracker.move_relative({"Z": 2000})
+
+        fast.result(timeout=1)
+        assert not slow.done()
+
+        slow.result(timeout=1)
+
+
+def test_move_error(tiger):
+    with MotionTracker(tiger) as tracker:
+        future = tracker.move({"Q": 1})
+
+        with pytest.raises(Errors.UnrecognizedAxisParameterError):
+            future.result(timeout=1)
+
+
+def test_home(tiger):
+    tiger.here({"Y": 500})
+
+    with MotionTracker(tiger) as tracker:
+        tracker.home(["Y"]).result(timeout=1)
+
+    assert tiger.where(["Y"]) == {"Y": 0.0}
+
+
+def test_predicted_moves_poll_less():
+    simulated_tiger = SimulatedTiger()
+    tiger = TigerController(
+        SimulatedConnection(simulated_tiger, baud_rate=None), poll_interval_s=0.001
+    )
+    tiger.speed({"X": 1, "Y": 1})
+    model = MoveTimeModel({"X": 1, "Y": 1})
+
+    with MotionTracker(tiger, move_time_model=model) as tracker:
+        commands_before = simulated_tiger.commands_received
+        futures = [tracker.move({"X": 500}), tracker.move_relative({"Y": 500})]
+        wait(futures, timeout=1)
+
+    assert all(future.done() for future in futures)
+    # where() + move + move_relative + only a handful of polls
+    assert simulated_tiger.commands_received - commands_before < 15
+
+
+def test_close_fails_pending_moves(tiger):
+    tiger.speed({"Z": 0.001})
+
+    tracker = MotionTracker(tiger)
+    future = tracker.move({"Z": 10000})
+    tracker.close()
+
+    with pytest.raises(RuntimeError):
+        future.result(timeout=1)
+
+
+def test_close_while_sending_fails_the_move(tiger, monkeypatch):
+    tracker = MotionTracker(tiger)
+    monkeypatch.setattr(tiger, "move", lambda coordinates: tracker.close())
+
+    future = tracker.move({"X": 10})
+
+    with pytest.raises(RuntimeError):
+        future.result(timeout=1)
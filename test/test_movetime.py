@@ -0,0 +1,26 @@
+import pytest
+
+from asitiger.movetime import MoveTimeModel
+
+
+@pytest.fixture()
+def model():
+    return MoveTimeModel({"X": "2.000000", "Y": 1.0}, overhead_s=0.1)
+
+
+def test_axis_duration(model):
+    assert model.axis_duration_s("X", -20000) == 1.0
+
+
+def test_slowest_axis_dominates(model):
+    assert model.duration_s({"X": 20000, "Y": 20000}) == pytest.approx(2.1)
+
+
+def test_no_motion(model):
+    assert model.duration_s({"X": 0}) == 0.0
+
+
+def test_duration_between(model):
+    assert model.duration_between_s(
+        {"X": 0, "Y": 100}, {"X": 40000, "Y": 100}
+    ) == pytest.approx(2.1)
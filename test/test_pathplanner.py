@@ -0,0 +1,93 @@
+import itertools
+
+import pytest
+
+from asitiger.movetime import MoveTimeModel
+from asitiger.simulator import SimulatedConnection
+from asitiger.tigercontroller import TigerController
+
+np = pytest.importorskip("numpy")
+
+from asitiger.pathplanner import PathPlanner  # noqa: E402
+
+
+@pytest.fixture()
+def planner():
+    return PathPlanner(MoveTimeModel({"X": 2.0, "Y": 1.0}))
+
+
+def test_slower_axis_dominates(planner):
+    durations = planner.durations_s(np.array([[0.0, 0.0], [20000.0, 10000.0]]))
+
+    assert durations[0, 1] == durations[1, 0] == pytest.approx(1.0)
+    assert durations[0, 0] == 0.0
+
+
+def test_overhead_only_for_moves():
+    planner = PathPlanner(MoveTimeModel({"X": 1.0}, overhead_s=0.5))
+
+    assert planner.travel_time_s([[0.0], [0.0], [10000.0]]) == pytest.approx(1.5)
+
+
+def test_matches_move_time_model(planner):
+    start, end = {"X": 100.0, "Y": -5000.0}, {"X": 30000.0, "Y": 2000.0}
+
+    assert planner.travel_time_s([start, end]) == pytest.approx(
+        planner.move_time_model.duration_between_s(start, end)
+    )
+
+
+def test_untangles_a_line(planner):
+    positions = [{"X": x * 10000.0, "Y": 0.0} for x in [0, 3, 1, 4, 2, 5]]
+
+    planned = planner.plan(positions)
+
+    assert [position["X"] for position in planned] == [x * 10000.0 for x in range(6)]
+
+
+def test_starts_from_start(planner):
+    positions = [[x * 10000.0, 0.0] for x in range(4)]
+
+    assert planner.order(positions, start={"X": 40000.0, "Y": 0.0}) == [3, 2, 1, 0]
+
+
+def test_no_reversal_improves_the_tour(planner):
+    random = np.random.RandomState(0)
+
+    for _ in range(5):
+        positions = random.uniform(0, 50000, size=(7, 2))
+        order = planner.order(positions)
+        travel_time_s = planner.travel_time_s(positions[order])
+
+        for start, stop in itertools.combinations(range(1, 8), 2):
+            reversed_order = order[:start] + order[start:stop][::-1] + order[stop:]
+            assert (
+                travel_time_s <= planner.travel_time_s(positions[reversed_order]) + 1e-9
+            )
+
+
+def test_beats_given_order_on_a_plate(planner):
+    random = np.random.RandomState(1)
+    wells = np.array([[x * 90000.0, y * 90000.0] for x in range(12) for y in range(8)])
+    shuffled = wells[random.permutation(len(wells))]
+
+    order = planner.order(shuffled)
+
+    assert sorted(order) == list(range(len(wells)))
+    assert planner.travel_time_s(shuffled[order]) < 0.2 * planner.travel_time_s(
+        shuffled
+    )
+
+
+def test_trivial_inputs(planner):
+    assert planner.order([]) == []
+    assert planner.order([[1.0, 2.0]]) == [0]
+    assert planner.travel_time_s([]) == 0.0
+
+
+def test_from_controller():
+    tiger = TigerController(SimulatedConnection(baud_rate=None))
+    planner = PathPlanner.from_controller(tiger, ["X", "Y"])
+
+    assert planner.axes == ["X", "Y"]
+    assert planner.move_time_model.speeds_mm_s["X"] == 7.5
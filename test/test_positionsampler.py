@@ -0,0 +1,70 @@
+import time
+
+import pytest
+
+from asitiger.simulator import SimulatedConnection
+from asitiger.tigercontroller import TigerController
+
+np = pytest.importorskip("numpy")
+
+from asitiger.positionsampler import PositionSampler  # noqa: E402
+
+
+@pytest.fixture(scope="function")
+def tiger():
+    return TigerController(SimulatedConnection(baud_rate=None))
+
+
+def test_sample(tiger):
+    tiger.here({"X": 1.5, "Y": -2})
+    sampler = PositionSampler(tiger, ["X", "Y"], capacity=4)
+
+    sampler.sample()
+    samples = sampler.latest()
+
+    assert samples.positions.tolist() == [[1.5, -2.0]]
+    assert samples.timestamps.shape == (1,)
+    assert samples.statuses is None
+
+
+def test_ring_buffer_wraps(tiger):
+    sampler = PositionSampler(tiger, ["X"], capacity=4)
+
+    for position in range(10):
+        tiger.here({"X": position})
+        sampler.sample()
+
+    samples = sampler.latest()
+
+    assert sampler.count == 10
+    assert samples.positions[:, 0].tolist() == [6, 7, 8, 9]
+    assert sampler.latest(2).positions[:, 0].tolist() == [8, 9]
+    assert np.all(np.diff(samples.timestamps) >= 0)
+
+
+def test_views_are_zero_copy_and_read_only(tiger):
+    sampler = PositionSampler(tiger, ["X"], capacity=4)
+    for _ in range(6):
+        sampler.sample()
+
+    positions = sampler.latest().positions
+
+    assert positions.base is not None
+    assert not positions.flags.writeable
+
+
+def test_statuses(tiger):
+    sampler = PositionSampler(tiger, ["X", "Z"], capacity=4, include_status=True)
+
+    sampler.sample()
+
+    assert sampler.latest().statuses.tolist() == [[2, 2]]
+
+
+def test_background_sampling(tiger):
+    with PositionSampler(tiger, ["X", "Y", "Z"], capacity=16) as sampler:
+        time.sleep(0.05)
+
+    assert sampler.count > 16
+    assert sampler.latest().positions.shape == (16, 3)
+    assert sampler.error is None
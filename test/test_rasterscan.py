@@ -0,0 +1,93 @@
+import pytest
+
+from asitiger.rasterscan import RasterScan
+from asitiger.simulator import SimulatedConnection, SimulatedTiger
+from asitiger.tigercontroller import TigerController
+
+
+@pytest.fixture(scope="function")
+def tiger():
+    return TigerController(SimulatedConnection(baud_rate=None), poll_interval_s=0.001)
+
+
+def test_axes_must_share_a_card(tiger):
+    with pytest.raises(ValueError):
+        RasterScan(tiger, "X", "Z")
+
+
+def test_configure(tiger):
+    scan = RasterScan(tiger, fast_axis="Y", slow_axis="X")
+    scan.configure(0.0, 0.2, -0.1, 0.1, 5, settle_time_s=0.01)
+
+    simulated = tiger.connection.tiger.scans["1"]
+    assert (simulated.fast_index, simulated.slow_index) == (1, 0)
+    assert simulated.fast_range_mm == [0.0, 0.2]
+    assert simulated.slow_range_mm == [-0.1, 0.1]
+    assert simulated.num_lines == 5
+    assert simulated.settle_s == 0.01
+
+
+def test_needs_a_line(tiger):
+    with pytest.raises(ValueError):
+        RasterScan(tiger).configure(0.0, 0.1, 0.0, 0.1, 0)
+
+
+@pytest.mark.parametrize(
+    "pattern, fast_end",
+    [(RasterScan.Pattern.RASTER, 0.1), (RasterScan.Pattern.SERPENTINE, 0.0)],
+)
+def test_scan_runs_to_completion(tiger, pattern, fast_end):
+    scan = RasterScan(tiger)
+    scan.configure(0.0, 0.1, 0.0, 0.03, 4, pattern=pattern)
+    assert scan.state() is RasterScan.State.IDLE
+
+    updates = []
+    scan.start()
+    assert scan.state() is RasterScan.State.RUNNING
+
+    final = scan.wait_until_done(on_progress=updates.append)
+
+    assert final.state is RasterScan.State.IDLE
+    assert final.line == 3
+    assert final.fraction == pytest.approx(1.0)
+    assert any(update.state is RasterScan.State.RUNNING for update in updates)
+    assert tiger.where(["X", "Y"]) == pytest.approx({"X": fast_end * 10000, "Y": 300})
+
+
+def test_progress_during_retraces():
+    now = [0.0]
+    simulated_tiger = SimulatedTiger(clock=lambda: now[0])
+    tiger = TigerController(SimulatedConnection(simulated_tiger, baud_rate=None))
+    simulated_scan = simulated_tiger.scans["1"]
+    fast = simulated_tiger.axes["X"]
+
+    num_lines = 4
+    scan = RasterScan(tiger)
+    scan.configure(0.0, 1.0, 0.0, 0.03, num_lines)
+    scan.start()
+
+    retraces_sampled = 0
+    progress = scan.progress()
+    while progress.state is RasterScan.State.RUNNING:
+        now[0] += 0.005
+        progress = scan.progress()
+
+        # Each line has a move to its start, then its sweep
+        moves_made = 2 * num_lines - len(simulated_scan._moves)
+        if fast.is_busy(now[0]) and fast._target == 0.0 and moves_made > 1:
+            retraces_sampled += 1
+            sweeps_done = (moves_made - 1) // 2
+            assert sweeps_done - 1 < progress.fraction * num_lines <= sweeps_done
+
+    assert retraces_sampled > 10
+    assert progress.fraction == 1.0
+
+
+def test_stop(tiger):
+    scan = RasterScan(tiger)
+    scan.configure(0.0, 1.0, 0.0, 1.0, 10)
+    scan.start()
+    scan.stop()
+
+    assert scan.state() is RasterScan.State.IDLE
+    assert not tiger.is_busy()
@@ -0,0 +1,36 @@
+from asitiger.rawresponse import RawResponse
+from asitiger.status import Status, status_from_decimal
+
+
+def test_numbers():
+    response = RawResponse("W X Y", b":A -989110.5 12 ")
+
+    assert response.numbers() == [-989110.5, 12.0]
+
+
+def test_numbers_into():
+    out = [0.0] * 4
+    response = RawResponse("W X Y", memoryview(b":A 1.5 -2"))
+
+    assert response.numbers_into(out, offset=1) == 2
+    assert out == [0.0, 1.5, -2.0, 0.0]
+
+
+def test_as_dict():
+    response = RawResponse("S X? Y?", b":A X=29.998830 Y=1")
+
+    assert response.as_dict() == {"X": "29.998830", "Y": "1"}
+    assert response.as_dict(float) == {"X": 29.99883, "Y": 1.0}
+
+
+def test_statuses():
+    response = RawResponse("RS X Y?", b":A 10N")
+
+    assert response.statuses() == [status_from_decimal(10), Status.IDLE]
+
+
+def test_text_and_equality():
+    response = RawResponse("/", b"N")
+
+    assert response.text == "N"
+    assert response == b"N"
@@ -0,0 +1,120 @@
+import io
+import struct
+import time
+
+import pytest
+
+from asitiger.recording import (
+    MAGIC,
+    RECEIVED,
+    SENT,
+    Record,
+    RecordingConnection,
+    ReplayConnection,
+    iter_records,
+    read_records,
+    write_record,
+)
+from asitiger.simulator import SimulatedConnection
+from asitiger.status import Status
+from asitiger.tigercontroller import TigerController
+
+
+def record_session(path, baud_rate=None):
+    tiger = TigerController(
+        RecordingConnection(SimulatedConnection(baud_rate=baud_rate), path)
+    )
+    tiger.move({"X": 100})
+    tiger.wait_until_idle()
+    where = tiger.where(["X", "Y"])
+    tiger.connection.disconnect()
+    return where
+
+
+def test_record_round_trip():
+    file = io.BytesIO()
+    file.write(MAGIC)
+    write_record(file, Record(SENT, 0.5, b"W X\r"))
+    write_record(file, Record(RECEIVED, 0.75, b":A 0\r\n"))
+    file.seek(0)
+
+    assert list(iter_records(file)) == [
+        Record(SENT, 0.5, b"W X\r"),
+        Record(RECEIVED, 0.75, b":A 0\r\n"),
+    ]
+
+
+def test_large_payloads_round_trip():
+    data = b"x" * 100000
+
+    file = io.BytesIO()
+    file.write(MAGIC)
+    write_record(file, Record(RECEIVED, 0.5, data))
+    file.seek(0)
+
+    assert list(iter_records(file)) == [Record(RECEIVED, 0.5, data)]
+
+
+def test_version_1_recordings_can_be_read():
+    file = io.BytesIO(
+        b"ASITIGER-REC\x01" + struct.pack("<cdH", SENT, 0.5, 4) + b"W X\r"
+    )
+
+    assert list(iter_records(file)) == [Record(SENT, 0.5, b"W X\r")]
+
+
+def test_not_a_recording():
+    with pytest.raises(ValueError):
+        list(iter_records(io.BytesIO(b"garbage")))
+
+
+def test_session_is_recorded(tmp_path):
+    path = str(tmp_path / "session.rec")
+    record_session(path)
+
+    records = read_records(path)
+    assert records[0] == Record(SENT, records[0].timestamp_s, b"M X=100\r")
+    assert records[1].direction == RECEIVED
+    assert [record.timestamp_s for record in records] == sorted(
+        record.timestamp_s for record in records
+    )
+
+
+def test_replay_gives_the_same_results(tmp_path):
+    path = str(tmp_path / "session.rec")
+    where = record_session(path)
+
+    connection = ReplayConnection(path, speed=None)
+    tiger = TigerController(connection)
+    tiger.move({"X": 100})
+    tiger.wait_until_idle()
+
+    assert tiger.where(["X", "Y"]) == where
+    assert connection.connection.remaining_commands == 0
+
+
+def test_replay_speed(tmp_path):
+    path = tmp_path / "session.rec"
+    with open(str(path), "wb") as file:
+        file.write(MAGIC)
+        write_record(file, Record(SENT, 0.0, b"/\r"))
+        write_record(file, Record(RECEIVED, 0.2, b"N\r\n"))
+
+    for speed, expected_s in [(1.0, 0.2), (4.0, 0.05)]:
+        tiger = TigerController(ReplayConnection(str(path), speed=speed))
+
+        start = time.monotonic()
+        assert tiger.status() is Status.IDLE
+        assert time.monotonic() - start == pytest.approx(expected_s, abs=0.04)
+
+
+def test_mismatched_commands(tmp_path):
+    path = str(tmp_path / "session.rec")
+    record_session(path)
+
+    tiger = TigerController(ReplayConnection(path, speed=None))
+    with pytest.raises(ValueError):
+        tiger.where(["X"])
+
+    lenient = TigerController(ReplayConnection(path, speed=None, strict=False))
+    assert lenient.send_command("W X") == ":A"
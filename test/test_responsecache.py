@@ -0,0 +1,145 @@
+import pytest
+
+from asitiger.command import Command
+from asitiger.responsecache import ResponseCache
+from asitiger.simulator import SimulatedConnection
+from asitiger.threadedtigercontroller import ThreadedTigerController
+from asitiger.tigercontroller import TigerController
+
+
+@pytest.fixture(scope="function")
+def tiger():
+    tiger = TigerController(SimulatedConnection(baud_rate=None))
+    tiger.enable_cache()
+    return tiger
+
+
+def commands_received(tiger) -> int:
+    return tiger.connection.tiger.commands_received
+
+
+@pytest.mark.parametrize(
+    "command, is_query",
+    [
+        ("WHO", True),
+        ("BU X", True),
+        ("2BU X", True),
+        ("S X? Y?", True),
+        ("S X=1 Y?", False),
+        ("SECURE X=0", False),
+        ("/", False),
+        ("HM X?", True),
+    ],
+)
+def test_is_query(command, is_query):
+    assert ResponseCache.is_query(command) is is_query
+
+
+def test_queries_are_cached(tiger):
+    tiger.who()
+    tiger.speed({"X": "?"})
+    sent = commands_received(tiger)
+
+    assert tiger.who() == tiger.who()
+    assert tiger.speed({"X": "?"}) == {"X": "7.500000"}
+    assert commands_received(tiger) == sent
+    assert tiger.cache.hits == 3
+
+
+def test_uncached_commands_always_go_to_the_controller(tiger):
+    tiger.where(["X"])
+    tiger.where(["X"])
+
+    assert commands_received(tiger) == 2
+    assert len(tiger.cache) == 0
+
+
+def test_writes_invalidate_their_verb(tiger):
+    tiger.speed({"X": "?"})
+    tiger.who()
+
+    tiger.speed({"X": 2})
+
+    assert tiger.speed({"X": "?"}) == {"X": "2.000000"}
+    assert len(tiger.cache) == 2
+
+
+def test_pipelined_writes_invalidate(tiger):
+    tiger.speed({"X": "?"})
+    tiger.send_commands(["S X=3", "W X"])
+
+    assert tiger.speed({"X": "?"}) == {"X": "3.000000"}
+
+
+def test_card_setting_writes_invalidate(tiger):
+    tiger.send_command("1SECURE X?")
+    tiger.secure({"X": 0.5}, card_address=1)
+
+    assert tiger.send_command("1SECURE X?") == ":A X=0.5"
+
+
+def test_entries_expire():
+    clock = [0.0]
+    cache = ResponseCache({Command.SPEED: 1.0}, clock=lambda: clock[0])
+    cache.put("S X?", ":A X=1")
+
+    clock[0] = 0.5
+    assert cache.get("S X?") == ":A X=1"
+
+    clock[0] = 1.5
+    assert cache.get("S X?") is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_are_evicted():
+    cache = ResponseCache(max_entries=2)
+    cache.put("S X?", ":A X=1")
+    cache.put("S Y?", ":A Y=1")
+    cache.get("S X?")
+    cache.put("S Z?", ":A Z=1")
+
+    assert cache.get("S Y?") is None
+    assert cache.get("S X?") == ":A X=1"
+
+
+def test_replies_fetched_across_an_invalidation_are_not_cached():
+    cache = ResponseCache()
+
+    def send(command):
+        # Another thread writes the same setting while the query is in flight
+        cache.invalidate_for("S X=5")
+        return ":A X=1"
+
+    assert cache.fetch("S X?", send) == ":A X=1"
+    assert cache.get("S X?") is None
+
+    cache.fetch("S X?", lambda command: ":A X=5")
+    assert cache.get("S X?") == ":A X=5"
+
+
+def test_uncached_verbs_are_not_tracked():
+    cache = ResponseCache()
+    cache.put("S X?", ":A X=1")
+    cache.invalidate_for("M X=5")
+    cache.invalidate_for("R X=5")
+
+    assert cache.get("S X?") == ":A X=1"
+    assert not cache._generations
+
+
+def test_errors_are_not_cached(tiger):
+    with pytest.raises(Exception):
+        tiger.speed({"Q": "?"})
+
+    assert len(tiger.cache) == 0
+
+
+def test_threaded_controller():
+    with ThreadedTigerController(SimulatedConnection(baud_rate=None)) as tiger:
+        cache = tiger.enable_cache()
+        tiger.who()
+        tiger.who()
+        tiger.submit_command("S X=2").result()
+
+        assert cache.hits == 1
+        assert tiger.speed({"X": "?"}) == {"X": "2.000000"}
@@ -0,0 +1,116 @@
+import pytest
+
+from asitiger.errors import Errors
+from asitiger.ringbuffer import RingBuffer
+from asitiger.simulator import SimulatedConnection
+from asitiger.tigercontroller import TigerController
+
+
+@pytest.fixture(scope="function")
+def tiger():
+    return TigerController(SimulatedConnection(baud_rate=None))
+
+
+def test_axis_byte_follows_card_order(tiger):
+    assert RingBuffer(tiger, ["Y"]).axis_byte == 0b10
+    assert RingBuffer(tiger, ["X", "Y"]).axis_byte == 0b11
+    assert RingBuffer(tiger, ["Z"]).card_address == "2"
+
+
+def test_axes_must_share_a_card(tiger):
+    with pytest.raises(ValueError):
+        RingBuffer(tiger, ["X", "Z"])
+
+
+def test_upload_coordinate_dicts(tiger):
+    ring_buffer = RingBuffer(tiger, ["X", "Y"])
+    ring_buffer.upload([{"X": 100, "Y": 200}, {"X": 300, "Y": 400}])
+
+    simulated = tiger.connection.tiger.ring_buffers["1"]
+    assert simulated.points == [{"X": 100, "Y": 200}, {"X": 300, "Y": 400}]
+    assert simulated.axis_byte == 0b11
+    assert ring_buffer.num_points == 2
+
+
+def test_upload_array_rows():
+    np = pytest.importorskip("numpy")
+    tiger = TigerController(SimulatedConnection(baud_rate=None))
+
+    ring_buffer = RingBuffer(tiger, ["X", "Y"])
+    ring_buffer.upload(np.array([[1.5, 2.0], [3.0, 4.0], [5.0, 6.0]]))
+    ring_buffer.upload(np.array([[7.0, 8.0]]))
+
+    assert tiger.connection.tiger.ring_buffers["1"].points == [{"X": 7.0, "Y": 8.0}]
+
+
+def test_upload_rejects_bad_positions(tiger):
+    ring_buffer = RingBuffer(tiger, ["X", "Y"], capacity=2)
+
+    with pytest.raises(ValueError):
+        ring_buffer.upload([[1, 2, 3]])
+
+    with pytest.raises(ValueError):
+        ring_buffer.upload([[1, 2]] * 3)
+
+
+def test_ttl_steps_through_positions(tiger):
+    ring_buffer = RingBuffer(tiger, ["X", "Y"])
+    ring_buffer.upload([[100, 200], [300, 400]])
+    ring_buffer.arm(RingBuffer.Mode.TTL)
+
+    assert tiger.connection.tiger.card_settings[("1", "TTL")] == {"X": "1"}
+    assert ring_buffer.pointer() == 0
+
+    ring_buffer.trigger()
+    tiger.wait_until_idle()
+    assert tiger.where(["X", "Y"]) == {"X": 100.0, "Y": 200.0}
+    assert ring_buffer.pointer() == 1
+
+    ring_buffer.trigger()
+    tiger.wait_until_idle()
+    assert tiger.where(["X", "Y"]) == {"X": 300.0, "Y": 400.0}
+    assert ring_buffer.pointer() == 0
+
+
+def test_ttl_input_pulses_step_an_armed_ring_buffer(tiger):
+    ring_buffer = RingBuffer(tiger, ["X", "Y"])
+    ring_buffer.upload([[100, 200], [300, 400]])
+
+    simulated = tiger.connection.tiger
+    simulated.ttl_pulse("1")
+    tiger.wait_until_idle()
+    assert tiger.where(["X", "Y"]) == {"X": 0.0, "Y": 0.0}
+
+    ring_buffer.arm(RingBuffer.Mode.TTL)
+    simulated.ttl_pulse("1")
+    tiger.wait_until_idle()
+    assert tiger.where(["X", "Y"]) == {"X": 100.0, "Y": 200.0}
+
+
+def test_timed_one_shot_runs_to_the_end():
+    clock = [0.0]
+    connection = SimulatedConnection(baud_rate=None)
+    connection.tiger.clock = lambda: clock[0]
+    tiger = TigerController(connection)
+
+    ring_buffer = RingBuffer(tiger, ["X"])
+    ring_buffer.upload([[10], [20], [30]])
+    ring_buffer.arm(RingBuffer.Mode.ONE_SHOT, interval_s=1.0)
+    ring_buffer.trigger()
+
+    clock[0] = 1.5
+    assert ring_buffer.pointer() == 2
+
+    clock[0] = 10.0
+    assert ring_buffer.pointer() == 0
+    assert tiger.where(["X"]) == {"X": 30.0}
+
+
+def test_timed_modes_need_an_interval(tiger):
+    with pytest.raises(ValueError):
+        RingBuffer(tiger, ["X"]).arm(RingBuffer.Mode.REPEAT)
+
+
+def test_errors_are_raised(tiger):
+    with pytest.raises(Errors.UnrecognizedAxisParameterError):
+        tiger.send_command("1LD Z=100")
@@ -0,0 +1,35 @@
+import pytest
+
+from asitiger.scheduledserial import ScheduledSerial
+
+
+class FixedClockSerial(ScheduledSerial):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.now = 0.0
+
+    def _now(self) -> float:
+        return self.now
+
+    def write(self, data: bytes) -> int:
+        self._schedule(self.now + 1.0, data.upper())
+        return len(data)
+
+
+def test_requires_a_clock_and_write():
+    class NoWrite(ScheduledSerial):
+        def _now(self):
+            return 0.0
+
+    with pytest.raises(TypeError):
+        NoWrite()
+
+
+def test_bytes_arrive_when_scheduled():
+    serial = FixedClockSerial(timeout=0)
+    serial.write(b"ok\n")
+
+    assert serial.in_waiting == 0
+
+    serial.now = 1.0
+    assert serial.readline() == b"OK\n"
@@ -7,27 +7,77 @@ from asitiger.serialconnection import SerialConnection
 def test_send_command(mock_serial):
     connection = SerialConnection("/dev/ttyS01", 115200)
     serial = mock_serial.return_value
+    serial.in_waiting = 0
 
     connection.send_command("My Command")
 
-    serial.reset_input_buffer.assert_called_once()
-    serial.reset_output_buffer.assert_called_once()
+    serial.reset_input_buffer.assert_not_called()
+    serial.reset_output_buffer.assert_not_called()
 
     serial.write.assert_called_once_with(b"My Command\r")
 
 
+@patch("asitiger.serialconnection.serial.Serial")
+def test_send_command_discards_stray_bytes(mock_serial):
+    connection = SerialConnection("/dev/ttyS01", 115200)
+    serial = mock_serial.return_value
+    serial.in_waiting = 6
+
+    connection.send_command("My Command")
+
+    serial.reset_input_buffer.assert_called_once()
+    assert connection.stray_bytes_discarded == 6
+
+
 @patch("asitiger.serialconnection.serial.Serial")
 def test_read_response_stripped(mock_serial):
     connection = SerialConnection("/dev/ttyS01", 115200)
     serial = mock_serial.return_value
 
-    serial.readline.return_value = b"  Some Response\r\n"
+    serial.in_waiting = 0
+    serial.read.side_effect = [b"  Some Resp", b"onse\r\n"]
 
     response = connection.read_response()
 
     assert response == "Some Response"
 
 
+@patch("asitiger.serialconnection.serial.Serial")
+def test_read_response_frames(mock_serial):
+    connection = SerialConnection("/dev/ttyS01", 115200)
+    serial = mock_serial.return_value
+
+    serial.in_waiting = 0
+    serial.read.side_effect = [b":A 1\r\n:A 2\r\nN\r", b"\n"]
+
+    assert connection.read_response() == ":A 1"
+    assert connection.read_response() == ":A 2"
+    assert connection.read_response() == "N"
+    assert serial.read.call_count == 2
+
+
+@patch("asitiger.serialconnection.serial.Serial")
+def test_read_response_multiline(mock_serial):
+    connection = SerialConnection("/dev/ttyS01", 115200)
+    serial = mock_serial.return_value
+
+    serial.in_waiting = 0
+    serial.read.side_effect = [b"TIGER_COMM\rMotor Axes: X Y\r\n"]
+
+    assert connection.read_response() == "TIGER_COMM\rMotor Axes: X Y"
+
+
+@patch("asitiger.serialconnection.serial.Serial")
+def test_read_response_timeout(mock_serial):
+    connection = SerialConnection("/dev/ttyS01", 115200)
+    serial = mock_serial.return_value
+
+    serial.in_waiting = 0
+    serial.read.side_effect = [b":A 1", b""]
+
+    assert connection.read_response() == ":A 1"
+
+
 @patch("asitiger.serialconnection.serial.Serial")
 def test_context_manager(mock_serial):
 
@@ -35,3 +85,25 @@ def test_context_manager(mock_serial):
         serial = mock_serial.return_value
 
     serial.close.assert_called_once()
+
+
+@patch("asitiger.serialconnection.serial.Serial")
+def test_send_command_bytes(mock_serial):
+    connection = SerialConnection("/dev/ttyS01", 115200)
+    serial = mock_serial.return_value
+    serial.in_waiting = 0
+
+    connection.send_command(b"W X")
+
+    serial.write.assert_called_once_with(b"W X\r")
+
+
+@patch("asitiger.serialconnection.serial.Serial")
+def test_read_response_bytes(mock_serial):
+    connection = SerialConnection("/dev/ttyS01", 115200)
+    serial = mock_serial.return_value
+
+    serial.in_waiting = 0
+    serial.read.return_value = b":A 1 2 \r\n"
+
+    assert connection.read_response_bytes() == b":A 1 2"
@@ -0,0 +1,204 @@
+import time
+
+import pytest
+
+from asitiger.errors import Errors
+from asitiger.simulator import (
+    SimulatedAxis,
+    SimulatedConnection,
+    SimulatedTiger,
+    SimulatedTigerPty,
+)
+from asitiger.status import AxisStatus, Status
+from asitiger.tigercontroller import TigerController
+
+
+@pytest.fixture(scope="function")
+def tiger():
+    return TigerController(SimulatedConnection(baud_rate=None))
+
+
+def test_where_and_move(tiger):
+    tiger.speed({"X": 1000, "Y": 1000})
+    tiger.move({"X": 100, "Y": -200})
+    tiger.wait_until_idle(poll_interval_s=0.001)
+
+    assert tiger.where(["X", "Y"]) == {"X": 100.0, "Y": -200.0}
+
+
+def test_move_relative(tiger):
+    tiger.here({"X": 50})
+    tiger.move_relative({"X": 25})
+    tiger.wait_until_idle(poll_interval_s=0.001)
+
+    assert tiger.where(["X"]) == {"X": 75.0}
+
+
+def test_busy_while_moving(tiger):
+    tiger.speed({"Z": 0.001})
+    tiger.move({"Z": 10000})
+
+    assert tiger.is_busy()
+    assert tiger.rdstat(["Z"])[0].status == Status.BUSY
+
+    tiger.halt()
+
+    assert not tiger.is_busy()
+
+
+def test_rdstat(tiger):
+    axis_status, flag = tiger.rdstat(["X", "Y?"])
+
+    assert isinstance(axis_status, AxisStatus)
+    assert flag == Status.IDLE
+
+
+def test_speed_query(tiger):
+    tiger.speed({"X": 2.5})
+
+    assert tiger.speed({"X": "?"}) == {"X": "2.500000"}
+
+
+def test_axes(tiger):
+    assert [axis.label for axis in tiger.axes()] == ["X", "Y", "Z"]
+    assert [axis.label for axis in tiger.axes(card_address=2)] == ["Z"]
+
+
+def test_errors(tiger):
+    with pytest.raises(Errors.UnknownCommandError):
+        tiger.send_command("NOPE")
+
+    with pytest.raises(Errors.UnrecognizedAxisParameterError):
+        tiger.move({"Q": 1})
+
+    with pytest.raises(Errors.InvalidCardAddressException):
+        tiger.led({"X": 50}, card_address=9)
+
+
+def test_disabled_axis_cannot_move(tiger):
+    tiger.disable_axes(["X"])
+
+    with pytest.raises(Errors.OperationFailedError):
+        tiger.move({"X": 1})
+
+
+def test_home(tiger):
+    tiger.here({"Y": 10})
+    tiger.set_home({"Y": "+"})
+    tiger.move({"Y": 500})
+    tiger.wait_until_idle(poll_interval_s=0.001)
+    tiger.home(["Y"])
+    tiger.wait_until_idle(poll_interval_s=0.001)
+
+    assert tiger.where(["Y"]) == {"Y": 10.0}
+
+
+def test_card_settings_round_trip(tiger):
+    tiger.led({"X": 75}, card_address=1)
+
+    assert tiger.send_command("1LED X?") == ":A X=75"
+
+
+def test_motion_takes_time():
+    axis = SimulatedAxis("X", speed_mm_s=1.0)
+
+    axis.move_to(10000, now=0.0)
+
+    assert axis.is_busy(0.5)
+    assert axis.position(0.5) == 5000
+    assert not axis.is_busy(1.0)
+
+
+def test_wire_delay():
+    tiger = TigerController(SimulatedConnection(baud_rate=9600))
+
+    start = time.monotonic()
+    tiger.where(["X", "Y", "Z"])
+
+    # 8 characters out and 22 back at ~1ms per character
+    assert time.monotonic() - start >= 0.025
+
+
+def test_read_timeout():
+    connection = SimulatedConnection(baud_rate=None, read_timeout_s=0.01)
+
+    assert connection.read_response() == ""
+
+
+def test_pty():
+    with SimulatedTigerPty(SimulatedTiger(), baud_rate=None) as pty:
+        tiger = TigerController.from_serial_port(pty.port)
+        try:
+            assert tiger.status() == Status.IDLE
+            assert tiger.where(["X"]) == {"X": 0.0}
+        finally:
+            tiger.connection.disconnect()
+
+
+def test_pipelined_commands(tiger):
+    tiger.here({"X": 1, "Y": 2})
+
+    assert tiger.send_commands(["W X", "W Y", "/", "S Z?"], window=2) == [
+        ":A 1.0",
+        ":A 2.0",
+        "N",
+        ":A Z=1.200000",
+    ]
+
+
+def test_wait_on_axes(tiger):
+    tiger.speed({"Z": 0.001})
+    tiger.move({"X": 10, "Z": 10000})
+
+    tiger.wait_until_idle(poll_interval_s=0.001, axes=["X", "Y"])
+
+    assert not tiger.is_busy(["X"])
+    assert tiger.is_busy(["Z"])
+    assert tiger.is_busy()
+
+
+def test_topology_is_cached(tiger):
+    simulated_tiger = tiger.connection.tiger
+
+    tiger.axes()
+    commands_received = simulated_tiger.commands_received
+    tiger.axes()
+    tiger.card_address_for("Z")
+
+    assert simulated_tiger.commands_received == commands_received
+
+    tiger.axes(refresh=True)
+
+    assert simulated_tiger.commands_received == commands_received + 1
+
+
+def test_card_routing_by_axis(tiger):
+    tiger.led({"X": 40}, axis="Z")
+    tiger.set_plate_lock(1, axis="X")
+
+    assert tiger.send_command("2LED X?") == ":A X=40"
+    assert tiger.send_command("1SECURE X?") == ":A X=1"
+    assert tiger.build(axis="Z")[0] == "ZMotor"
+
+
+def test_send_command_raw(tiger):
+    tiger.here({"X": 3, "Y": 4})
+
+    assert tiger.send_command_raw(b"W X Y").numbers() == [3.0, 4.0]
+
+    with pytest.raises(Errors.UnknownCommandError):
+        tiger.send_command_raw("NOPE")
+
+
+def test_late_reply_is_discarded():
+    connection = SimulatedConnection(baud_rate=None, read_timeout_s=0.01)
+    tiger = TigerController(connection)
+    connection.tiger.processing_time_s = 0.05
+
+    # The reply arrives after the read gave up waiting for it
+    assert tiger.send_command("W X") == ""
+    time.sleep(0.06)
+    connection.tiger.processing_time_s = 0.0
+
+    assert tiger.send_command("W Y") == ":A 0.0"
+    assert connection.stray_bytes_discarded == len(b":A 0.0\r\n")
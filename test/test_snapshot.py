@@ -0,0 +1,64 @@
+import pytest
+
+from asitiger.simulator import SimulatedConnection
+from asitiger.status import AxisStatus, Status
+from asitiger.tigercontroller import TigerController
+
+
+@pytest.fixture(scope="function")
+def tiger():
+    return TigerController(SimulatedConnection(baud_rate=None), poll_interval_s=0.001)
+
+
+def test_snapshot_of_every_axis(tiger):
+    snapshot = tiger.snapshot()
+
+    assert snapshot.axes == ("X", "Y", "Z")
+    assert snapshot.positions == (0.0, 0.0, 0.0)
+    assert all(isinstance(status, AxisStatus) for status in snapshot.statuses)
+    assert snapshot.speeds == (7.5, 7.5, 1.2)
+    assert not snapshot.busy
+
+
+def test_snapshot_pipelines_its_queries(tiger):
+    sent = tiger.connection.tiger.commands_received
+    tiger.snapshot(["X"], include_speeds=False)
+
+    assert tiger.connection.tiger.commands_received == sent + 2
+
+
+def test_snapshot_is_immutable(tiger):
+    snapshot = tiger.snapshot(["X"])
+
+    with pytest.raises(AttributeError):
+        snapshot.positions = (1.0,)
+
+
+def test_busy_axes(tiger):
+    tiger.speed({"Z": 0.01})
+    tiger.move({"Z": 1000})
+    snapshot = tiger.snapshot()
+
+    assert snapshot.busy
+    assert snapshot.axis("Z").status.status is Status.BUSY
+    assert snapshot.axis("X").status.status is Status.IDLE
+
+
+def test_diff(tiger):
+    before = tiger.snapshot(["X", "Y"])
+    tiger.move({"X": 100})
+    tiger.wait_until_idle()
+    after = tiger.snapshot(["X", "Y"])
+
+    assert after.diff(before) == {"X": {"position": (0.0, 100.0)}}
+    assert after.diff(after) == {}
+
+
+def test_diff_with_different_axes(tiger):
+    before = tiger.snapshot(["X"], include_speeds=False)
+    after = tiger.snapshot(["Y"], include_speeds=False)
+
+    changes = after.diff(before)
+    assert list(changes) == ["Y", "X"]
+    assert changes["X"]["position"] == (0.0, None)
+    assert set(after.diff(None)["Y"]) == {"position", "status"}
@@ -1,3 +1,5 @@
+import pytest
+
 from asitiger.status import (
     AxisEnabledStatus,
     AxisStatus,
@@ -7,8 +9,11 @@ from asitiger.status import (
     RampingDirection,
     RampingStatus,
     Status,
+    decode_status_bytes,
+    status_bytes_for_rdstat,
     status_from_decimal,
     statuses_for_rdstat,
+    statuses_from_decimals,
 )
 
 RDSTAT_RESPONSE = ":A  10N 138"
@@ -57,3 +62,68 @@ def test_statuses_for_rdstat_types():
 def test_from_flag_str():
     assert Status.from_flag("N") == Status.IDLE
     assert Status.from_flag("B") == Status.BUSY
+
+
+def test_status_from_decimal_all_bytes():
+    for status_byte in range(256):
+        bits = [(status_byte >> bit) & 1 for bit in range(8)]
+        axis = status_from_decimal(str(status_byte))
+
+        assert axis.status == Status.from_flag(bits[0])
+        assert [field.value for field in axis[1:]] == bits[1:]
+
+
+def test_statuses_from_decimals():
+    assert statuses_from_decimals(["210", 2]) == [
+        status_from_decimal(210),
+        status_from_decimal(2),
+    ]
+
+
+@pytest.mark.parametrize("status_byte", [-1, 256, "garbled", "2.5"])
+def test_status_from_decimal_rejects_invalid_bytes(status_byte):
+    with pytest.raises(ValueError):
+        status_from_decimal(status_byte)
+
+    with pytest.raises(ValueError):
+        statuses_from_decimals([2, status_byte])
+
+
+def test_statuses_for_rdstat_values():
+    assert statuses_for_rdstat(RDSTAT_RESPONSE) == [
+        status_from_decimal(10),
+        Status.IDLE,
+        status_from_decimal(138),
+    ]
+
+
+@pytest.mark.parametrize("response", [":A 10N 138", "10N 138", ":A   10 N 138 "])
+def test_statuses_for_rdstat_prefixes_and_spacing(response):
+    assert statuses_for_rdstat(response) == [
+        status_from_decimal(10),
+        Status.IDLE,
+        status_from_decimal(138),
+    ]
+
+
+def test_status_bytes_for_rdstat():
+    np = pytest.importorskip("numpy")
+
+    assert np.array_equal(status_bytes_for_rdstat(":A 10 138 3"), [10, 138, 3])
+    assert np.array_equal(status_bytes_for_rdstat("10 138 3"), [10, 138, 3])
+
+
+def test_decode_status_bytes():
+    pytest.importorskip("numpy")
+
+    decoded = decode_status_bytes([210, 1, 255])
+
+    assert decoded.shape == (3,)
+    assert decoded["status"].tolist() == [0, 1, 1]
+    assert decoded["ramping"].tolist() == [1, 0, 1]
+    assert decoded["lower_limit"].tolist() == [1, 0, 1]
+
+    for status_byte, bits in zip([210, 1, 255], decoded):
+        axis = status_from_decimal(status_byte)
+        assert bits["enabled"] == axis.enabled.value
+        assert bits["upper_limit"] == axis.upper_limit.value
@@ -0,0 +1,91 @@
+import concurrent.futures
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from asitiger.errors import Errors
+from asitiger.simulator import SimulatedConnection
+from asitiger.status import Status
+from asitiger.threadedtigercontroller import ThreadedTigerController
+
+
+@pytest.fixture(scope="function")
+def tiger():
+    with ThreadedTigerController(SimulatedConnection(baud_rate=None)) as tiger:
+        yield tiger
+
+
+def test_submit_command(tiger):
+    assert tiger.submit_command("/").result() == "N"
+
+
+def test_submit_command_error(tiger):
+    future = tiger.submit_command("M Q=1")
+
+    with pytest.raises(Errors.UnrecognizedAxisParameterError):
+        future.result()
+
+
+def test_commands_from_many_threads(tiger):
+    tiger.here({"X": 1, "Y": 2, "Z": 3})
+
+    def query(index):
+        axis = "XYZ"[index % 3]
+        return axis, tiger.where([axis])[axis]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(query, range(300)))
+
+    assert all(position == "_XYZ".index(axis) for axis, position in results)
+
+
+def test_errors_are_isolated(tiger):
+    futures = [tiger.submit_command(command) for command in ["W X", "NOPE", "/"]]
+
+    assert futures[0].result() == ":A 0.0"
+    assert isinstance(futures[1].exception(), Errors.UnknownCommandError)
+    assert futures[2].result() == "N"
+
+
+def test_high_level_methods(tiger):
+    tiger.move({"X": 10})
+    tiger.wait_until_idle(poll_interval_s=0.001)
+
+    assert tiger.status() == Status.IDLE
+    assert tiger.send_commands(["W X", "/"]) == [":A 10.0", "N"]
+
+
+def test_closed():
+    tiger = ThreadedTigerController(SimulatedConnection(baud_rate=None))
+    tiger.close()
+
+    with pytest.raises(RuntimeError):
+        tiger.status()
+
+
+def test_commands_racing_close_all_finish():
+    tiger = ThreadedTigerController(SimulatedConnection(baud_rate=None))
+
+    def submit():
+        try:
+            return tiger.submit_command("/")
+        except RuntimeError:
+            return None
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        submitted = [executor.submit(submit) for _ in range(200)]
+        tiger.close()
+
+    for future in filter(
+        None, (submitted_future.result() for submitted_future in submitted)
+    ):
+        assert future.result(timeout=5) == "N"
+
+
+def test_batches_hold_the_controller_lock(tiger):
+    with tiger._lock:
+        future = tiger.submit_command("/")
+        with pytest.raises(concurrent.futures.TimeoutError):
+            future.result(timeout=0.1)
+
+    assert future.result(timeout=5) == "N"
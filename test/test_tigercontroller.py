@@ -1,6 +1,8 @@
 from unittest.mock import Mock
 
 import pytest
+from asitiger.errors import Errors
+from asitiger.status import Status
 from asitiger.tigercontroller import TigerController
 
 
@@ -42,3 +44,174 @@ def test_send_command(tiger):
 
     with pytest.raises(Exception):
         tiger.send_command("Nice")
+
+
+class PipelinedConnection:
+    def __init__(self, responses):
+        self.responses = responses
+        self.sent = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def send_command(self, command):
+        self.sent.append(command)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def read_response(self):
+        self.in_flight -= 1
+        return self.responses[len(self.sent) - self.in_flight - 1]
+
+
+def test_send_commands_in_order():
+    connection = PipelinedConnection([":A 1", ":A 2", ":A 3"])
+    tiger = TigerController(connection)
+
+    assert tiger.send_commands(["W X", "W Y", "W Z"]) == [":A 1", ":A 2", ":A 3"]
+
+
+def test_send_commands_window():
+    connection = PipelinedConnection([":A"] * 20)
+    tiger = TigerController(connection)
+
+    tiger.send_commands(["M X=1"] * 20, window=3)
+
+    assert connection.max_in_flight == 3
+
+
+def test_send_commands_byte_window():
+    connection = PipelinedConnection([":A"] * 20)
+    tiger = TigerController(connection)
+
+    tiger.send_commands(["M X=1"] * 20, max_bytes_in_flight=12)
+
+    assert connection.max_in_flight == 2
+
+
+def test_send_commands_error_maps_to_command():
+    connection = PipelinedConnection([":A", ":N-2", ":A", ":A"])
+    tiger = TigerController(connection)
+
+    with pytest.raises(Errors.UnrecognizedAxisParameterError, match="M Q=1"):
+        tiger.send_commands(["W X", "M Q=1", "W Y", "W Z"], window=2)
+
+    assert connection.sent == ["W X", "M Q=1", "W Y"]
+    assert connection.in_flight == 0
+
+
+def test_is_busy_axes(tiger):
+    tiger.connection.read_response.return_value = ":A N B"
+
+    assert tiger.is_busy(["X", "Y"])
+    tiger.connection.send_command.assert_called_with("RS X? Y?")
+
+
+def test_wait_until_idle_backoff(tiger, monkeypatch):
+    sleeps = []
+    busy = iter([True, True, True, True, False])
+
+    monkeypatch.setattr("asitiger.tigercontroller.time.sleep", sleeps.append)
+    monkeypatch.setattr(tiger, "is_busy", lambda axes=None: next(busy))
+
+    tiger.wait_until_idle(
+        poll_interval_s=0.01, expected_duration_s=1.0, max_poll_interval_s=0.02
+    )
+
+    assert sleeps == [0.9, 0.01, 0.015, 0.02, 0.02]
+
+
+def simulated_tiger_at(baud_rate, port_baud_rate=115200, simulated_tiger=None):
+    from asitiger.simulator import SimulatedConnection, SimulatedTiger
+
+    if simulated_tiger is None:
+        simulated_tiger = SimulatedTiger(baud_rate=baud_rate)
+
+    return TigerController(SimulatedConnection(simulated_tiger, port_baud_rate))
+
+
+def test_detect_baud_rate():
+    tiger = simulated_tiger_at(9600)
+
+    assert tiger.detect_baud_rate(probe_timeout_s=0.02) == 9600
+    assert tiger.connection.baud_rate == 9600
+    assert tiger.status() is Status.IDLE
+
+
+def test_detect_baud_rate_fails():
+    tiger = simulated_tiger_at(14400)
+
+    with pytest.raises(ConnectionError):
+        tiger.detect_baud_rate(baud_rates=[9600], probe_timeout_s=0.02)
+
+    assert tiger.connection.baud_rate == 115200
+
+
+def test_from_serial_port_disconnects_when_detection_fails(monkeypatch):
+    from asitiger.simulator import SimulatedConnection, SimulatedTiger
+
+    connections = []
+
+    def serial_connection(port, baud_rate):
+        connections.append(SimulatedConnection(SimulatedTiger(baud_rate=14400)))
+        return connections[-1]
+
+    monkeypatch.setattr("asitiger.tigercontroller.SerialConnection", serial_connection)
+
+    with pytest.raises(ConnectionError):
+        TigerController.from_serial_port("simulated", detect_baud_rate=True)
+
+    assert not connections[0].connection.is_open
+
+
+def test_upgrade_baud_rate():
+    tiger = simulated_tiger_at(115200)
+
+    assert tiger.upgrade_baud_rate(max_baud_rate=460800) == 460800
+    assert tiger.connection.tiger.baud_rate == 460800
+    assert tiger.connection.baud_rate == 460800
+    assert tiger.status() is Status.IDLE
+
+
+def test_upgrade_skips_rejected_rates():
+    from asitiger.simulator import SimulatedTiger
+
+    simulated_tiger = SimulatedTiger(
+        baud_rate=115200, supported_baud_rates=[9600, 115200, 230400, 460800]
+    )
+    tiger = simulated_tiger_at(115200, simulated_tiger=simulated_tiger)
+
+    assert tiger.upgrade_baud_rate(probe_timeout_s=0.02) == 460800
+    assert tiger.connection.baud_rate == simulated_tiger.baud_rate == 460800
+    assert tiger.status() is Status.IDLE
+
+
+def test_upgrade_recovers_when_a_rate_goes_unanswered():
+    from asitiger.simulator import SimulatedTiger
+
+    class IgnoringTiger(SimulatedTiger):
+        # Acknowledges fast rates, then carries on at its current rate
+        def _baud(self, verb, args, card_address, now):
+            if int(args[0][2]) > TigerController.BAUD_RATE_CODES[230400]:
+                return ":A"
+            return super()._baud(verb, args, card_address, now)
+
+    tiger = simulated_tiger_at(115200, simulated_tiger=IgnoringTiger(baud_rate=115200))
+
+    assert tiger.upgrade_baud_rate(probe_timeout_s=0.02) == 230400
+    assert tiger.connection.baud_rate == 230400
+    assert tiger.status() is Status.IDLE
+
+
+def test_set_baud_rate_leaves_link_usable():
+    tiger = simulated_tiger_at(115200)
+    tiger.connection.tiger.supported_baud_rates = {115200}
+
+    with pytest.raises(Errors.ParameterOutOfRangeError):
+        tiger.set_baud_rate(921600, probe_timeout_s=0.02)
+
+    assert tiger.status() is Status.IDLE
+
+
+def test_set_unsupported_baud_rate():
+    with pytest.raises(ValueError):
+        simulated_tiger_at(115200).set_baud_rate(14400)
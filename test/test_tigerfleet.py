@@ -0,0 +1,94 @@
+import time
+
+import pytest
+
+from asitiger.errors import Errors
+from asitiger.simulator import SimulatedConnection, SimulatedTiger
+from asitiger.status import Status
+from asitiger.tigercontroller import TigerController
+from asitiger.tigerfleet import FleetError, TigerFleet
+
+
+def simulated_fleet(names, processing_time_s=0.0) -> TigerFleet:
+    return TigerFleet(
+        {
+            name: TigerController(
+                SimulatedConnection(
+                    SimulatedTiger(processing_time_s=processing_time_s), baud_rate=None
+                ),
+                poll_interval_s=0.001,
+            )
+            for name in names
+        }
+    )
+
+
+@pytest.fixture(scope="function")
+def fleet():
+    with simulated_fleet(["left", "right"]) as fleet:
+        yield fleet
+
+
+def test_results_are_keyed_by_name(fleet):
+    assert fleet.status() == {"left": Status.IDLE, "right": Status.IDLE}
+    assert list(fleet.where(["X"])) == ["left", "right"]
+
+
+def test_where_with_axes_per_controller(fleet):
+    fleet.controllers["right"].move({"Z": 100})
+    fleet.wait_until_idle()
+
+    assert fleet.where({"left": ["X"], "right": ["Z"]}) == {
+        "left": {"X": 0.0},
+        "right": {"Z": 100.0},
+    }
+
+
+def test_wait_until_idle_waits_for_every_controller(fleet):
+    fleet.controllers["left"].speed({"X": 100})
+    fleet.controllers["right"].speed({"X": 1})
+    fleet.send_command("M X=1000")
+
+    assert fleet.is_busy()
+    fleet.wait_until_idle()
+    assert not fleet.is_busy()
+
+
+def test_failures_are_collected(fleet):
+    fleet.controllers["right"].connection.tiger.axes.pop("Z")
+
+    with pytest.raises(FleetError) as error_info:
+        fleet.where(["Z"])
+
+    assert list(error_info.value.errors) == ["right"]
+    assert isinstance(
+        error_info.value.errors["right"], Errors.UnrecognizedAxisParameterError
+    )
+    assert error_info.value.results == {"left": {"Z": 0.0}}
+
+
+def test_controllers_are_queried_in_parallel():
+    with simulated_fleet(["a", "b", "c", "d"], processing_time_s=0.05) as fleet:
+        start = time.monotonic()
+        fleet.status()
+
+        assert time.monotonic() - start < 0.15
+
+
+def test_from_serial_ports_disconnects_on_failure(monkeypatch):
+    opened = []
+
+    def from_serial_port(port, baud_rate, **tiger_kwargs):
+        if port == "missing":
+            raise OSError(f"No such port {port}")
+
+        opened.append(TigerController(SimulatedConnection(baud_rate=None)))
+        return opened[-1]
+
+    monkeypatch.setattr(TigerController, "from_serial_port", from_serial_port)
+
+    with pytest.raises(OSError):
+        TigerFleet.from_serial_ports({"left": "first", "right": "missing"})
+
+    assert len(opened) == 1
+    assert not opened[0].connection.connection.is_open
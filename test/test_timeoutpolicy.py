@@ -0,0 +1,117 @@
+import pytest
+
+from asitiger.errors import Errors
+from asitiger.simulator import SimulatedConnection, SimulatedTiger
+from asitiger.threadedtigercontroller import ThreadedTigerController
+from asitiger.tigercontroller import TigerController
+from asitiger.timeoutpolicy import TimeoutPolicy
+
+
+@pytest.fixture(scope="function")
+def tiger():
+    tiger = TigerController(SimulatedConnection(baud_rate=None, read_timeout_s=1.0))
+    tiger.enable_timeouts(TimeoutPolicy(default_s=0.05))
+    return tiger
+
+
+def delay_reply(tiger, command: str, delay_s: float = 0.15):
+    # The first reply to ``command``, and any replies queued behind it, arrive late
+    simulated_tiger = tiger.connection.tiger
+    handle = simulated_tiger.handle
+    delays = [delay_s]
+
+    def delayed_handle(received: str, now: float = None) -> str:
+        delayed = received == command and delays
+        simulated_tiger.processing_time_s = delays.pop() if delayed else 0.0
+        return handle(received, now=now)
+
+    simulated_tiger.handle = delayed_handle
+
+
+@pytest.mark.parametrize(
+    "command, timeout_s",
+    [("/", 0.1), ("2RS Z?", 0.1), (b"W X Y", 0.1), ("! X", 30.0), ("BU X", 1.0)],
+)
+def test_timeout_for(command, timeout_s):
+    assert TimeoutPolicy().timeout_for(command) == timeout_s
+
+
+def test_disabled_by_default():
+    tiger = TigerController(SimulatedConnection(baud_rate=None))
+
+    assert tiger.connection.timeout_policy is None
+
+
+def test_read_timeout_is_restored_between_commands(tiger):
+    tiger.where(["X"])
+
+    assert tiger.connection.read_timeout_s == 1.0
+    assert tiger.connection.connection.timeout == 0.1
+
+
+def test_timeout_raises_after_resync(tiger):
+    delay_reply(tiger, "2LED X=20")
+
+    tiger.send_command("2LED X=50")
+    with pytest.raises(Errors.ReplyTimeoutError):
+        tiger.send_command("2LED X=20")
+
+    # The late reply to the timed out command isn't mistaken for this one's
+    assert tiger.where(["X"]) == {"X": 0.0}
+    assert tiger.status().value == "N"
+
+
+def test_pipelined_replies_are_discarded(tiger):
+    delay_reply(tiger, "W X")
+    for axis in "XYZ":
+        tiger.connection.send_command(f"W {axis}")
+
+    with pytest.raises(Errors.ReplyTimeoutError):
+        tiger.connection.read_response()
+    for _ in range(2):
+        with pytest.raises(Errors.ReplyDiscardedError):
+            tiger.connection.read_response()
+
+    assert tiger.where(["Y"]) == {"Y": 0.0}
+
+
+def test_threaded_timeout():
+    with ThreadedTigerController(SimulatedConnection(baud_rate=None)) as tiger:
+        tiger.enable_timeouts()
+        delay_reply(tiger, "W X")
+
+        with pytest.raises(Errors.ReplyTimeoutError):
+            tiger.send_command("W X")
+
+        assert tiger.send_command("W Y") == ":A 0.0"
+
+
+def test_resync_fails_without_replies(tiger):
+    tiger.connection.tiger.baud_rate = 9600
+
+    with pytest.raises(Errors.ResyncError):
+        tiger.resync(timeout_s=0.01, attempts=2)
+
+
+def test_late_status_reply_isnt_taken_for_the_sentinel():
+    # At 9600 baud the sentinels' replies arrive well after the late reply
+    tiger = TigerController(SimulatedConnection(baud_rate=9600, read_timeout_s=1.0))
+    tiger.enable_timeouts()
+    delay_reply(tiger, "/")
+
+    with pytest.raises(Errors.ReplyTimeoutError):
+        tiger.status()
+
+    assert tiger.where(["X"]) == {"X": 0.0}
+    assert tiger.send_command("2LED X?") == ":A X=0"
+
+
+def test_probe_uses_its_own_timeout():
+    simulated_tiger = SimulatedTiger(baud_rate=9600)
+    tiger = TigerController(SimulatedConnection(simulated_tiger, baud_rate=115200))
+    policy = tiger.enable_timeouts()
+
+    # Probing at 115200 goes unanswered, which isn't a ReplyTimeoutError
+    assert tiger.detect_baud_rate(baud_rates=[9600], probe_timeout_s=0.02) == 9600
+    assert tiger.connection.timeout_policy is policy
+    assert tiger.status().value == "N"
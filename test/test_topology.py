@@ -0,0 +1,47 @@
+import pytest
+
+from asitiger.axis import Axis
+from asitiger.topology import Topology
+
+
+@pytest.fixture()
+def topology():
+    return Topology.from_build(
+        [
+            "TIGER_COMM",
+            "Motor Axes: X Y Z S L",
+            "Axis Types: x x z f i",
+            "Axis Addr: 1 1 2 2 7",
+            "Hex Addr: 31 31 32 32 37",
+        ]
+    )
+
+
+def test_labels(topology):
+    assert topology.labels == ["X", "Y", "Z", "S", "L"]
+
+
+def test_card_address(topology):
+    assert topology.card_address(["L"]) == "7"
+    assert topology.card_address(["X", "Y"]) == "1"
+
+
+def test_card_address_spanning_cards(topology):
+    with pytest.raises(ValueError):
+        topology.card_address(["X", "Z"])
+
+
+def test_unknown_axis(topology):
+    with pytest.raises(ValueError):
+        topology.axis("Q")
+
+
+def test_axes_on_card(topology):
+    assert [axis.label for axis in topology.axes_on_card(2)] == ["Z", "S"]
+
+
+def test_axes_of_type(topology):
+    assert [axis.label for axis in topology.axes_of_type(Axis.Type.XY_MOTOR)] == [
+        "X",
+        "Y",
+    ]
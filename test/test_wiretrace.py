@@ -0,0 +1,91 @@
+import logging
+
+import pytest
+
+from asitiger.errors import Errors
+from asitiger.simulator import SimulatedConnection
+from asitiger.threadedtigercontroller import ThreadedTigerController
+from asitiger.tigercontroller import TigerController
+from asitiger.wiretrace import WireTrace
+
+
+@pytest.fixture(scope="function")
+def tiger():
+    return TigerController(SimulatedConnection(baud_rate=None), poll_interval_s=0.001)
+
+
+def test_disabled_by_default(tiger):
+    tiger.where(["X"])
+
+    assert tiger.connection.trace is None
+
+
+def test_keeps_most_recent_frames():
+    trace = WireTrace(capacity=3)
+    for index in range(5):
+        trace.record(WireTrace.SENT, f"W {index}\r".encode())
+
+    assert [frame.data for frame in trace.frames()] == [b"W 2\r", b"W 3\r", b"W 4\r"]
+
+    trace.clear()
+    assert trace.frames() == []
+
+
+def test_truncates_long_frames():
+    trace = WireTrace(capacity=2, max_frame_bytes=4)
+    trace.record(WireTrace.RECEIVED, b":A 1234567\r\n")
+
+    frame = trace.frames()[0]
+    assert frame.data == b":A 1"
+    assert frame.length == 12
+    assert "..." in trace.format()
+
+
+def test_records_both_directions(tiger):
+    trace = tiger.connection.enable_trace(capacity=8)
+    tiger.where(["X"])
+
+    frames = trace.frames()
+    assert [frame.direction for frame in frames] == [WireTrace.SENT, WireTrace.RECEIVED]
+    assert frames[0].data == b"W X\r"
+    assert frames[1].data.startswith(b":A")
+
+    tiger.connection.disable_trace()
+    assert tiger.connection.trace is None
+
+
+def test_dumped_on_error(tiger, caplog):
+    tiger.connection.enable_trace()
+    tiger.where(["X"])
+
+    with caplog.at_level(logging.ERROR, logger="asitiger.wiretrace"):
+        with pytest.raises(Errors.UnrecognizedAxisParameterError) as error_info:
+            tiger.send_command("W Q")
+
+    assert "W Q" in caplog.text
+    assert "W X" in caplog.text
+    assert error_info.value.wire_trace[-2].data == b"W Q\r"
+
+
+def test_dumped_on_threaded_error(caplog):
+    with ThreadedTigerController(SimulatedConnection(baud_rate=None)) as tiger:
+        tiger.connection.enable_trace()
+
+        with caplog.at_level(logging.ERROR, logger="asitiger.wiretrace"):
+            with pytest.raises(Errors.UnrecognizedAxisParameterError):
+                tiger.send_command("W Q")
+
+    assert "W Q" in caplog.text
+
+
+def test_dumped_on_timeout(caplog):
+    connection = SimulatedConnection(baud_rate=None, read_timeout_s=0.01)
+    connection.enable_trace()
+    connection.send_command("W X")
+    connection.read_response()
+
+    with caplog.at_level(logging.WARNING, logger="asitiger.wiretrace"):
+        connection.read_response()
+
+    assert "Timed out" in caplog.text
+    assert "W X" in caplog.text